@@ -0,0 +1,104 @@
+import os
+import json
+import logging
+from parquet_schema import file_fingerprint, read_parquet_footer
+from load_scheduler import copy_statement
+
+
+# Error of versions that allow only one COPY per table (e.g. 0.2.x), where chunk 1 can never load
+SINGLE_COPY_ERROR = "COPY commands can only be executed once"
+
+def chunk_signature(chunk_paths):
+    """Identify a set of chunk files so a state file is only resumed against the same dataset."""
+    return [list(file_fingerprint(path)) for path in chunk_paths]
+
+
+def load_state(state_path, database_dir, chunk_paths, count_rows, table_rows, rel_table_name):
+    """Return the saved load progress if it belongs to this database and these chunks, else a fresh state.
+
+    The database directory may have been wiped and recreated empty since the state was saved, so the state is
+    only resumed if count_rows(table) (None for a missing table) shows every completed table with its
+    table_rows and the rel table with the rows of its completed chunks.
+    """
+    fresh_state = {'database_dir': os.path.abspath(database_dir), 'chunks': chunk_signature(chunk_paths),
+                   'completed_tables': [], 'completed_chunks': []}
+    try:
+        with open(state_path, 'r') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return fresh_state
+
+    if state.get('database_dir') != fresh_state['database_dir'] or state.get('chunks') != fresh_state['chunks']:
+        logging.info(f"Load state {state_path} belongs to a different database or dataset, starting from scratch.")
+        return fresh_state
+
+    expected_rows = {table_name: table_rows[table_name] for table_name in state['completed_tables']}
+    if state['completed_chunks']:
+        expected_rows[rel_table_name] = sum(chunk['Rows'] for chunk in state['completed_chunks'])
+    mismatched = [table_name for table_name, rows in expected_rows.items() if count_rows(table_name) != rows]
+    if mismatched:
+        logging.warning(f"Load state {state_path} does not match the rows in the database ({', '.join(mismatched)}), starting from scratch.")
+        return fresh_state
+    return state
+
+
+def save_state(state_path, state):
+    """Persist load progress atomically so a killed run never leaves a half-written state file."""
+    temp_path = f"{state_path}.tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(state, f, indent=4)
+    os.replace(temp_path, state_path)
+
+
+def is_resuming(state):
+    """True if a previous run already committed part of the load."""
+    return bool(state['completed_tables'] or state['completed_chunks'])
+
+
+def mark_table_completed(state_path, state, table_name):
+    """Record a fully loaded table in the state file."""
+    if table_name not in state['completed_tables']:
+        state['completed_tables'].append(table_name)
+        save_state(state_path, state)
+
+
+def load_rel_chunks(conn, table_name, chunk_paths, state_path, state, import_table_data):
+    """COPY a rel table from its chunk files in order, checkpointing after each committed chunk.
+
+    Chunks already recorded in the state are skipped. Loading stops at the first failed chunk so
+    the next run resumes from it, unless the version allows only one COPY per table: then no run could
+    load that chunk, so the state file is removed instead. Returns the per-chunk timings (including resumed ones).
+    """
+    completed = {entry['File'] for entry in state['completed_chunks']}
+    for index, path in enumerate(chunk_paths):
+        file_name = os.path.basename(path)
+        if file_name in completed:
+            logging.info(f"Skipping chunk {index} ({file_name}) of {table_name}, already loaded.")
+            continue
+
+        num_rows = read_parquet_footer(path)['num_rows']
+        try:
+            duration = import_table_data(conn, copy_statement(table_name, path), f"{table_name} chunk {index}", raise_errors=True)
+        except Exception as e:
+            if SINGLE_COPY_ERROR in str(e):
+                logging.error(f"This KuzuDB version allows only one COPY per table, so {table_name} cannot be loaded in chunks "
+                              f"(set CHUNKED_REL_LOAD=false). Removed {state_path}, the next run starts from scratch.")
+                if os.path.exists(state_path):
+                    os.remove(state_path)
+            else:
+                logging.error(f"Chunked load of {table_name} stopped at chunk {index} ({file_name}); the next run resumes here.")
+            break
+
+        state['completed_chunks'].append({
+            "Chunk": index,
+            "File": file_name,
+            "Rows": num_rows,
+            "Load Time (Seconds)": duration,
+            "Rows/sec": num_rows / duration if duration > 0 else None,
+        })
+        save_state(state_path, state)
+        logging.info(f"Chunk {index} of {table_name}: {num_rows:,} rows at {num_rows / max(duration, 1e-9):,.0f} rows/sec.")
+    else:
+        mark_table_completed(state_path, state, table_name)
+
+    return state['completed_chunks']
@@ -0,0 +1,76 @@
+import os
+import shutil
+import logging
+from dotenv import load_dotenv
+from scaling_curve import TABLES, generate_and_load
+from test_create_test_data import (NUM_COMPANIES, NUM_DYNAMIC_COMPANY_COLUMNS, NUM_DYNAMIC_PERSON_COLUMNS, NUM_DYNAMIC_RELATIONSHIP_COLUMNS,
+                                   NUM_PERSONS, NUM_RELATIONSHIPS, SCHEMA_SPEC, TEST_DATA_PATH)
+from test_ingress_load_kuzudb import DATABASE_NAME, dataset_paths, list_parquet_parts, update_dashboard_data
+
+
+
+load_dotenv()
+
+WIDE_TABLE_SWEEP = os.getenv('WIDE_TABLE_SWEEP', 'false').lower() == 'true'
+WIDE_SWEEP_COLUMNS = [int(columns) for columns in os.getenv('WIDE_SWEEP_COLUMNS', '5,50,200,500').split(',') if columns.strip()]
+
+# Configured rows and property columns of each table, plus the key columns written besides the properties
+TABLE_SHAPES = {
+    "Company": ('num_companies', NUM_COMPANIES, 'num_dynamic_company_columns', NUM_DYNAMIC_COMPANY_COLUMNS, 1),
+    "Person": ('num_persons', NUM_PERSONS, 'num_dynamic_person_columns', NUM_DYNAMIC_PERSON_COLUMNS, 1),
+    "WorksAt": ('num_relationships', NUM_RELATIONSHIPS, 'num_dynamic_relationship_columns', NUM_DYNAMIC_RELATIONSHIP_COLUMNS, 2),
+}
+
+
+def width_counts(num_columns):
+    """Row and property column counts of every table at a width, keeping the cells (and so the bytes) of the configured dataset.
+
+    Every property column is drawn from the same vocabulary, so a cell costs about the same at any width and
+    rows * (properties + key columns) stays constant.
+    """
+    counts = {}
+    for rows_name, rows, columns_name, columns, key_columns in TABLE_SHAPES.values():
+        counts[rows_name] = max(1, round(rows * (columns + key_columns) / (num_columns + key_columns)))
+        counts[columns_name] = num_columns
+    return counts
+
+
+def parquet_bytes(paths):
+    return {table_name: sum(os.path.getsize(path) for path in list_parquet_parts(paths[table_name])) for table_name in TABLES}
+
+
+def run_width(num_columns, sweep_dir):
+    result = {"Columns": num_columns,
+              **generate_and_load(width_counts(num_columns), os.path.join(sweep_dir, str(num_columns)), f"Wide table sweep: {num_columns} columns")}
+    if "Dataset" in result:
+        table_bytes = parquet_bytes(dataset_paths(result["Dataset"]))
+        result.update({"Parquet Size (MB)": sum(table_bytes.values()) / 1024 ** 2,
+                       "Table Parquet Sizes (MB)": {table_name: size / 1024 ** 2 for table_name, size in table_bytes.items()}})
+    if "Load Time (Seconds)" in result:
+        load_seconds = result["Load Time (Seconds)"]
+        result["MB/sec"] = result["Parquet Size (MB)"] / load_seconds if load_seconds > 0 else None
+        logging.info(f"Wide table sweep: {num_columns} columns ({result['Parquet Size (MB)']:,.1f} MB of Parquet) loaded in "
+                     f"{load_seconds:.2f} seconds, peak RSS {result['Peak RSS (MB)']:,.0f} MB, database {result['Database Size (MB)']:,.1f} MB.")
+    return result
+
+
+def run_column_sweep(sweep_dir):
+    widths = [run_width(num_columns, sweep_dir) for num_columns in sorted(set(WIDE_SWEEP_COLUMNS))]
+    shutil.rmtree(sweep_dir, ignore_errors=True)
+    return widths
+
+
+def main():
+    if not WIDE_TABLE_SWEEP:
+        logging.info("Wide table sweep disabled, skipping.")
+        return
+
+    if SCHEMA_SPEC:
+        logging.warning(f"Wide table sweep: {', '.join(SCHEMA_SPEC)} keep their SCHEMA_SPEC columns at every width.")
+    logging.info(f"Running wide table sweep over {sorted(set(WIDE_SWEEP_COLUMNS))} property columns per table.")
+    results = run_column_sweep(os.path.join(TEST_DATA_PATH, f'{DATABASE_NAME}_columns'))
+    update_dashboard_data({"column_sweep": results})
+    logging.info("Wide table sweep results saved to dashboard data.")
+
+if __name__ == "__main__":
+    main()
@@ -15,21 +15,121 @@ class ComparisonWidget:
 
     def aggregate_data(self):
         aggregated_data = {}
-        json_files = glob.glob(f'{self.data_directory}/*.json')
+        json_files = glob.glob(f'{self.data_directory}/dashboard_data_*.json')
         for json_file in json_files:
             with open(json_file, 'r') as file:
                 data = json.load(file)
             version = data.get('kuzu', 'unknown')
             if version not in aggregated_data:
-                aggregated_data[version] = {'load_times': [], 'database_summary': []}
+                aggregated_data[version] = {'load_times': [], 'database_summary': [], 'query_benchmark': [], 'scaling_curve': [], 'parquet_layouts': [], 'column_sweep': [], 'topology_benchmark': []}
             aggregated_data[version]['load_times'].extend(data.get('load_times', []))
             aggregated_data[version]['database_summary'].extend(data.get('database_summary', []))
+            aggregated_data[version]['query_benchmark'].extend(data.get('query_benchmark', []))
+            aggregated_data[version]['scaling_curve'].extend(data.get('scaling_curve', {}).get('Sizes', []))
+            aggregated_data[version]['parquet_layouts'].extend(data.get('parquet_layouts', []))
+            aggregated_data[version]['column_sweep'].extend(data.get('column_sweep', []))
+            aggregated_data[version]['topology_benchmark'].extend(data.get('topology_benchmark', []))
         return aggregated_data
 
     def generate_widget(self):
         labels, datasets = self.prepare_all_comparison_data()
         return self.generate_chart_js("comparisonChart", "bar", labels, datasets)
 
+    def generate_query_widget(self):
+        labels, datasets = self.prepare_query_comparison_data()
+        if not datasets:
+            return ""
+        return self.generate_chart_js("queryComparisonChart", "bar", labels, datasets)
+
+    def generate_scaling_widget(self):
+        datasets = self.prepare_scaling_comparison_data()
+        if not datasets:
+            return ""
+        return self.generate_chart_js("scalingComparisonChart", "scatter", [], datasets, log_scale=True)
+
+    def prepare_scaling_comparison_data(self):
+        # Total load time against total rows, one log-log curve per version
+        datasets = [{
+            'label': f'{version} load time (s)',
+            'data': [{'x': item["Rows"], 'y': item["Load Time (Seconds)"]}
+                     for item in sorted(self.aggregated_data[version]['scaling_curve'], key=lambda item: item["Relationships"])
+                     if item["Status"] == "pass"],
+            'backgroundColor': generate_color(version + "_bg"),
+            'borderColor': generate_color(version + "_border"),
+            'showLine': True
+        } for version in sorted(self.aggregated_data.keys())]
+        return [dataset for dataset in datasets if dataset['data']]
+
+    def generate_layout_widget(self):
+        labels, datasets = self.prepare_layout_comparison_data()
+        if not datasets:
+            return ""
+        return self.generate_chart_js("layoutComparisonChart", "bar", labels, datasets)
+
+    def prepare_layout_comparison_data(self):
+        # Total COPY time of every Parquet layout variant, one dataset per version; variants a version cannot read stay empty
+        versions = sorted(self.aggregated_data.keys())
+        labels = list(dict.fromkeys(item["Variant"] for version in versions for item in self.aggregated_data[version]['parquet_layouts']))
+        datasets = [{
+            'label': f'{version} load time (s)',
+            'data': [next((item["Load Time (Seconds)"] for item in self.aggregated_data[version]['parquet_layouts']
+                           if item["Variant"] == variant and item["Status"] == "pass"), None) for variant in labels],
+            'backgroundColor': generate_color(version + "_bg"),
+            'borderColor': generate_color(version + "_border")
+        } for version in versions if self.aggregated_data[version]['parquet_layouts']]
+        return labels, datasets
+
+    def generate_width_widget(self):
+        datasets = self.prepare_width_comparison_data()
+        if not datasets:
+            return ""
+        return self.generate_chart_js("widthComparisonChart", "scatter", [], datasets)
+
+    def prepare_width_comparison_data(self):
+        # Total load time against the property column count at a fixed data volume, one curve per version
+        datasets = [{
+            'label': f'{version} load time (s) by columns',
+            'data': [{'x': item["Columns"], 'y': item["Load Time (Seconds)"]}
+                     for item in sorted(self.aggregated_data[version]['column_sweep'], key=lambda item: item["Columns"])
+                     if item["Status"] == "pass"],
+            'backgroundColor': generate_color(version + "_bg"),
+            'borderColor': generate_color(version + "_border"),
+            'showLine': True
+        } for version in sorted(self.aggregated_data.keys())]
+        return [dataset for dataset in datasets if dataset['data']]
+
+    def generate_topology_widget(self):
+        datasets = self.prepare_topology_comparison_data()
+        if not datasets:
+            return ""
+        return self.generate_chart_js("topologyComparisonChart", "scatter", [], datasets)
+
+    def prepare_topology_comparison_data(self):
+        # Total load time against the number of tables (node labels + rel types), one curve per version
+        datasets = [{
+            'label': f'{version} load time (s) by tables',
+            'data': [{'x': item["Tables"], 'y': item["Load Time (Seconds)"]}
+                     for item in sorted(self.aggregated_data[version]['topology_benchmark'], key=lambda item: item["Tables"])
+                     if item["Status"] == "pass"],
+            'backgroundColor': generate_color(version + "_bg"),
+            'borderColor': generate_color(version + "_border"),
+            'showLine': True
+        } for version in sorted(self.aggregated_data.keys())]
+        return [dataset for dataset in datasets if dataset['data']]
+
+    def prepare_query_comparison_data(self):
+        # p95 latency (ms) of every benchmarked query, one dataset per query
+        labels = sorted(self.aggregated_data.keys())
+        queries = sorted({item["Query"] for version in labels for item in self.aggregated_data[version]['query_benchmark']})
+        datasets = [{
+            'label': f'{query} p95 (ms)',
+            'data': [next((item["p95 (ms)"] for item in self.aggregated_data[version]['query_benchmark']
+                           if item["Query"] == query and item["Status"] == "pass"), None) for version in labels],
+            'backgroundColor': generate_color(query + "_bg"),
+            'borderColor': generate_color(query + "_border")
+        } for query in queries]
+        return labels, datasets
+
     def prepare_all_comparison_data(self):
         labels = sorted(self.aggregated_data.keys())
         categories = ['Person', 'Company', 'WorksAt']
@@ -42,14 +142,16 @@ class ComparisonWidget:
         return labels, datasets
 
     @staticmethod
-    def generate_chart_js(chart_id, chart_type, labels, datasets):
+    def generate_chart_js(chart_id, chart_type, labels, datasets, log_scale=False):
         datasets_js = [{
             'label': dataset['label'],
             'data': dataset['data'],
             'backgroundColor': dataset['backgroundColor'],
             'borderColor': dataset['borderColor'],
-            'borderWidth': 1
+            'borderWidth': 1,
+            'showLine': dataset.get('showLine', False)
         } for dataset in datasets]
+        scales = "scales: { x: { type: 'logarithmic' }, y: { type: 'logarithmic' } }, " if log_scale else ""
 
         chart_js = f"""
         <div style="width:60%; height:400px; resize: both; overflow: auto;">
@@ -64,7 +166,7 @@ class ComparisonWidget:
                     labels: {json.dumps(labels)},
                     datasets: {json.dumps(datasets_js)}
                 }},
-                options: {{ responsive: true, maintainAspectRatio: false }}
+                options: {{ {scales}responsive: true, maintainAspectRatio: false }}
             }});
         </script>
         """
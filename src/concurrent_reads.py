@@ -0,0 +1,178 @@
+import os
+import time
+import queue
+import logging
+import threading
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import kuzu
+from dotenv import load_dotenv
+from query_benchmark import QUERIES, QUERY_WORKLOAD, execute_query, latency_percentiles, workload_parameters
+from test_create_test_data import DATASET_DIR
+from test_ingress_load_kuzudb import DATABASE_NAME, LOAD_MODE, dataset_paths, update_dashboard_data
+
+
+
+load_dotenv()
+
+CONCURRENCY_BENCHMARK = os.getenv('CONCURRENCY_BENCHMARK', 'false').lower() == 'true'
+# 'threads' share one database through a connection pool, 'processes' each open the database read-only
+CONCURRENCY_MODES = [mode.strip() for mode in os.getenv('CONCURRENCY_MODES', 'threads').split(',')]
+CONCURRENCY_LEVELS = [int(level) for level in os.getenv('CONCURRENCY_LEVELS', '1,2,4,8').split(',')]
+CONCURRENCY_DURATION_SECONDS = float(os.getenv('CONCURRENCY_DURATION_SECONDS', 10))
+# Connections shared by the reader threads, 0 for one per thread
+CONCURRENCY_POOL_SIZE = int(os.getenv('CONCURRENCY_POOL_SIZE', 0))
+CONCURRENCY_WORKLOAD = [name.strip() for name in os.getenv('CONCURRENCY_WORKLOAD', ','.join(QUERY_WORKLOAD)).split(',') if name.strip()]
+CONCURRENCY_SEED = int(os.getenv('GENERATION_SEED', 42))
+
+
+class ConnectionPool:
+    """A fixed set of connections on one database, handed out to one reader at a time."""
+
+    def __init__(self, db, size):
+        self._connections = queue.Queue()
+        for _ in range(size):
+            self._connections.put(kuzu.Connection(db))
+
+    @contextmanager
+    def connection(self):
+        conn = self._connections.get()
+        try:
+            yield conn
+        finally:
+            self._connections.put(conn)
+
+
+def run_reader(acquire, workload, duration, seed):
+    """Issue random workload queries until `duration` has passed.
+
+    Returns {'latencies': {query: [seconds]}, 'errors': count, 'elapsed': seconds}.
+    """
+    rng = np.random.default_rng(seed)
+    names = list(workload)
+    latencies = {name: [] for name in names}
+    errors = 0
+    start_time = time.perf_counter()
+    while time.perf_counter() - start_time < duration:
+        name = names[rng.integers(len(names))]
+        parameter_values = workload[name]
+        parameters = {"value": parameter_values[rng.integers(len(parameter_values))]} if parameter_values else {}
+        query_start_time = time.perf_counter()
+        try:
+            with acquire() as conn:
+                execute_query(conn, QUERIES[name]["query"], parameters)
+        except Exception as e:
+            errors += 1
+            logging.debug(f"Concurrent read of {name} failed: {e}")
+            continue
+        latencies[name].append(time.perf_counter() - query_start_time)
+    return {'latencies': latencies, 'errors': errors, 'elapsed': time.perf_counter() - start_time}
+
+
+def reader_process(database_dir, workload, duration, seed):
+    """Process-pool task: open the database read-only and run one reader on its own connection."""
+    db = kuzu.Database(database_dir, read_only=True)
+    conn = kuzu.Connection(db)
+    return run_reader(lambda: nullcontext(conn), workload, duration, seed)
+
+
+def run_threads(database_dir, workload, concurrency, duration):
+    db = kuzu.Database(database_dir)
+    pool = ConnectionPool(db, CONCURRENCY_POOL_SIZE or concurrency)
+    results = [None] * concurrency
+
+    def worker(index):
+        try:
+            results[index] = run_reader(pool.connection, workload, duration, [CONCURRENCY_SEED, index])
+        except Exception as e:
+            logging.error(f"Concurrent reader thread {index} failed: {e}")
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def run_processes(database_dir, workload, concurrency, duration):
+    with ProcessPoolExecutor(max_workers=concurrency) as executor:
+        futures = [executor.submit(reader_process, database_dir, workload, duration, [CONCURRENCY_SEED, index])
+                   for index in range(concurrency)]
+        results = []
+        for index, future in enumerate(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logging.error(f"Concurrent reader process {index} failed: {e}")
+                results.append(None)
+        return results
+
+
+def summarize(mode, concurrency, reader_results):
+    """Aggregate QPS (summed over readers) and latency percentiles over all queries of one run.
+
+    Readers that failed outright have a None result; they are counted as Failed Readers and left out of the rest.
+    """
+    failed_readers = sum(result is None for result in reader_results)
+    reader_results = [result for result in reader_results if result is not None]
+    all_latencies = [latency for result in reader_results for latencies in result['latencies'].values() for latency in latencies]
+    summary = {
+        "Mode": mode,
+        "Concurrency": concurrency,
+        "Queries": len(all_latencies),
+        "Errors": sum(result['errors'] for result in reader_results),
+        "Failed Readers": failed_readers,
+        "QPS": sum(sum(len(latencies) for latencies in result['latencies'].values()) / result['elapsed']
+                   for result in reader_results if result['elapsed'] > 0),
+        "Per Query": {name: len([latency for result in reader_results for latency in result['latencies'][name]])
+                      for name in reader_results[0]['latencies']} if reader_results else {},
+    }
+    if all_latencies:
+        summary.update(latency_percentiles(all_latencies))
+    logging.info(f"Concurrent reads ({mode}, {concurrency}): {summary['QPS']:,.0f} QPS, "
+                 f"p99 {summary.get('p99 (ms)', 0):.2f} ms, {summary['Errors']} errors, {failed_readers} failed readers.")
+    return summary
+
+
+def run_concurrency_benchmark(database_dir, paths):
+    workload = workload_parameters(paths, CONCURRENCY_WORKLOAD)
+    if not workload:
+        # run_reader draws from the workload, so there would be nothing to issue
+        logging.warning(f"Concurrent read workload is empty (CONCURRENCY_WORKLOAD={','.join(CONCURRENCY_WORKLOAD)}), skipping.")
+        return []
+    runners = {'threads': run_threads, 'processes': run_processes}
+    results = []
+    for mode in CONCURRENCY_MODES:
+        if mode not in runners:
+            logging.error(f"Unknown concurrency mode {mode}, expected threads or processes.")
+            continue
+        for concurrency in CONCURRENCY_LEVELS:
+            try:
+                reader_results = runners[mode](database_dir, workload, concurrency, CONCURRENCY_DURATION_SECONDS)
+            except Exception as e:
+                logging.error(f"Concurrent reads ({mode}, {concurrency}) failed: {e}")
+                results.append({"Mode": mode, "Concurrency": concurrency, "Queries": 0, "Errors": None, "QPS": None, "Error": str(e)})
+                continue
+            results.append(summarize(mode, concurrency, reader_results))
+    return results
+
+
+def main(data_dir=None):
+    if not CONCURRENCY_BENCHMARK or LOAD_MODE != 'standard':
+        logging.info("Concurrent read benchmark disabled, skipping.")
+        return
+
+    database_dir = os.path.join(os.getenv('TEST_DATA_PATH'), DATABASE_NAME)
+    paths = dataset_paths(data_dir or DATASET_DIR)
+    logging.info(f"Running concurrent read benchmark: {CONCURRENCY_MODES} at concurrency {CONCURRENCY_LEVELS}, "
+                 f"{CONCURRENCY_DURATION_SECONDS} seconds each.")
+    results = run_concurrency_benchmark(database_dir, paths)
+    if not results:
+        return
+    update_dashboard_data({"concurrent_reads": results})
+    logging.info("Concurrent read results saved to dashboard data.")
+
+if __name__ == "__main__":
+    main()
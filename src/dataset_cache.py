@@ -0,0 +1,104 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import logging
+
+
+MANIFEST_NAME = 'manifest.json'
+DATASETS_DIR_NAME = 'datasets'
+
+# Bump when the generator changes in a way that alters the output for an unchanged config
+CACHE_FORMAT_VERSION = 4
+
+
+def cache_key(config):
+    """Return a stable hash of a generation config."""
+    payload = json.dumps({'format_version': CACHE_FORMAT_VERSION, **config}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def dataset_dir(base_path, config):
+    """Return the directory holding the dataset generated from a config."""
+    return os.path.join(base_path, DATASETS_DIR_NAME, cache_key(config))
+
+
+def read_manifest(directory):
+    """Read a dataset manifest, returning None if it is missing or unreadable."""
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_manifest(directory, config):
+    """Write a manifest recording the config and the size of every Parquet file in the dataset, including subdirectories."""
+    files = {}
+    for root, dirs, names in os.walk(directory):
+        dirs.sort()
+        for name in sorted(names):
+            if name.endswith('.parquet'):
+                path = os.path.join(root, name)
+                files[os.path.relpath(path, directory)] = os.path.getsize(path)
+    now = time.time()
+    manifest = {
+        'cache_key': cache_key(config),
+        'config': config,
+        'files': files,
+        'total_bytes': sum(files.values()),
+        'created_at': now,
+        'last_used_at': now,
+    }
+    with open(os.path.join(directory, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=4)
+    return manifest
+
+
+def is_valid_dataset(directory, config):
+    """Check that a cached dataset exists for the config and that none of its files are missing or truncated."""
+    manifest = read_manifest(directory)
+    if manifest is None or manifest.get('cache_key') != cache_key(config) or not manifest.get('files'):
+        return False
+    for name, size in manifest['files'].items():
+        path = os.path.join(directory, name)
+        if not os.path.isfile(path) or os.path.getsize(path) != size:
+            logging.warning(f"Cached dataset {directory} is invalid: {name} is missing or changed.")
+            return False
+    return True
+
+
+def touch_dataset(directory):
+    """Record a cache hit so the dataset counts as recently used for eviction."""
+    manifest = read_manifest(directory)
+    manifest['last_used_at'] = time.time()
+    with open(os.path.join(directory, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=4)
+
+
+def evict_datasets(base_path, max_bytes, keep=None):
+    """Delete least recently used datasets until the cache fits in max_bytes, never deleting `keep`."""
+    root = os.path.join(base_path, DATASETS_DIR_NAME)
+    if not os.path.isdir(root):
+        return []
+
+    datasets = []
+    for name in os.listdir(root):
+        directory = os.path.join(root, name)
+        manifest = read_manifest(directory)
+        if manifest is not None:
+            datasets.append((manifest.get('last_used_at', 0), manifest.get('total_bytes', 0), directory))
+
+    total_bytes = sum(size for _, size, _ in datasets)
+    evicted = []
+    for _, size, directory in sorted(datasets):
+        if total_bytes <= max_bytes:
+            break
+        if keep and os.path.abspath(directory) == os.path.abspath(keep):
+            continue
+        shutil.rmtree(directory, ignore_errors=True)
+        total_bytes -= size
+        evicted.append(directory)
+        logging.info(f"Evicted cached dataset {directory} ({size / 1e9:.2f} GB).")
+    return evicted
@@ -0,0 +1,76 @@
+import os
+import re
+import json
+import time
+import logging
+import pyarrow.parquet as pq
+
+
+def error_matches(error, pattern):
+    """Whether an error message reproduces the failure: any error without a pattern, else a case-insensitive regex search."""
+    if error is None:
+        return False
+    return not pattern or re.search(pattern, error, re.IGNORECASE) is not None
+
+
+def write_subset(source_paths, target_path, num_rows, columns, batch_size=1000000):
+    """Write the first num_rows rows of a set of Parquet part files, restricted to columns, to one file.
+
+    The parts are streamed batch by batch, so a subset of a large dataset never has to fit in memory.
+    """
+    written = 0
+    writer = None
+    try:
+        for path in source_paths:
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size, columns=columns):
+                batch = batch.slice(0, num_rows - written)
+                if writer is None:
+                    writer = pq.ParquetWriter(target_path, batch.schema)
+                writer.write_batch(batch)
+                written += batch.num_rows
+                if written >= num_rows:
+                    return written
+    finally:
+        if writer is not None:
+            writer.close()
+    return written
+
+
+def search_smallest(reproduces, low, high, tolerance):
+    """Binary-search the smallest value in [low, high] for which reproduces(value) still fails, to within tolerance.
+
+    reproduces returns (failed, error message or None). The failure is assumed to be monotone: once a
+    value reproduces it, every larger one does too. Returns (smallest or None, status, probes) where
+    status is 'found', 'fails at min' or 'not reproduced'.
+    """
+    probes = []
+
+    def attempt(value):
+        start_time = time.time()
+        failed, error = reproduces(value)
+        probes.append({"Value": value, "Status": "fail" if failed else "pass", "Error": error, "Seconds": time.time() - start_time})
+        logging.info(f"Bisection probe {value:,}: {'reproduced' if failed else 'passed'}.")
+        return failed
+
+    if not attempt(high):
+        return None, 'not reproduced', probes
+    if low < high and attempt(low):
+        return low, 'fails at min', probes
+    # Adjacent bounds are exact, so a tolerance below 1 cannot stall the search
+    while high - low > max(tolerance, 1):
+        middle = (low + high) // 2
+        if attempt(middle):
+            high = middle
+        else:
+            low = middle
+    return high, 'found', probes
+
+
+def write_reproducer(directory, source_paths, num_rows, columns, details):
+    """Write the smallest failing relationship subset to directory, with a reproducer.json describing how it fails."""
+    os.makedirs(directory, exist_ok=True)
+    target_path = os.path.join(directory, os.path.basename(source_paths[0]))
+    write_subset(source_paths, target_path, num_rows, columns)
+    with open(os.path.join(directory, 'reproducer.json'), 'w') as f:
+        json.dump({**details, "Relationship File": target_path}, f, indent=4)
+    return target_path
@@ -58,10 +58,92 @@ def generate_chart_js(chart_id, chart_type, labels, data, dataset_label):
     """
     return chart_js
 
+# Function to generate a chart.js line chart with one series of {x, y} points per dataset, optionally on log-log axes
+def generate_xy_chart_js(chart_id, series, x_label, y_label, log_scale=False):
+    borderColors = [
+        'rgba(255,99,132,1)', 'rgba(54, 162, 235, 1)',
+        'rgba(255, 206, 86, 1)', 'rgba(75, 192, 192, 1)',
+        'rgba(153, 102, 255, 1)', 'rgba(255, 159, 64, 1)'
+    ]
+    datasets = [{"label": label, "data": [{"x": x, "y": y} for x, y in points], "showLine": True, "fill": False,
+                 "borderColor": borderColors[i % len(borderColors)], "borderWidth": 1, "pointRadius": 2}
+                for i, (label, points) in enumerate(series.items())]
+    scale_type = 'logarithmic' if log_scale else 'linear'
+
+    chart_js = f"""
+    <script>
+        var ctx = document.getElementById('{chart_id}').getContext('2d');
+        var myChart = new Chart(ctx, {{
+            type: 'scatter',
+            data: {{
+                datasets: {json.dumps(datasets)}
+            }},
+            options: {{
+                responsive: true,
+                maintainAspectRatio: true,
+                scales: {{
+                    x: {{ type: '{scale_type}', title: {{ display: true, text: '{x_label}' }} }},
+                    y: {{ type: '{scale_type}', title: {{ display: true, text: '{y_label}' }} }}
+                }}
+            }}
+        }});
+    </script>
+    """
+    return chart_js
+
+# Function to generate a chart.js chart with one dataset per series over shared labels
+def generate_grouped_chart_js(chart_id, chart_type, labels, series):
+    backgroundColors = [
+        'rgba(255, 99, 132, 0.2)', 'rgba(54, 162, 235, 0.2)',
+        'rgba(255, 206, 86, 0.2)', 'rgba(75, 192, 192, 0.2)',
+        'rgba(153, 102, 255, 0.2)', 'rgba(255, 159, 64, 0.2)'
+    ]
+    borderColors = [
+        'rgba(255,99,132,1)', 'rgba(54, 162, 235, 1)',
+        'rgba(255, 206, 86, 1)', 'rgba(75, 192, 192, 1)',
+        'rgba(153, 102, 255, 1)', 'rgba(255, 159, 64, 1)'
+    ]
+    datasets = [{"label": label, "data": values, "backgroundColor": backgroundColors[i % len(backgroundColors)],
+                 "borderColor": borderColors[i % len(borderColors)], "borderWidth": 1}
+                for i, (label, values) in enumerate(series.items())]
+
+    chart_js = f"""
+    <script>
+        var ctx = document.getElementById('{chart_id}').getContext('2d');
+        var myChart = new Chart(ctx, {{
+            type: '{chart_type}',
+            data: {{
+                labels: {json.dumps(labels)},
+                datasets: {json.dumps(datasets)}
+            }},
+            options: {{
+                responsive: true,
+                maintainAspectRatio: true
+            }}
+        }});
+    </script>
+    """
+    return chart_js
 
-# Function to find all the JSON files in the directory
+# Function to generate the resource summary table rows of a set of sampled stages
+def resource_table_rows(stages):
+    rows = ""
+    for stage, usage in stages.items():
+        summary = usage["summary"]
+        # Stages sampled before start RSS and data sizes were recorded show '-'
+        start_rss = f'{summary["Start RSS (Bytes)"] / 1024 ** 2:,.0f}' if "Start RSS (Bytes)" in summary else '-'
+        data_size = f'{summary["Data Size (Bytes)"] / 1024 ** 2:,.0f}' if "Data Size (Bytes)" in summary else '-'
+        rows += (f'<tr><td>{stage}</td><td>{summary["Duration (Seconds)"]:.2f}</td><td>{start_rss}</td>'
+                 f'<td>{summary["Peak RSS (Bytes)"] / 1024 ** 2:,.0f}</td><td>{summary["Mean RSS (Bytes)"] / 1024 ** 2:,.0f}</td><td>{data_size}</td>'
+                 f'<td>{summary["Mean CPU Percent"]:.0f}</td><td>{summary["Peak CPU Percent"]:.0f}</td>'
+                 f'<td>{summary["Read (Bytes)"] / 1024 ** 2:,.1f}</td><td>{summary["Write (Bytes)"] / 1024 ** 2:,.1f}</td>'
+                 f'<td>{summary["Peak Directory Size (Bytes)"] / 1024 ** 2:,.1f}</td></tr>')
+    return rows
+
+
+# Function to find all the dashboard data JSON files in the directory (other JSON files, like schema_spec.json, are not runs)
 def get_json_files():
-    return [f for f in os.listdir('.') if f.endswith('.json')]
+    return [f for f in os.listdir('.') if f.startswith('dashboard_data_') and f.endswith('.json')]
 
 
 class DashboardCreator:
@@ -78,7 +160,9 @@ class DashboardCreator:
     def generate_dashboard(self):
         data_directory='.'
         comparison_widget = ComparisonWidget(data_directory)
-        widget_html = comparison_widget.generate_widget()
+        widget_html = comparison_widget.generate_widget() + comparison_widget.generate_query_widget() + comparison_widget.generate_scaling_widget()
+        widget_html += comparison_widget.generate_layout_widget() + comparison_widget.generate_width_widget()
+        widget_html += comparison_widget.generate_topology_widget()
         index_content = """
 <!DOCTYPE html>
 <html lang="en">
@@ -116,7 +200,50 @@ class DashboardCreator:
                 sidebar_links_html += """ <ul>
                    <li> <a href="#" onclick="openTab(event, 'database_summary')">Database Summary</a> </li>
                     <li> <a href="#" onclick="openTab(event, 'load_times')">Load Times</a> </li>
-                    </ul>"""
+"""
+                if "rel_load_chunks" in self.data:
+                    sidebar_links_html += """                    <li> <a href="#" onclick="openTab(event, 'rel_load_chunks')">Relationship Chunks</a> </li>
+"""
+                if "load_sweep" in self.data:
+                    sidebar_links_html += """                    <li> <a href="#" onclick="openTab(event, 'load_sweep')">Buffer Pool Sweep</a> </li>
+"""
+                if self.data.get("memory_limits"):
+                    sidebar_links_html += """                    <li> <a href="#" onclick="openTab(event, 'memory_limits')">Minimum Memory</a> </li>
+"""
+                if self.data.get("concurrent_reads"):
+                    sidebar_links_html += """                    <li> <a href="#" onclick="openTab(event, 'concurrent_reads')">Concurrent Reads</a> </li>
+"""
+                if self.data.get("scaling_curve"):
+                    sidebar_links_html += """                    <li> <a href="#" onclick="openTab(event, 'scaling_curve')">Scaling Curve</a> </li>
+"""
+                if self.data.get("column_sweep"):
+                    sidebar_links_html += """                    <li> <a href="#" onclick="openTab(event, 'column_sweep')">Wide Tables</a> </li>
+"""
+                if self.data.get("topology_benchmark"):
+                    sidebar_links_html += """                    <li> <a href="#" onclick="openTab(event, 'topology_benchmark')">Graph Topology</a> </li>
+"""
+                if self.data.get("upsert_benchmark"):
+                    sidebar_links_html += """                    <li> <a href="#" onclick="openTab(event, 'upsert_benchmark')">Upsert Benchmark</a> </li>
+"""
+                if self.data.get("ingestion_backends"):
+                    sidebar_links_html += """                    <li> <a href="#" onclick="openTab(event, 'ingestion_backends')">Ingestion Backends</a> </li>
+"""
+                if self.data.get("parquet_layouts"):
+                    sidebar_links_html += """                    <li> <a href="#" onclick="openTab(event, 'parquet_layouts')">Parquet Layouts</a> </li>
+"""
+                if self.data.get("failure_bisection"):
+                    sidebar_links_html += """                    <li> <a href="#" onclick="openTab(event, 'failure_bisection')">Failure Bisection</a> </li>
+"""
+                if self.data.get("integrity_checks"):
+                    sidebar_links_html += """                    <li> <a href="#" onclick="openTab(event, 'integrity_checks')">Integrity Checks</a> </li>
+"""
+                if self.data.get("query_benchmark"):
+                    sidebar_links_html += """                    <li> <a href="#" onclick="openTab(event, 'query_benchmark')">Query Benchmark</a> </li>
+"""
+                if self.data.get("resource_usage") or self.data.get("generation_resource_usage"):
+                    sidebar_links_html += """                    <li> <a href="#" onclick="openTab(event, 'resource_usage')">Resources</a> </li>
+"""
+                sidebar_links_html += """                    </ul>"""
 
             sidebar_links_html += "    </div>\n</div>"
 
@@ -148,7 +275,7 @@ class DashboardCreator:
         </table>
         <h3>Database Summary</h3>
         <table style="background-color: #f8f8f8;">
-            <tr><th>Entity</th><th>Table Count</th></tr>
+            <tr><th>Entity</th><th>Table Count</th><th>Expected Count</th><th>Status</th></tr>
 """
 
             if "database_summary" in self.data:
@@ -156,7 +283,7 @@ class DashboardCreator:
                     entity = item["Entity"]
                     node_count = int(item["Table Count"].replace(",", ""))
                     summary_dict[entity] = node_count
-                    html_content += f'<tr><td>{entity}</td><td>{node_count:,}</td></tr>'
+                    html_content += f'<tr><td>{entity}</td><td>{node_count:,}</td><td>{item.get("Expected Count", "-")}</td><td>{item.get("Status", "-")}</td></tr>'
 
             html_content += f"""
         </table>
@@ -193,10 +320,11 @@ class DashboardCreator:
         <h2>Database Summary: Kuzu - {kuzu_version}</h2>
         <div class="chart-container"><canvas id="summaryChart"></canvas></div><br>
         <table style="background-color: #f8f8f8;">
-            <tr><th>Entity</th><th>Table Count</th></tr>
+            <tr><th>Entity</th><th>Table Count</th><th>Expected Count</th><th>Status</th><th>Query Time (Seconds)</th></tr>
         """
-                for entity, count in summary_dict.items():
-                    html_content += f'<tr><td>{entity}</td><td>{count:,}</td></tr>'
+                for item in self.data["database_summary"]:
+                    query_time = f'{item["Query Time (Seconds)"]:.3f}' if "Query Time (Seconds)" in item else '-'
+                    html_content += f'<tr><td>{item["Entity"]}</td><td>{summary_dict[item["Entity"]]:,}</td><td>{item.get("Expected Count", "-")}</td><td>{item.get("Status", "-")}</td><td>{query_time}</td></tr>'
                 html_content += '</table></div>'
 
                 html_content += generate_chart_js("summaryChart", "pie", summary_labels, summary_data, "Database Summary")
@@ -221,6 +349,361 @@ class DashboardCreator:
 
                 html_content += generate_chart_js("loadTimeChart", "bar", load_time_labels, load_time_values, "Load Times")
 
+            if "rel_load_chunks" in self.data:
+                chunk_data = self.data["rel_load_chunks"]
+
+                chunk_labels = [f'Chunk {item["Chunk"]}' for item in chunk_data]
+                chunk_values = [round(float(item["Rows/sec"] or 0)) for item in chunk_data]
+
+                # Relationship Chunks Tab Content
+                html_content += f"""
+    <div id="rel_load_chunks" class="tabcontent">
+        <h2>Relationship Chunk Throughput: Kuzu Version - {kuzu_version}</h2>
+        <div class="chart-container"><canvas id="chunkThroughputChart"></canvas></div><br>
+        <table style="background-color: #f8f8f8;">
+            <tr><th>Chunk</th><th>File</th><th>Rows</th><th>Load Time (Seconds)</th><th>Rows/sec</th></tr>
+        """
+                for item in chunk_data:
+                    html_content += f'<tr><td>{item["Chunk"]}</td><td>{item["File"]}</td><td>{item["Rows"]:,}</td><td>{item["Load Time (Seconds)"]:.2f}</td><td>{round(float(item["Rows/sec"] or 0)):,}</td></tr>'
+                html_content += '</table></div>'
+
+                html_content += generate_chart_js("chunkThroughputChart", "line", chunk_labels, chunk_values, "Rows/sec")
+
+            if "load_sweep" in self.data:
+                sweep_data = self.data["load_sweep"]
+
+                sweep_labels = [f'{item["Buffer Pool (MB)"]} MB / {item["Max Threads"]} threads' for item in sweep_data]
+                sweep_values = [round(float(item["Load Time (Seconds)"] or 0), 2) for item in sweep_data]
+
+                # Buffer Pool Sweep Tab Content
+                html_content += f"""
+    <div id="load_sweep" class="tabcontent">
+        <h2>Buffer Pool and Thread Sweep: Kuzu Version - {kuzu_version}</h2>
+        <div class="chart-container"><canvas id="loadSweepChart"></canvas></div><br>
+        <table style="background-color: #f8f8f8;">
+            <tr><th>Buffer Pool (MB)</th><th>Effective Buffer Pool (MB)</th><th>Max Threads</th><th>Retries</th><th>Status</th><th>Load Time (Seconds)</th></tr>
+        """
+                for item in sweep_data:
+                    load_time = f'{item["Load Time (Seconds)"]:.2f}' if item["Load Time (Seconds)"] is not None else '-'
+                    html_content += f'<tr><td>{item["Buffer Pool (MB)"]}</td><td>{item["Effective Buffer Pool (MB)"]}</td><td>{item["Max Threads"]}</td><td>{item["Retries"]}</td><td>{item["Status"]}</td><td>{load_time}</td></tr>'
+                html_content += '</table></div>'
+
+                html_content += generate_chart_js("loadSweepChart", "bar", sweep_labels, sweep_values, "Load Time (Seconds)")
+
+            if self.data.get("memory_limits"):
+                memory_data = self.data["memory_limits"]
+
+                memory_labels = [item["Table Name"] for item in memory_data]
+                memory_values = [item["Minimum Memory (MB)"] or 0 for item in memory_data]
+
+                # Minimum Memory Tab Content
+                html_content += f"""
+    <div id="memory_limits" class="tabcontent">
+        <h2>Minimum Memory per Table Load: Kuzu Version - {kuzu_version}</h2>
+        <div class="chart-container"><canvas id="minimumMemoryChart"></canvas></div><br>
+        <table style="background-color: #f8f8f8;">
+            <tr><th>Table Name</th><th>Method</th><th>Minimum Memory (MB)</th><th>Status</th><th>Process Baseline (MB)</th><th>Probes (MB: result)</th></tr>
+        """
+                for item in memory_data:
+                    minimum = item["Minimum Memory (MB)"] if item["Minimum Memory (MB)"] is not None else '-'
+                    probes = ", ".join(f'{probe["Cap (MB)"]}: {probe["Status"]}' for probe in item["Probes"])
+                    html_content += f'<tr><td>{item["Table Name"]}</td><td>{item["Method"]}</td><td>{minimum}</td><td>{item["Status"]}</td><td>{item["Process Baseline (MB)"]}</td><td>{probes}</td></tr>'
+                html_content += '</table></div>'
+
+                html_content += generate_chart_js("minimumMemoryChart", "bar", memory_labels, memory_values, "Minimum Memory (MB)")
+
+            if self.data.get("concurrent_reads"):
+                concurrency_data = [item for item in self.data["concurrent_reads"] if item["QPS"] is not None]
+
+                qps_series = {mode: [(item["Concurrency"], round(item["QPS"], 1)) for item in concurrency_data if item["Mode"] == mode]
+                              for mode in dict.fromkeys(item["Mode"] for item in concurrency_data)}
+                p99_series = {f'{mode} p99 (ms)': [(item["Concurrency"], round(item.get("p99 (ms)", 0), 3)) for item in concurrency_data if item["Mode"] == mode]
+                              for mode in qps_series}
+
+                # Concurrent Reads Tab Content
+                html_content += f"""
+    <div id="concurrent_reads" class="tabcontent">
+        <h2>Concurrent Read Scaling: Kuzu Version - {kuzu_version}</h2>
+        <div class="chart-container"><canvas id="concurrencyQpsChart"></canvas></div><br>
+        <div class="chart-container"><canvas id="concurrencyLatencyChart"></canvas></div><br>
+        <table style="background-color: #f8f8f8;">
+            <tr><th>Mode</th><th>Concurrency</th><th>Queries</th><th>Errors</th><th>QPS</th><th>p50 (ms)</th><th>p95 (ms)</th><th>p99 (ms)</th></tr>
+        """
+                for item in self.data["concurrent_reads"]:
+                    latencies = "".join(f'<td>{item[name]:.2f}</td>' if name in item else '<td>-</td>' for name in ["p50 (ms)", "p95 (ms)", "p99 (ms)"])
+                    qps = f'{item["QPS"]:,.0f}' if item["QPS"] is not None else item.get("Error", "-")
+                    html_content += f'<tr><td>{item["Mode"]}</td><td>{item["Concurrency"]}</td><td>{item["Queries"]:,}</td><td>{item["Errors"]}</td><td>{qps}</td>{latencies}</tr>'
+                html_content += '</table></div>'
+
+                html_content += generate_xy_chart_js("concurrencyQpsChart", qps_series, "Concurrency", "QPS")
+                html_content += generate_xy_chart_js("concurrencyLatencyChart", p99_series, "Concurrency", "p99 Latency (ms)")
+
+            if self.data.get("scaling_curve"):
+                scaling_sizes = [item for item in self.data["scaling_curve"]["Sizes"] if item["Status"] == "pass"]
+
+                time_series = {"Total": [(item["Rows"], round(item["Load Time (Seconds)"], 3)) for item in scaling_sizes]}
+                time_series.update({table_name: [(item["Table Rows"][table_name], round(load["Load Time (Seconds)"], 3))
+                                                 for item in scaling_sizes for load in item["Table Load Times"] if load["Table Name"] == table_name]
+                                    for table_name in ["Person", "Company", "WorksAt"]})
+                memory_series = {name: [(item["Rows"], round(item[name], 1)) for item in scaling_sizes]
+                                 for name in ["Peak RSS (MB)", "Load Memory (MB)", "Database Size (MB)"]}
+
+                # Scaling Curve Tab Content
+                html_content += f"""
+    <div id="scaling_curve" class="tabcontent">
+        <h2>Scaling Curve (log-log): Kuzu Version - {kuzu_version}</h2>
+        <div class="chart-container"><canvas id="scalingTimeChart"></canvas></div><br>
+        <div class="chart-container"><canvas id="scalingMemoryChart"></canvas></div><br>
+        <table style="background-color: #f8f8f8;">
+            <tr><th>Metric</th><th>Exponent</th><th>Scaling</th><th>Points</th></tr>
+        """
+                for item in self.data["scaling_curve"]["Fits"]:
+                    exponent = f'{item["Exponent"]:.2f}' if item["Exponent"] is not None else '-'
+                    html_content += f'<tr><td>{item["Metric"]}</td><td>{exponent}</td><td>{item["Scaling"]}</td><td>{item["Points"]}</td></tr>'
+                html_content += """</table><br>
+        <table style="background-color: #f8f8f8;">
+            <tr><th>Relationships</th><th>Rows</th><th>Status</th><th>Cached</th><th>Load Time (Seconds)</th><th>Rows/sec</th><th>Peak RSS (MB)</th><th>Load Memory (MB)</th><th>Database Size (MB)</th></tr>
+        """
+                for item in self.data["scaling_curve"]["Sizes"]:
+                    if item["Status"] != "pass":
+                        html_content += f'<tr><td>{item["Relationships"]:,}</td><td>{item.get("Rows", 0):,}</td><td>{item["Status"]}</td><td colspan="6">{item["Error"] or ""}</td></tr>'
+                        continue
+                    html_content += (f'<tr><td>{item["Relationships"]:,}</td><td>{item["Rows"]:,}</td><td>{item["Status"]}</td><td>{item["Cached"]}</td>'
+                                     f'<td>{item["Load Time (Seconds)"]:.2f}</td><td>{round(item["Rows/sec"] or 0):,}</td><td>{item["Peak RSS (MB)"]:,.0f}</td>'
+                                     f'<td>{item["Load Memory (MB)"]:,.0f}</td><td>{item["Database Size (MB)"]:,.1f}</td></tr>')
+                html_content += '</table></div>'
+
+                html_content += generate_xy_chart_js("scalingTimeChart", time_series, "Rows", "Load Time (Seconds)", log_scale=True)
+                html_content += generate_xy_chart_js("scalingMemoryChart", memory_series, "Rows", "MB", log_scale=True)
+
+            if self.data.get("column_sweep"):
+                width_data = self.data["column_sweep"]
+                loaded_widths = [item for item in width_data if item["Status"] == "pass"]
+
+                width_time_series = {"Total": [(item["Columns"], round(item["Load Time (Seconds)"], 3)) for item in loaded_widths]}
+                width_time_series.update({table_name: [(item["Columns"], round(load["Load Time (Seconds)"], 3))
+                                                       for item in loaded_widths for load in item["Table Load Times"] if load["Table Name"] == table_name]
+                                          for table_name in ["Person", "Company", "WorksAt"]})
+                width_memory_series = {name: [(item["Columns"], round(item[name], 1)) for item in loaded_widths]
+                                       for name in ["Parquet Size (MB)", "Peak RSS (MB)", "Load Memory (MB)", "Database Size (MB)"]}
+
+                # Wide Tables Tab Content
+                html_content += f"""
+    <div id="column_sweep" class="tabcontent">
+        <h2>Wide Tables (Fixed Data Volume): Kuzu Version - {kuzu_version}</h2>
+        <div class="chart-container"><canvas id="widthTimeChart"></canvas></div><br>
+        <div class="chart-container"><canvas id="widthMemoryChart"></canvas></div><br>
+        <table style="background-color: #f8f8f8;">
+            <tr><th>Property Columns</th><th>Rows</th><th>Status</th><th>Cached</th><th>Parquet Size (MB)</th><th>Load Time (Seconds)</th><th>MB/sec</th><th>Peak RSS (MB)</th><th>Load Memory (MB)</th><th>Database Size (MB)</th></tr>
+        """
+                for item in width_data:
+                    if item["Status"] != "pass":
+                        html_content += f'<tr><td>{item["Columns"]}</td><td>{item.get("Rows", 0):,}</td><td>{item["Status"]}</td><td colspan="7">{item["Error"] or ""}</td></tr>'
+                        continue
+                    html_content += (f'<tr><td>{item["Columns"]}</td><td>{item["Rows"]:,}</td><td>{item["Status"]}</td><td>{item["Cached"]}</td>'
+                                     f'<td>{item["Parquet Size (MB)"]:,.1f}</td><td>{item["Load Time (Seconds)"]:.2f}</td><td>{item["MB/sec"] or 0:,.1f}</td>'
+                                     f'<td>{item["Peak RSS (MB)"]:,.0f}</td><td>{item["Load Memory (MB)"]:,.0f}</td><td>{item["Database Size (MB)"]:,.1f}</td></tr>')
+                html_content += '</table></div>'
+
+                html_content += generate_xy_chart_js("widthTimeChart", width_time_series, "Property Columns", "Load Time (Seconds)")
+                html_content += generate_xy_chart_js("widthMemoryChart", width_memory_series, "Property Columns", "MB")
+
+            if self.data.get("topology_benchmark"):
+                topology_data = self.data["topology_benchmark"]
+                loaded_topologies = [item for item in topology_data if item["Status"] == "pass"]
+
+                topology_time_series = {name: [(item["Tables"], round(item[name], 3)) for item in loaded_topologies]
+                                        for name in ["DDL Time (Seconds)", "Load Time (Seconds)"]}
+                hop_series = {item["Topology"]: [(query["Hops"], round(query["Median (ms)"], 3)) for query in item["Queries"]]
+                              for item in loaded_topologies}
+
+                # Graph Topology Tab Content
+                html_content += f"""
+    <div id="topology_benchmark" class="tabcontent">
+        <h2>Graph Topology (Schema Size and Multi-Hop Paths): Kuzu Version - {kuzu_version}</h2>
+        <div class="chart-container"><canvas id="topologyTimeChart"></canvas></div><br>
+        <div class="chart-container"><canvas id="topologyHopChart"></canvas></div><br>
+        <table style="background-color: #f8f8f8;">
+            <tr><th>Topology</th><th>Labels</th><th>Rel Types</th><th>Self Relations</th><th>Rows</th><th>Status</th><th>Cached</th><th>DDL Time (Seconds)</th><th>Load Time (Seconds)</th><th>COPY Waves</th><th>Rows/sec</th><th>Peak RSS (MB)</th><th>Database Size (MB)</th></tr>
+        """
+                for item in topology_data:
+                    if item["Status"] != "pass":
+                        html_content += f'<tr><td>{item["Topology"]}</td><td>{item["Labels"]}</td><td>{item["Rel Types"]}</td><td>{item["Self Relations"]}</td><td>{item.get("Rows", 0):,}</td><td>{item["Status"]}</td><td colspan="7">{item["Error"] or ""}</td></tr>'
+                        continue
+                    html_content += (f'<tr><td>{item["Topology"]}</td><td>{item["Labels"]}</td><td>{item["Rel Types"]}</td><td>{item["Self Relations"]}</td>'
+                                     f'<td>{item["Rows"]:,}</td><td>{item["Status"]}</td><td>{item["Cached"]}</td><td>{item["DDL Time (Seconds)"]:.2f}</td>'
+                                     f'<td>{item["Load Time (Seconds)"]:.2f}</td><td>{item["COPY Waves"]}</td><td>{round(item["Rows/sec"] or 0):,}</td>'
+                                     f'<td>{item["Peak RSS (MB)"]:,.0f}</td><td>{item["Database Size (MB)"]:,.1f}</td></tr>')
+                html_content += """</table><br>
+        <table style="background-color: #f8f8f8;">
+            <tr><th>Topology</th><th>Hops</th><th>Path</th><th>Paths</th><th>Median (ms)</th></tr>
+        """
+                for item in loaded_topologies:
+                    for query in item["Queries"]:
+                        html_content += f'<tr><td>{item["Topology"]}</td><td>{query["Hops"]}</td><td>{query["Path"]}</td><td>{query["Paths"]:,}</td><td>{query["Median (ms)"]:.2f}</td></tr>'
+                html_content += '</table></div>'
+
+                html_content += generate_xy_chart_js("topologyTimeChart", topology_time_series, "Tables (Labels + Rel Types)", "Seconds")
+                html_content += generate_xy_chart_js("topologyHopChart", hop_series, "Hops", "Median Query Time (ms)")
+
+            if self.data.get("upsert_benchmark"):
+                upsert_data = self.data["upsert_benchmark"]
+
+                upsert_labels = [f'Batch {item["Batch Size"]}' for item in upsert_data]
+                upsert_values = [round(item["Writes/sec"] or 0) for item in upsert_data]
+                commit_series = {percentile: [round(item.get(f"Commit {percentile}", 0), 3) for item in upsert_data]
+                                 for percentile in ["p50 (ms)", "p95 (ms)", "p99 (ms)"]}
+
+                # Upsert Benchmark Tab Content
+                html_content += f"""
+    <div id="upsert_benchmark" class="tabcontent">
+        <h2>Incremental Writes: Kuzu Version - {kuzu_version}</h2>
+        <div class="chart-container"><canvas id="upsertThroughputChart"></canvas></div><br>
+        <div class="chart-container"><canvas id="commitLatencyChart"></canvas></div><br>
+        <table style="background-color: #f8f8f8;">
+            <tr><th>Batch Size</th><th>Operations</th><th>Failed Batches</th><th>Writes/sec</th><th>Commit p50 (ms)</th><th>Commit p95 (ms)</th><th>Commit p99 (ms)</th><th>Batch p50 (ms)</th><th>Batch p99 (ms)</th><th>Error</th></tr>
+        """
+                for item in upsert_data:
+                    latencies = "".join(f'<td>{item.get(name, 0):.2f}</td>' for name in ["Commit p50 (ms)", "Commit p95 (ms)", "Commit p99 (ms)", "Batch p50 (ms)", "Batch p99 (ms)"])
+                    html_content += f'<tr><td>{item["Batch Size"]}</td><td>{item["Operations"]:,}</td><td>{item["Failed Batches"]}</td><td>{round(item["Writes/sec"] or 0):,}</td>{latencies}<td>{item["Error"] or ""}</td></tr>'
+                html_content += '</table></div>'
+
+                html_content += generate_chart_js("upsertThroughputChart", "bar", upsert_labels, upsert_values, "Writes/sec")
+                html_content += generate_grouped_chart_js("commitLatencyChart", "line", upsert_labels, commit_series)
+
+            if self.data.get("ingestion_backends"):
+                backend_data = self.data["ingestion_backends"]
+
+                backend_labels = [item["Backend"] for item in backend_data]
+                backend_series = {table_name: [round(next((table["Rows/sec"] or 0 for table in item["Tables"] if table["Table Name"] == table_name), 0))
+                                               for item in backend_data] for table_name in ["Person", "Company", "WorksAt"]}
+
+                # Ingestion Backends Tab Content
+                html_content += f"""
+    <div id="ingestion_backends" class="tabcontent">
+        <h2>Ingestion Backends (Rows/sec): Kuzu Version - {kuzu_version}</h2>
+        <div class="chart-container"><canvas id="ingestionBackendChart"></canvas></div><br>
+        <table style="background-color: #f8f8f8;">
+            <tr><th>Backend</th><th>Table</th><th>Rows</th><th>Prepare Time (Seconds)</th><th>Load Time (Seconds)</th><th>Rows/sec</th></tr>
+        """
+                for item in backend_data:
+                    for table in item["Tables"]:
+                        html_content += f'<tr><td>{item["Backend"]}</td><td>{table["Table Name"]}</td><td>{table["Rows"]:,}</td><td>{table["Prepare Time (Seconds)"]:.2f}</td><td>{table["Load Time (Seconds)"]:.2f}</td><td>{round(table["Rows/sec"] or 0):,}</td></tr>'
+                    rows_per_second = f'{round(item["Rows/sec"]):,}' if item["Rows/sec"] else '-'
+                    status = f'{item["Status"]}: {item["Error"]}' if item["Error"] else item["Status"]
+                    html_content += f'<tr><th>{item["Backend"]}</th><th>Total ({status})</th><th>{item["Rows"]:,}</th><th></th><th>{item["Load Time (Seconds)"]:.2f}</th><th>{rows_per_second}</th></tr>'
+                html_content += '</table></div>'
+
+                html_content += generate_grouped_chart_js("ingestionBackendChart", "bar", backend_labels, backend_series)
+
+            if self.data.get("parquet_layouts"):
+                layout_data = self.data["parquet_layouts"]
+                loaded_layouts = [item for item in layout_data if item["Status"] == "pass"]
+
+                layout_labels = [item["Variant"] for item in loaded_layouts]
+                layout_series = {table_name: [round(next((load["Load Time (Seconds)"] for load in item["Table Load Times"] if load["Table Name"] == table_name), 0), 3)
+                                              for item in loaded_layouts] for table_name in ["Person", "Company", "WorksAt"]}
+
+                # Parquet Layouts Tab Content
+                html_content += f"""
+    <div id="parquet_layouts" class="tabcontent">
+        <h2>Parquet Layout Matrix (COPY Time per Table): Kuzu Version - {kuzu_version}</h2>
+        <div class="chart-container"><canvas id="layoutLoadChart"></canvas></div><br>
+        <div class="chart-container"><canvas id="layoutSizeChart"></canvas></div><br>
+        <table style="background-color: #f8f8f8;">
+            <tr><th>Codec</th><th>Row Group Size</th><th>Dictionary</th><th>Statistics</th><th>Status</th><th>File Size (MB)</th><th>Load Time (Seconds)</th><th>Peak RSS (MB)</th><th>Load Memory (MB)</th><th>Database Size (MB)</th><th>Error</th></tr>
+        """
+                for item in layout_data:
+                    measured = "".join(f'<td>{item[name]:,.2f}</td>' if name in item else '<td>-</td>'
+                                       for name in ["File Size (MB)", "Load Time (Seconds)", "Peak RSS (MB)", "Load Memory (MB)", "Database Size (MB)"])
+                    html_content += f'<tr><td>{item["Codec"]}</td><td>{item["Row Group Size"]:,}</td><td>{item["Dictionary"]}</td><td>{item["Statistics"]}</td><td>{item["Status"]}</td>{measured}<td>{item["Error"] or ""}</td></tr>'
+                html_content += '</table></div>'
+
+                html_content += generate_grouped_chart_js("layoutLoadChart", "bar", layout_labels, layout_series)
+                html_content += generate_grouped_chart_js("layoutSizeChart", "bar", layout_labels,
+                                                          {"File Size (MB)": [round(item["File Size (MB)"], 2) for item in loaded_layouts],
+                                                           "Peak RSS (MB)": [round(item["Peak RSS (MB)"]) for item in loaded_layouts]})
+
+            if self.data.get("failure_bisection"):
+                bisection = self.data["failure_bisection"]
+                minimum_rows = f'{bisection["Minimum Relationships"]:,}' if bisection["Minimum Relationships"] is not None else '-'
+                minimum_columns = bisection["Minimum Property Columns"] if bisection["Minimum Property Columns"] is not None else '-'
+
+                # Failure Bisection Tab Content
+                html_content += f"""
+    <div id="failure_bisection" class="tabcontent">
+        <h2>Failure-Threshold Bisection: Kuzu Version - {kuzu_version}</h2>
+        <table style="background-color: #f8f8f8;">
+            <tr><th>Error Pattern</th><th>Total Relationships</th><th>Minimum Relationships</th><th>Status</th><th>Property Columns</th><th>Minimum Property Columns</th><th>Error</th><th>Reproducer</th></tr>
+            <tr><td>{bisection["Error Pattern"] or "any error"}</td><td>{bisection["Total Relationships"]:,}</td><td>{minimum_rows}</td><td>{bisection["Relationship Status"]}</td><td>{bisection["Property Columns"]}</td><td>{minimum_columns}</td><td>{bisection["Error"] or ""}</td><td>{bisection["Reproducer"] or "-"}</td></tr>
+        </table><br>
+        <table style="background-color: #f8f8f8;">
+            <tr><th>Search</th><th>Value</th><th>Status</th><th>Seconds</th><th>Error</th></tr>
+        """
+                for search, probes in [("Relationships", bisection["Relationship Probes"]), ("Property Columns", bisection["Column Probes"])]:
+                    for probe in probes:
+                        html_content += f'<tr><td>{search}</td><td>{probe["Value"]:,}</td><td>{probe["Status"]}</td><td>{probe["Seconds"]:.2f}</td><td>{probe["Error"] or ""}</td></tr>'
+                html_content += '</table></div>'
+
+            if self.data.get("integrity_checks"):
+                # Integrity Checks Tab Content
+                html_content += f"""
+    <div id="integrity_checks" class="tabcontent">
+        <h2>Pre-COPY Integrity Checks: Kuzu Version - {kuzu_version}</h2>
+        <table style="background-color: #f8f8f8;">
+            <tr><th>Check</th><th>Table</th><th>Column</th><th>Status</th><th>Rows</th><th>Violations</th><th>Examples</th><th>Seconds</th></tr>
+        """
+                for item in self.data["integrity_checks"]:
+                    html_content += f'<tr><td>{item["Check"]}</td><td>{item["Table"]}</td><td>{item["Column"]}</td><td>{item["Status"]}</td><td>{item["Rows"]:,}</td><td>{item["Violations"]:,}</td><td>{", ".join(item["Examples"])}</td><td>{item["Seconds"]:.2f}</td></tr>'
+                html_content += '</table></div>'
+
+            if self.data.get("query_benchmark"):
+                query_data = [item for item in self.data["query_benchmark"] if item["Status"] == "pass"]
+
+                query_labels = [item["Query"] for item in query_data]
+                query_series = {percentile: [round(item[percentile], 3) for item in query_data]
+                                for percentile in ["p50 (ms)", "p95 (ms)", "p99 (ms)"]}
+
+                # Query Benchmark Tab Content
+                html_content += f"""
+    <div id="query_benchmark" class="tabcontent">
+        <h2>Query Latency: Kuzu Version - {kuzu_version}</h2>
+        <div class="chart-container"><canvas id="queryLatencyChart"></canvas></div><br>
+        <table style="background-color: #f8f8f8;">
+            <tr><th>Query</th><th>Status</th><th>Iterations</th><th>p50 (ms)</th><th>p95 (ms)</th><th>p99 (ms)</th><th>Mean (ms)</th><th>Queries/sec</th><th>Mean Rows</th><th>Cypher</th></tr>
+        """
+                for item in self.data["query_benchmark"]:
+                    if item["Status"] == "pass":
+                        html_content += f'<tr><td>{item["Query"]}</td><td>{item["Status"]}</td><td>{item["Iterations"]}</td><td>{item["p50 (ms)"]:.2f}</td><td>{item["p95 (ms)"]:.2f}</td><td>{item["p99 (ms)"]:.2f}</td><td>{item["Mean (ms)"]:.2f}</td><td>{item["Throughput (Queries/sec)"] or 0:,.0f}</td><td>{item["Mean Rows"]:,.1f}</td><td>{item["Cypher"]}</td></tr>'
+                    else:
+                        html_content += f'<tr><td>{item["Query"]}</td><td>{item["Status"]}</td><td>{item["Iterations"]}</td><td colspan="6">{item["Error"]}</td><td>{item["Cypher"]}</td></tr>'
+                html_content += '</table></div>'
+
+                html_content += generate_grouped_chart_js("queryLatencyChart", "bar", query_labels, query_series)
+
+            if self.data.get("resource_usage") or self.data.get("generation_resource_usage"):
+                stages = {**self.data.get("generation_resource_usage", {}), **self.data.get("resource_usage", {})}
+
+                peak_rss_labels = list(stages)
+                peak_rss_values = [round(usage["summary"]["Peak RSS (Bytes)"] / 1024 ** 2) for usage in stages.values()]
+                rss_series = {stage: [(sample["Time (Seconds)"], round(sample["RSS (Bytes)"] / 1024 ** 2))
+                                      for sample in usage["samples"]] for stage, usage in stages.items()}
+
+                # Resources Tab Content
+                html_content += f"""
+    <div id="resource_usage" class="tabcontent">
+        <h2>Resource Usage per Stage: Kuzu Version - {kuzu_version}</h2>
+        <div class="chart-container"><canvas id="peakRssChart"></canvas></div><br>
+        <div class="chart-container"><canvas id="rssOverTimeChart"></canvas></div><br>
+        <table style="background-color: #f8f8f8;">
+            <tr><th>Stage</th><th>Duration (Seconds)</th><th>Start RSS (MB)</th><th>Peak RSS (MB)</th><th>Mean RSS (MB)</th><th>Arrow Data (MB)</th><th>Mean CPU %</th><th>Peak CPU %</th><th>Read (MB)</th><th>Written (MB)</th><th>Peak Directory Size (MB)</th></tr>
+        """
+                html_content += resource_table_rows(stages)
+                html_content += '</table></div>'
+
+                html_content += generate_chart_js("peakRssChart", "bar", peak_rss_labels, peak_rss_values, "Peak RSS (MB)")
+                html_content += generate_xy_chart_js("rssOverTimeChart", rss_series, "Time (Seconds)", "RSS (MB)")
+
             # Config Tab Content
             html_content += f"""
     <div id="config" class="tabcontent">
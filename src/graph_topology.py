@@ -0,0 +1,146 @@
+import os
+import json
+import re
+import logging
+from faker import Faker
+import numpy as np
+import pyarrow as pa
+from key_encoding import make_id_generator
+from test_create_test_data import (ENTITY_TYPES, GENERATION_BATCH_SIZE, GENERATION_MODE, GENERATION_SEED, ID_FORMAT,
+                                   build_endpoint_sampler, generate_dynamic_properties, read_key_column, write_batches_to_parquet)
+
+
+# Parquet columns of generated topology tables: the node primary key, and the FROM/TO keys leading every rel file
+NODE_KEY = 'id'
+REL_ENDPOINTS = ['from_id', 'to_id']
+DISTRIBUTIONS = ['uniform', 'zipf', 'fixed']
+TABLE_NAME = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+def normalize_topology(topology):
+    """Validate a topology {"nodes": [{"label", "count", "properties"}], "rels": [{"type", "from", "to", "count", ...}]}.
+
+    Rels may set "properties" and "distribution" (uniform, zipf or fixed, applied to both endpoints); from and
+    to may be the same label for a self-relation. Adds the key and endpoint columns the loader builds its DDL from.
+    """
+    nodes, rels = topology.get('nodes', []), topology.get('rels', [])
+    names = [node.get('label') for node in nodes] + [rel.get('type') for rel in rels]
+    if not nodes:
+        raise ValueError("A topology needs at least one node label")
+    if not all(name and TABLE_NAME.match(name) for name in names) or len({name.lower() for name in names}) != len(names):
+        raise ValueError("Node labels and rel types need identifier names (letters, digits and underscores) that are unique "
+                         "ignoring case, as every table is written to a directory named after it")
+    labels = {node['label'] for node in nodes}
+    for table in nodes + rels:
+        if int(table.get('count', 0)) < 1 or int(table.get('properties', 0)) < 0:
+            raise ValueError(f"{table.get('label') or table.get('type')} needs a count of at least 1 and non-negative properties")
+    for rel in rels:
+        if rel.get('from') not in labels or rel.get('to') not in labels:
+            raise ValueError(f"Rel type {rel['type']} connects unknown labels {rel.get('from')} -> {rel.get('to')}")
+        if rel.get('distribution', 'uniform') not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution {rel['distribution']} of {rel['type']}, expected one of: {', '.join(DISTRIBUTIONS)}")
+    return {
+        "nodes": [{**node, "count": int(node['count']), "properties": int(node.get('properties', 0)), "key": NODE_KEY} for node in nodes],
+        "rels": [{**rel, "count": int(rel['count']), "properties": int(rel.get('properties', 0)),
+                  "distribution": rel.get('distribution', 'uniform'), "endpoints": REL_ENDPOINTS} for rel in rels],
+    }
+
+
+def load_topology(path):
+    with open(path, 'r') as f:
+        return normalize_topology(json.load(f))
+
+
+def synthetic_topology(num_labels, num_rel_types, nodes_per_label, rels_per_type, properties):
+    """K node labels and M rel types wired in rounds: the first K rel types are self-relations (Node1 -> Node1),
+    the next K link each label to the next one (Node1 -> Node2, ..., NodeK -> Node1), then every second one, and so on.
+    """
+    nodes = [{"label": f"Node{i + 1}", "count": nodes_per_label, "properties": properties} for i in range(num_labels)]
+    rels = [{"type": f"Rel{j + 1}", "from": f"Node{j % num_labels + 1}", "to": f"Node{(j % num_labels + j // num_labels) % num_labels + 1}",
+             "count": rels_per_type, "properties": properties} for j in range(num_rel_types)]
+    return normalize_topology({"nodes": nodes, "rels": rels})
+
+
+def topology_paths(topology, directory):
+    """First (and only) part file of every table of a topology dataset, in the shape of dataset_paths.
+
+    Each table gets its own directory, so the part glob of one table (<name>/part_*.parquet) never matches
+    another table's files, even when one name is a prefix of another (Works and WORKS_AT).
+    """
+    return {name: os.path.join(directory, name, 'part_0.parquet')
+            for name in [node['label'] for node in topology['nodes']] + [rel['type'] for rel in topology['rels']]}
+
+
+def table_batches(num_records, columns, batch_size):
+    """Yield record batches of num_records rows from ordered column generators (n -> column)."""
+    for start in range(0, num_records, batch_size):
+        size = min(batch_size, num_records - start)
+        arrays = [generate(size) for generate in columns.values()]
+        yield pa.RecordBatch.from_arrays([array if isinstance(array, pa.Array) else pa.array(array, type=pa.string()) for array in arrays],
+                                         names=list(columns))
+
+
+def endpoint_generator(keys, distribution, rng, seed, endpoint_index):
+    """Column generator drawing rel endpoints from a node key array, tracking the row offset for 'fixed' degrees."""
+    sampler = build_endpoint_sampler(distribution, len(keys), seed=seed, endpoint_index=endpoint_index)
+    next_row = [0]
+
+    def generate(size):
+        rows = sampler(next_row[0], size, rng)
+        next_row[0] += size
+        return keys.take(pa.array(rows))
+
+    return generate
+
+
+def generate_topology_dataset(topology, directory, mode=GENERATION_MODE, seed=GENERATION_SEED, id_format=ID_FORMAT,
+                              batch_size=GENERATION_BATCH_SIZE):
+    """Stream every node table, then every rel table of a topology to <table>/part_0.parquet files in directory.
+
+    Each table is seeded from its position in the topology, in streams separate from the Person/Company/WorksAt
+    entities. Only the key columns of a rel's two node tables are held in memory while it is written.
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = topology_paths(topology, directory)
+    for index, table in enumerate(topology['nodes'] + topology['rels']):
+        fake = Faker()
+        fake.seed_instance(seed)
+        table_seed = [seed, len(ENTITY_TYPES), index]
+        rng = np.random.default_rng(table_seed)
+        if 'label' in table:
+            name = table['label']
+            columns = {NODE_KEY: make_id_generator(id_format, table['count'], table_seed)}
+        else:
+            name = table['type']
+            columns = {column: endpoint_generator(read_key_column(paths[label], NODE_KEY), table['distribution'], rng,
+                                                  seed, 2 * index + side)
+                       for side, (column, label) in enumerate(zip(REL_ENDPOINTS, [table['from'], table['to']]))}
+        columns.update(generate_dynamic_properties(table['properties'], mode=mode, fake=fake, rng=rng))
+        os.makedirs(os.path.dirname(paths[name]), exist_ok=True)
+        write_batches_to_parquet(table_batches(table['count'], columns, batch_size), paths[name])
+    logging.info(f"Generated {len(topology['nodes'])} node labels and {len(topology['rels'])} rel types in {directory}.")
+    return paths
+
+
+def traversal_path(topology, hops):
+    """A walk of up to `hops` rel types from the first node label, preferring rels to labels not visited yet.
+
+    Returns the rels of the walk, which is shorter than `hops` when a label has no outgoing rel type.
+    """
+    label = topology['nodes'][0]['label']
+    visited, path = {label}, []
+    for _ in range(hops):
+        outgoing = [rel for rel in topology['rels'] if rel['from'] == label]
+        if not outgoing:
+            break
+        rel = next((rel for rel in outgoing if rel['to'] not in visited), outgoing[len(path) % len(outgoing)])
+        path.append(rel)
+        label = rel['to']
+        visited.add(label)
+    return path
+
+
+def path_query(path):
+    """A Cypher query counting the paths along a walk, e.g. MATCH (n0:Node1)-[:Rel5]->(n1:Node2) RETURN COUNT(*)."""
+    pattern = f"(n0:{path[0]['from']})" + "".join(f"-[:{rel['type']}]->(n{i + 1}:{rel['to']})" for i, rel in enumerate(path))
+    return f"MATCH {pattern} RETURN COUNT(*) AS Paths;"
@@ -0,0 +1,190 @@
+import os
+import re
+import time
+from importlib.metadata import version
+from importlib.util import find_spec
+import pyarrow as pa
+import pyarrow.csv as pcsv
+import pyarrow.parquet as pq
+from load_scheduler import copy_statement
+from parquet_schema import dataset_row_count, quote_identifier, read_parquet_footer
+
+
+# Primary key of each node table and (column, node table) of each rel table endpoint, as created by the loader
+NODE_KEYS = {"Person": "person_id", "Company": "company_id"}
+REL_ENDPOINTS = {"WorksAt": [("person_id", "Person"), ("company_id", "Company")]}
+
+# COPY FROM an in-memory DataFrame or Arrow table: 0.2.x crashes and 0.4.x rejects the object ("Scan from external
+# object ... is not supported"); 0.6.x scans both, but imports polars while resolving an Arrow table
+KUZU_VERSION = tuple(int(part) for part in re.findall(r'\d+', version('kuzu'))[:3])
+SCAN_MIN_KUZU_VERSION = (0, 6, 0)
+SCAN_REQUIREMENT = f"needs kuzu >= {'.'.join(map(str, SCAN_MIN_KUZU_VERSION))}, installed {version('kuzu')}"
+
+# Backend name -> function(conn, table_name, parts, work_dir, options) returning (rows, prepare_seconds, load_seconds)
+BACKENDS = {}
+# Backend name -> why the installed kuzu cannot run it
+UNSUPPORTED_BACKENDS = {}
+
+
+def backend(name, unsupported_reason=None):
+    """Register an ingestion backend under a name usable in INGESTION_BACKENDS, unless the installed kuzu cannot run it."""
+    def register(function):
+        if unsupported_reason:
+            UNSUPPORTED_BACKENDS[name] = unsupported_reason
+        else:
+            BACKENDS[name] = function
+        return function
+    return register
+
+
+def copy_source(paths):
+    """The COPY source for a set of part files: the single file, or a glob over <prefix>_*<extension>."""
+    if len(paths) == 1:
+        return paths[0]
+    prefix, extension = os.path.splitext(paths[0])
+    return f"{prefix.rsplit('_', 1)[0]}_*{extension}"
+
+
+def read_parts(paths):
+    """Read all part files of a table into one Arrow table."""
+    return pa.concat_tables(pq.read_table(path) for path in paths).replace_schema_metadata(None)
+
+
+@backend("parquet")
+def load_parquet(conn, table_name, parts, work_dir, options):
+    start_time = time.time()
+    conn.execute(copy_statement(table_name, copy_source(parts)))
+    return dataset_row_count(parts), 0.0, time.time() - start_time
+
+
+@backend("csv")
+def load_csv(conn, table_name, parts, work_dir, options):
+    # Converting the Parquet parts to CSV is preparation, only the COPY is timed as the load
+    start_time = time.time()
+    csv_parts = []
+    for path in parts:
+        csv_path = os.path.join(work_dir, os.path.basename(path).replace('.parquet', '.csv'))
+        pcsv.write_csv(pq.read_table(path), csv_path)
+        csv_parts.append(csv_path)
+    prepare_seconds = time.time() - start_time
+
+    csv_options = {"PARALLEL": "true" if options.get("csv_parallel", True) else "false"}
+    start_time = time.time()
+    conn.execute(copy_statement(table_name, copy_source(csv_parts), csv_options))
+    return dataset_row_count(parts), prepare_seconds, time.time() - start_time
+
+
+@backend("pandas", None if KUZU_VERSION >= SCAN_MIN_KUZU_VERSION else SCAN_REQUIREMENT)
+def load_pandas(conn, table_name, parts, work_dir, options):
+    start_time = time.time()
+    # Object columns: the DataFrame scan of KuzuDB does not understand the Arrow-backed string dtype
+    df = read_parts(parts).to_pandas().astype(object)
+    prepare_seconds = time.time() - start_time
+
+    # KuzuDB resolves `df` from the calling frame
+    start_time = time.time()
+    conn.execute(f"COPY {table_name} FROM df")
+    return len(df), prepare_seconds, time.time() - start_time
+
+
+@backend("arrow", SCAN_REQUIREMENT if KUZU_VERSION < SCAN_MIN_KUZU_VERSION else
+         None if find_spec('polars') else "needs polars installed for kuzu's Arrow scan")
+def load_arrow(conn, table_name, parts, work_dir, options):
+    start_time = time.time()
+    arrow_table = read_parts(parts)
+    prepare_seconds = time.time() - start_time
+
+    # KuzuDB resolves `arrow_table` from the calling frame
+    start_time = time.time()
+    conn.execute(f"COPY {table_name} FROM arrow_table")
+    return arrow_table.num_rows, prepare_seconds, time.time() - start_time
+
+
+def parameter(columns, column):
+    """Positional $p<index> parameter of a Parquet column, so any column name makes a valid parameter."""
+    return f"$p{columns.index(column)}"
+
+
+def positional_parameters(columns, row):
+    """Parameters of a create or merge statement for a {column: value} row, keyed p<index> in the Parquet column order."""
+    return {f"p{index}": row[column] for index, column in enumerate(columns)}
+
+
+def execute_parameterized(conn, statement, parameters):
+    """Execute a query or prepared statement with a parameter dict, returning its result.
+
+    Older versions (0.0.x) take parameters as a list of (name, value) tuples, so a dict they reject is retried as one.
+    """
+    try:
+        return conn.execute(statement, parameters)
+    except (TypeError, RuntimeError) as e:
+        if not parameters or 'dict' not in str(e).lower():
+            raise
+        return conn.execute(statement, list(parameters.items()))
+
+
+def endpoint_match(table_name, columns):
+    """MATCH of the two endpoint nodes of a relationship by their keys."""
+    (from_column, from_table), (to_column, to_table) = REL_ENDPOINTS[table_name]
+    return (f"MATCH (a:{quote_identifier(from_table)}), (b:{quote_identifier(to_table)}) "
+            f"WHERE a.{quote_identifier(NODE_KEYS[from_table])} = {parameter(columns, from_column)} "
+            f"AND b.{quote_identifier(NODE_KEYS[to_table])} = {parameter(columns, to_column)}")
+
+
+def create_statement(table_name, columns):
+    """Parameterized CREATE of one node or relationship, with one $p<index> parameter per Parquet column."""
+    if table_name in NODE_KEYS:
+        properties = ", ".join(f"{quote_identifier(column)}: {parameter(columns, column)}" for column in columns)
+        return f"CREATE (n:{quote_identifier(table_name)} {{{properties}}})"
+    endpoints = [column for column, _ in REL_ENDPOINTS[table_name]]
+    properties = ", ".join(f"{quote_identifier(column)}: {parameter(columns, column)}" for column in columns if column not in endpoints)
+    properties = f" {{{properties}}}" if properties else ""
+    return f"{endpoint_match(table_name, columns)} CREATE (a)-[r:{quote_identifier(table_name)}{properties}]->(b)"
+
+
+def merge_statement(table_name, columns):
+    """Parameterized MERGE on the node key (or endpoint pair) that SETs the remaining columns."""
+    if table_name in NODE_KEYS:
+        key = NODE_KEYS[table_name]
+        merge = f"MERGE (n:{quote_identifier(table_name)} {{{quote_identifier(key)}: {parameter(columns, key)}}})"
+        assignments = [f"n.{quote_identifier(column)} = {parameter(columns, column)}" for column in columns if column != key]
+    else:
+        endpoints = [column for column, _ in REL_ENDPOINTS[table_name]]
+        merge = f"{endpoint_match(table_name, columns)} MERGE (a)-[r:{quote_identifier(table_name)}]->(b)"
+        assignments = [f"r.{quote_identifier(column)} = {parameter(columns, column)}" for column in columns if column not in endpoints]
+    return f"{merge} SET {', '.join(assignments)}" if assignments else merge
+
+
+def load_prepared(conn, table_name, parts, statement, batch_size):
+    """Execute a prepared statement once per row, committing every `batch_size` rows.
+
+    Parameters are positional ($p0, $p1, ...) in the column order of the Parquet files.
+    """
+    rows = 0
+    start_time = time.time()
+    for path in parts:
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+            conn.execute("BEGIN TRANSACTION")
+            try:
+                # Prepared inside the transaction: older versions open an implicit one when preparing outside it
+                prepared_statement = conn.prepare(statement)
+                for row in zip(*batch.to_pydict().values()):
+                    execute_parameterized(conn, prepared_statement, {f"p{index}": value for index, value in enumerate(row)})
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            rows += batch.num_rows
+    return rows, 0.0, time.time() - start_time
+
+
+@backend("prepared_create")
+def load_prepared_create(conn, table_name, parts, work_dir, options):
+    columns = list(read_parquet_footer(parts[0])['schema'].names)
+    return load_prepared(conn, table_name, parts, create_statement(table_name, columns), options.get("batch_size", 10000))
+
+
+@backend("prepared_merge")
+def load_prepared_merge(conn, table_name, parts, work_dir, options):
+    columns = list(read_parquet_footer(parts[0])['schema'].names)
+    return load_prepared(conn, table_name, parts, merge_statement(table_name, columns), options.get("batch_size", 10000))
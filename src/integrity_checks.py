@@ -0,0 +1,121 @@
+import time
+import logging
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+
+# Number of offending keys kept per failed check for the report
+MAX_EXAMPLES = 5
+
+
+def iter_column_batches(paths, column, batch_size):
+    """Stream one column of a set of Parquet part files as Arrow arrays, one row group batch at a time."""
+    for path in paths:
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size, columns=[column]):
+            yield batch.column(0)
+
+
+def read_unique_keys(paths, column, batch_size):
+    """Distinct values of a column, deduplicated per batch so only the key set is held in memory."""
+    chunks = [pc.unique(batch) for batch in iter_column_batches(paths, column, batch_size)]
+    if not chunks:
+        return pa.array([], type=pa.string())
+    return pc.unique(pa.chunked_array(chunks).combine_chunks())
+
+
+def check_result(check, table_name, column, rows, violations, examples, start_time):
+    status = "pass" if violations == 0 else "fail"
+    result = {
+        "Check": check,
+        "Table": table_name,
+        "Column": column,
+        "Status": status,
+        "Rows": rows,
+        "Violations": violations,
+        "Examples": [str(example) for example in examples[:MAX_EXAMPLES]],
+        "Seconds": time.time() - start_time,
+    }
+    if status == "fail":
+        logging.error(f"Integrity check failed: {check} on {table_name}.{column}, {violations:,} violations "
+                      f"(e.g. {', '.join(result['Examples'])}).")
+    else:
+        logging.info(f"Integrity check passed: {check} on {table_name}.{column} ({rows:,} rows, {result['Seconds']:.2f} seconds).")
+    return result
+
+
+def check_primary_key(paths, table_name, column, batch_size):
+    """Check a node table's primary key column for nulls and duplicates, one batch at a time.
+
+    Each batch is deduplicated like read_unique_keys and matched against the keys of the earlier batches, so only
+    the key set is held in memory and duplicates are logged as they are found. Returns (result, unique_keys) so
+    the keys can be reused by the referential checks.
+    """
+    start_time = time.time()
+    rows, null_count, duplicate_rows = 0, 0, 0
+    examples = []
+    unique_keys = None
+    for batch in iter_column_batches(paths, column, batch_size):
+        counts = pc.value_counts(batch.drop_null())
+        values = counts.field('values')
+        # Every duplicated key counts as one violation per extra row: all its rows if an earlier batch had it
+        repeated = pc.subtract(counts.field('counts'), 1)
+        if unique_keys is not None:
+            seen = pc.is_in(values, value_set=unique_keys)
+            repeated = pc.if_else(seen, counts.field('counts'), repeated)
+            values_added = values.filter(pc.invert(seen))
+        else:
+            values_added = values
+        batch_duplicates = int(pc.sum(repeated).as_py() or 0)
+        if batch_duplicates:
+            duplicated = values.filter(pc.greater(repeated, 0))
+            logging.warning(f"Duplicate {table_name}.{column} keys in rows {rows:,}-{rows + len(batch) - 1:,}: "
+                            f"{batch_duplicates:,} rows (e.g. {', '.join(str(key) for key in duplicated[:MAX_EXAMPLES].to_pylist())}).")
+            examples.extend(duplicated[:max(MAX_EXAMPLES - len(examples), 0)].to_pylist())
+        unique_keys = values_added if unique_keys is None else pa.concat_arrays([unique_keys, values_added])
+        rows += len(batch)
+        null_count += batch.null_count
+        duplicate_rows += batch_duplicates
+
+    if unique_keys is None:
+        unique_keys = pa.array([], type=pa.string())
+    # Plus one violation per null key
+    violations = null_count + duplicate_rows
+    examples = (["null"] if null_count else []) + examples
+    return check_result("primary key unique", table_name, column, rows, violations, examples, start_time), unique_keys
+
+
+def check_foreign_key(paths, table_name, column, node_keys, node_table, batch_size):
+    """Check that every value of a relationship endpoint column exists in the node keys.
+
+    The distinct endpoint keys are matched against the node keys with one is_in; only if some are
+    dangling is the column scanned again to count the affected rows.
+    """
+    start_time = time.time()
+    endpoint_keys = read_unique_keys(paths, column, batch_size)
+    dangling_keys = endpoint_keys.filter(pc.invert(pc.is_in(endpoint_keys, value_set=node_keys)))
+    rows = 0
+    violations = 0
+    for batch in iter_column_batches(paths, column, batch_size):
+        rows += len(batch)
+        if len(dangling_keys):
+            violations += pc.sum(pc.is_in(batch, value_set=dangling_keys)).as_py() or 0
+    return check_result(f"references {node_table}", table_name, column, rows, violations, dangling_keys.to_pylist(), start_time)
+
+
+def run_integrity_checks(node_tables, rel_tables, batch_size=1000000):
+    """Run primary key checks on node tables, then referential checks on relationship tables.
+
+    node_tables maps a table name to (part paths, primary key column); rel_tables maps a table name
+    to (part paths, {endpoint column: node table name}). Returns the list of check results.
+    """
+    results = []
+    node_keys = {}
+    for table_name, (paths, column) in node_tables.items():
+        result, node_keys[table_name] = check_primary_key(paths, table_name, column, batch_size)
+        results.append(result)
+
+    for table_name, (paths, endpoints) in rel_tables.items():
+        for column, node_table in endpoints.items():
+            results.append(check_foreign_key(paths, table_name, column, node_keys[node_table], node_table, batch_size))
+    return results
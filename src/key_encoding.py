@@ -0,0 +1,80 @@
+import math
+import string
+import numpy as np
+import pyarrow as pa
+
+
+# Alphabets used by the key format placeholders, matching Faker's bothify ('#' digit, '?' ASCII letter)
+FORMAT_ALPHABETS = {
+    '#': string.digits,
+    '?': string.ascii_letters,
+}
+
+INT64_FORMAT = 'int64'
+
+
+def format_capacity(id_format, num_records=None):
+    """Return the number of distinct keys a format can encode (the total record count for INT64 keys)."""
+    if id_format == INT64_FORMAT:
+        return num_records
+    return math.prod(len(FORMAT_ALPHABETS[char]) for char in id_format if char in FORMAT_ALPHABETS)
+
+
+def scramble_multiplier(capacity, seed):
+    """Pick a multiplier coprime with the capacity so that (a * i + b) % capacity is a bijection.
+
+    Returns (1, 0), i.e. plain counter order, when a scrambled product could overflow INT64.
+    """
+    bound = min(capacity, (2 ** 63 - 1) // max(capacity, 1))
+    if bound <= 2:
+        return 1, 0
+    rng = np.random.default_rng(seed)
+    while True:
+        a = int(rng.integers(2, bound))
+        if math.gcd(a, capacity) == 1:
+            return a, int(rng.integers(0, capacity))
+
+
+def encode_ids(counters, id_format, capacity, multiplier=(1, 0)):
+    """Encode row counters bijectively into keys of the given format as an Arrow array.
+
+    Each counter is first permuted with an affine map modulo the capacity, then written digit by digit
+    in the mixed radix defined by the format's placeholders; other characters are copied literally.
+    """
+    a, b = multiplier
+    values = (np.asarray(counters, dtype=np.int64) * a + b) % capacity
+    if id_format == INT64_FORMAT:
+        return pa.array(values, type=pa.int64())
+
+    chars = np.empty((len(values), len(id_format)), dtype=np.uint8)
+    remaining = values.copy()
+    # Fill placeholders from the rightmost (least significant) position
+    for position in range(len(id_format) - 1, -1, -1):
+        char = id_format[position]
+        if char in FORMAT_ALPHABETS:
+            alphabet = np.frombuffer(FORMAT_ALPHABETS[char].encode(), dtype=np.uint8)
+            remaining, digit = np.divmod(remaining, len(alphabet))
+            chars[:, position] = alphabet[digit]
+        else:
+            chars[:, position] = ord(char)
+    return pa.array(chars.view(f'S{len(id_format)}').ravel()).cast(pa.string())
+
+
+def make_id_generator(id_format, num_records, seed, row_offset=0):
+    """Return a column generator producing the keys of consecutive rows, starting at row_offset.
+
+    The key of a row depends only on its global row number, so shards generated independently
+    (in any process, in any order) never collide and need no uniqueness bookkeeping.
+    """
+    capacity = format_capacity(id_format, num_records)
+    if num_records > capacity:
+        raise ValueError(f"ID format {id_format!r} can encode {capacity:,} keys, {num_records:,} requested")
+    multiplier = scramble_multiplier(capacity, seed)
+    next_row = [row_offset]
+
+    def generator(n):
+        counters = np.arange(next_row[0], next_row[0] + n, dtype=np.int64)
+        next_row[0] += n
+        return encode_ids(counters, id_format, capacity, multiplier)
+
+    return generator
@@ -3,6 +3,12 @@ import os
 import logging
 import test_create_test_data
 import test_ingress_load_kuzudb
+import query_benchmark
+import upsert_benchmark
+import concurrent_reads
+import scaling_curve
+import column_sweep
+import topology_benchmark
 
 
 
@@ -16,7 +22,7 @@ def main():
     try:
         # Generate test data
         logging.info("Generating test data...")
-        test_create_test_data.main()
+        data_dir = test_create_test_data.main()
         logging.info("Finished generating test data.")
     except Exception as e:
         logging.error(f"An error occurred while generating test data: {e}")
@@ -26,13 +32,67 @@ def main():
     try:
         # Load Kuzu test data
         logging.info("Creating and loading Kuzu test data...")
-        test_ingress_load_kuzudb.main()
+        test_ingress_load_kuzudb.main(data_dir)
         logging.info("Kuzu test data processing completed.")
     except Exception as e:
         logging.error(f"An error occurred while processing Kuzu test data: {e}")
         # Optionally, exit the script if you don't want to proceed after a failure
         sys.exit(1)
 
+    try:
+        # Benchmark queries against the loaded graph
+        logging.info("Running Kuzu query benchmark...")
+        query_benchmark.main(data_dir)
+        logging.info("Kuzu query benchmark completed.")
+    except Exception as e:
+        logging.error(f"An error occurred while benchmarking Kuzu queries: {e}")
+        sys.exit(1)
+
+    try:
+        # Measure read throughput as a function of concurrency
+        logging.info("Running Kuzu concurrent read benchmark...")
+        concurrent_reads.main(data_dir)
+        logging.info("Kuzu concurrent read benchmark completed.")
+    except Exception as e:
+        logging.error(f"An error occurred while benchmarking concurrent Kuzu reads: {e}")
+        sys.exit(1)
+
+    try:
+        # Benchmark incremental writes; runs after the query benchmark since it changes the graph
+        logging.info("Running Kuzu upsert benchmark...")
+        upsert_benchmark.main(data_dir)
+        logging.info("Kuzu upsert benchmark completed.")
+    except Exception as e:
+        logging.error(f"An error occurred while benchmarking Kuzu upserts: {e}")
+        sys.exit(1)
+
+    try:
+        # Load a geometric series of dataset sizes into fresh databases, separate from the graph above
+        logging.info("Running Kuzu scaling curve...")
+        scaling_curve.main()
+        logging.info("Kuzu scaling curve completed.")
+    except Exception as e:
+        logging.error(f"An error occurred while measuring the Kuzu scaling curve: {e}")
+        sys.exit(1)
+
+    try:
+        # Load the same data volume spread over an increasing number of property columns
+        logging.info("Running Kuzu wide table sweep...")
+        column_sweep.main()
+        logging.info("Kuzu wide table sweep completed.")
+    except Exception as e:
+        logging.error(f"An error occurred while running the Kuzu wide table sweep: {e}")
+        sys.exit(1)
+
+    try:
+        # Load graphs with many node labels and rel types, and time multi-hop path queries across them
+        logging.info("Running Kuzu topology benchmark...")
+        topology_benchmark.main()
+        logging.info("Kuzu topology benchmark completed.")
+    except Exception as e:
+        logging.error(f"An error occurred while running the Kuzu topology benchmark: {e}")
+        sys.exit(1)
+
 
     logging.info("Game Over...")
 
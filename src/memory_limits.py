@@ -0,0 +1,140 @@
+import os
+import queue
+import logging
+import resource
+import multiprocessing
+import psutil
+
+
+CGROUP_ROOT = '/sys/fs/cgroup'
+METHODS = ['cgroup', 'rlimit', 'rss']
+
+
+def cgroup_v2_dir():
+    """The cgroup v2 directory of this process if the memory controller can be used below it, else None."""
+    try:
+        with open('/proc/self/cgroup', 'r') as f:
+            lines = f.read().splitlines()
+        if not os.path.exists(os.path.join(CGROUP_ROOT, 'cgroup.controllers')):
+            return None
+        relative_path = next(line.split('::', 1)[1] for line in lines if line.startswith('0::'))
+        directory = os.path.join(CGROUP_ROOT, relative_path.lstrip('/'))
+        with open(os.path.join(directory, 'cgroup.subtree_control'), 'r') as f:
+            return directory if 'memory' in f.read().split() and os.access(directory, os.W_OK) else None
+    except (OSError, StopIteration):
+        return None
+
+
+def resolve_method(method):
+    """Pick the cap enforcement: 'auto' uses a cgroup v2 memory limit where available and an RSS watchdog otherwise."""
+    if method == 'auto':
+        return 'cgroup' if cgroup_v2_dir() else 'rss'
+    if method not in METHODS:
+        raise ValueError(f"Unknown memory limit method {method}, expected auto or one of: {', '.join(METHODS)}")
+    if method == 'cgroup' and not cgroup_v2_dir():
+        raise ValueError("cgroup v2 with a writable memory controller is not available")
+    return method
+
+
+def create_cgroup(pid, cap_bytes):
+    """Put a process in a new child cgroup whose memory (without swap) is capped at cap_bytes."""
+    directory = os.path.join(cgroup_v2_dir(), f'kuzu_memory_probe_{pid}')
+    os.makedirs(directory, exist_ok=True)
+    for name, value in [('memory.max', cap_bytes), ('memory.swap.max', 0), ('cgroup.procs', pid)]:
+        with open(os.path.join(directory, name), 'w') as f:
+            f.write(str(value))
+    return directory
+
+
+def process_rss(pid):
+    """RSS of a process and its children in bytes, 0 once it has exited."""
+    try:
+        process = psutil.Process(pid)
+        return process.memory_info().rss + sum(child.memory_info().rss for child in process.children(recursive=True))
+    except psutil.Error:
+        return 0
+
+
+def _capped_child(target, args, method, cap_bytes, start_event, result_queue):
+    if method == 'rlimit':
+        resource.setrlimit(resource.RLIMIT_AS, (cap_bytes, cap_bytes))
+    # Wait until the parent has moved this process into its cgroup
+    start_event.wait()
+    try:
+        result_queue.put((True, target(*args)))
+    except BaseException as e:
+        result_queue.put((False, f"{type(e).__name__}: {e}"))
+
+
+def run_capped(target, args, cap_bytes, method, poll_interval=0.05):
+    """Run target(*args) in a child process limited to cap_bytes of memory.
+
+    'cgroup' sets memory.max on a cgroup v2 child group, 'rlimit' caps the address space with
+    RLIMIT_AS (versions that reserve large virtual ranges fail at any cap) and 'rss' kills the
+    child once its sampled RSS exceeds the cap. Returns (ok, result or error message, peak RSS bytes).
+    """
+    start_event = multiprocessing.Event()
+    result_queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_capped_child, args=(target, args, method, cap_bytes, start_event, result_queue))
+    process.start()
+    cgroup_dir = create_cgroup(process.pid, cap_bytes) if method == 'cgroup' else None
+    start_event.set()
+
+    peak_rss = 0
+    exceeded = False
+    outcome = None
+    try:
+        while process.is_alive():
+            rss = process_rss(process.pid)
+            peak_rss = max(peak_rss, rss)
+            if method == 'rss' and rss > cap_bytes:
+                exceeded = True
+                process.kill()
+                break
+            try:
+                outcome = result_queue.get(timeout=poll_interval)
+                break
+            except queue.Empty:
+                pass
+        process.join()
+        if outcome is None:
+            try:
+                outcome = result_queue.get(timeout=1)
+            except queue.Empty:
+                reason = "RSS exceeded the cap" if exceeded else f"killed with exit code {process.exitcode}"
+                outcome = (False, reason)
+    finally:
+        if cgroup_dir:
+            try:
+                os.rmdir(cgroup_dir)
+            except OSError as e:
+                logging.warning(f"Could not remove cgroup {cgroup_dir}: {e}")
+    return outcome[0], outcome[1], peak_rss
+
+
+def search_minimum(probe, low, high, tolerance):
+    """Binary-search the smallest cap in [low, high] for which probe(cap) succeeds, to within tolerance.
+
+    probe returns (ok, detail, peak_rss_bytes). Returns (minimum or None, status, probes) where status
+    is 'found', 'passes at min' or 'fails at max'.
+    """
+    probes = []
+
+    def attempt(cap):
+        ok, detail, peak_rss = probe(cap)
+        probes.append({"Cap (MB)": cap, "Status": "pass" if ok else "fail", "Peak RSS (MB)": round(peak_rss / 1024 ** 2),
+                       "Error": None if ok else str(detail)})
+        logging.info(f"Memory cap {cap} MB: {'pass' if ok else 'fail'}.")
+        return ok
+
+    if not attempt(high):
+        return None, 'fails at max', probes
+    if attempt(low):
+        return low, 'passes at min', probes
+    while high - low > tolerance:
+        middle = (low + high) // 2
+        if attempt(middle):
+            high = middle
+        else:
+            low = middle
+    return high, 'found', probes
@@ -0,0 +1,56 @@
+import os
+import itertools
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+CODECS = ['none', 'snappy', 'zstd', 'lz4', 'gzip', 'brotli']
+
+
+def layout_variants(codecs, row_group_sizes, dictionary, statistics):
+    """Every combination of codec, row group size, dictionary encoding and statistics, as writer settings."""
+    for codec in codecs:
+        if codec not in CODECS:
+            raise ValueError(f"Unknown Parquet codec {codec}, expected one of: {', '.join(CODECS)}")
+    return [{"Codec": codec, "Row Group Size": row_group_size, "Dictionary": use_dictionary, "Statistics": write_statistics}
+            for codec, row_group_size, use_dictionary, write_statistics
+            in itertools.product(codecs, row_group_sizes, dictionary, statistics)]
+
+
+def variant_name(variant):
+    return (f"{variant['Codec']}_rg{variant['Row Group Size']}_"
+            f"{'dict' if variant['Dictionary'] else 'plain'}_{'stats' if variant['Statistics'] else 'nostats'}")
+
+
+def rewrite_part(source_path, target_path, variant, batch_size=1000000):
+    """Rewrite one Parquet file with a variant's layout, streaming batches so no whole file is held in memory.
+
+    Batches are buffered until a full row group is available, so every row group but the last has exactly
+    the variant's row group size regardless of the row groups of the source file.
+    """
+    row_group_size = variant["Row Group Size"]
+    source = pq.ParquetFile(source_path)
+    schema = source.schema_arrow.remove_metadata()
+    pending = []
+    pending_rows = 0
+    with pq.ParquetWriter(target_path, schema, compression=variant["Codec"], use_dictionary=variant["Dictionary"],
+                          write_statistics=variant["Statistics"]) as writer:
+        for batch in source.iter_batches(batch_size=batch_size):
+            pending.append(batch)
+            pending_rows += batch.num_rows
+            if pending_rows >= row_group_size:
+                table = pa.Table.from_batches(pending, schema=schema)
+                full_rows = pending_rows - pending_rows % row_group_size
+                writer.write_table(table.slice(0, full_rows), row_group_size=row_group_size)
+                pending = table.slice(full_rows).to_batches()
+                pending_rows -= full_rows
+        if pending_rows:
+            writer.write_table(pa.Table.from_batches(pending, schema=schema), row_group_size=row_group_size)
+    return os.path.getsize(target_path)
+
+
+def rewrite_dataset(source_parts, target_dir, variant):
+    """Rewrite every part file of a dataset into target_dir under the same names, returning the bytes per table."""
+    os.makedirs(target_dir, exist_ok=True)
+    return {table_name: sum(rewrite_part(path, os.path.join(target_dir, os.path.basename(path)), variant) for path in parts)
+            for table_name, parts in source_parts.items()}
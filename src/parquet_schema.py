@@ -0,0 +1,84 @@
+import os
+import logging
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+# Footer summaries keyed by file fingerprint, so a rewritten file is introspected again
+_FOOTER_CACHE = {}
+
+
+def file_fingerprint(path):
+    """Identify a file version by absolute path, size and modification time."""
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_size, stat.st_mtime_ns
+
+
+def kuzu_column_type(arrow_type):
+    """Map an Arrow type to the KuzuDB column type used in CREATE TABLE statements."""
+    if pa.types.is_boolean(arrow_type):
+        return "BOOLEAN"
+    if pa.types.is_integer(arrow_type):
+        return "INT64"
+    if pa.types.is_floating(arrow_type) or pa.types.is_decimal(arrow_type):
+        return "DOUBLE"
+    if pa.types.is_date(arrow_type):
+        return "DATE"
+    if pa.types.is_timestamp(arrow_type):
+        return "TIMESTAMP"
+    return "STRING"
+
+
+def quote_identifier(name):
+    """Backtick-quote a table or column name, so wide or spec-defined tables can use names that are Cypher keywords."""
+    return f"`{name}`"
+
+
+def _column_statistics(metadata):
+    """Aggregate per-row-group column statistics into per-column null counts and min/max values."""
+    statistics = {}
+    for row_group_index in range(metadata.num_row_groups):
+        row_group = metadata.row_group(row_group_index)
+        for column_index in range(row_group.num_columns):
+            column = row_group.column(column_index)
+            name = column.path_in_schema
+            entry = statistics.setdefault(name, {'null_count': 0, 'min': None, 'max': None, 'has_statistics': True})
+            stats = column.statistics
+            if stats is None or not stats.has_min_max:
+                entry['has_statistics'] = False
+                continue
+            entry['null_count'] += stats.null_count or 0
+            entry['min'] = stats.min if entry['min'] is None else min(entry['min'], stats.min)
+            entry['max'] = stats.max if entry['max'] is None else max(entry['max'], stats.max)
+    return statistics
+
+
+def read_parquet_footer(path):
+    """Read only the footer metadata of a Parquet file: schema, row counts and column statistics.
+
+    Returns a dict with 'schema' (pyarrow.Schema), 'num_rows', 'num_row_groups' and 'columns'
+    (name -> {'kuzu_type', 'null_count', 'min', 'max', 'has_statistics'}). Results are cached per fingerprint.
+    """
+    fingerprint = file_fingerprint(path)
+    if fingerprint in _FOOTER_CACHE:
+        return _FOOTER_CACHE[fingerprint]
+
+    parquet_file = pq.ParquetFile(path)
+    metadata = parquet_file.metadata
+    schema = parquet_file.schema_arrow
+    statistics = _column_statistics(metadata)
+    footer = {
+        'schema': schema,
+        'num_rows': metadata.num_rows,
+        'num_row_groups': metadata.num_row_groups,
+        'columns': {field.name: {'kuzu_type': kuzu_column_type(field.type), **statistics.get(field.name, {})}
+                    for field in schema},
+    }
+    _FOOTER_CACHE[fingerprint] = footer
+    logging.debug(f"Read Parquet footer of {path}: {footer['num_rows']:,} rows in {footer['num_row_groups']} row groups.")
+    return footer
+
+
+def dataset_row_count(paths):
+    """Total row count of a set of Parquet part files, taken from their footers."""
+    return sum(read_parquet_footer(path)['num_rows'] for path in paths)
@@ -0,0 +1,157 @@
+import os
+import time
+import logging
+import numpy as np
+import pyarrow.parquet as pq
+import kuzu
+from dotenv import load_dotenv
+from parquet_schema import read_parquet_footer
+from ingestion_backends import execute_parameterized
+from test_create_test_data import DATASET_DIR
+from test_ingress_load_kuzudb import DATABASE_NAME, LOAD_MODE, dataset_paths, update_dashboard_data
+
+
+
+load_dotenv()
+
+QUERY_BENCHMARK = os.getenv('QUERY_BENCHMARK', 'true').lower() == 'true'
+QUERY_WARMUP_ITERATIONS = int(os.getenv('QUERY_WARMUP_ITERATIONS', 3))
+QUERY_ITERATIONS = int(os.getenv('QUERY_ITERATIONS', 20))
+QUERY_PARAMETER_SAMPLE_SIZE = int(os.getenv('QUERY_PARAMETER_SAMPLE_SIZE', 100))
+QUERY_SEED = int(os.getenv('GENERATION_SEED', 42))
+
+# Each query names the dataset column its $value parameter is drawn from, or None for parameterless queries
+QUERIES = {
+    "person_lookup": {
+        "query": "MATCH (p:Person) WHERE p.person_id = $value RETURN p;",
+        "parameter": ("Person", "person_id"),
+    },
+    "company_lookup": {
+        "query": "MATCH (c:Company) WHERE c.company_id = $value RETURN c;",
+        "parameter": ("Company", "company_id"),
+    },
+    "one_hop": {
+        "query": "MATCH (p:Person)-[:WorksAt]->(c:Company) WHERE p.person_id = $value RETURN c.company_id;",
+        "parameter": ("Person", "person_id"),
+    },
+    "two_hop": {
+        "query": "MATCH (p:Person)-[:WorksAt]->(c:Company)<-[:WorksAt]-(q:Person) WHERE p.person_id = $value "
+                 "RETURN COUNT(DISTINCT q.person_id) AS Colleagues;",
+        "parameter": ("Person", "person_id"),
+    },
+    "company_employee_counts": {
+        "query": "MATCH (p:Person)-[:WorksAt]->(c:Company) RETURN c.company_id, COUNT(p) AS Employees "
+                 "ORDER BY Employees DESC LIMIT 10;",
+        "parameter": None,
+    },
+    "company_property_scan": {
+        "query": "MATCH (c:Company) WHERE c.property_1 = $value RETURN COUNT(c) AS Companies;",
+        "parameter": ("Company", "property_1"),
+    },
+}
+QUERY_WORKLOAD = [name.strip() for name in os.getenv('QUERY_WORKLOAD', ','.join(QUERIES)).split(',') if name.strip()]
+
+
+# Draws a reproducible sample of values from a dataset column to use as query parameters
+def sample_parameter_values(path, column, sample_size=QUERY_PARAMETER_SAMPLE_SIZE, seed=QUERY_SEED):
+    values = pq.read_table(path, columns=[column]).column(column).drop_null()
+    if len(values) == 0:
+        return []
+    indices = np.random.default_rng(seed).integers(0, len(values), size=min(sample_size, len(values)))
+    return values.take(indices).to_pylist()
+
+# Runs a query and consumes every result row, returning the row count
+def execute_query(conn, query, parameters):
+    result = execute_parameterized(conn, query, parameters)
+    rows = 0
+    while result.has_next():
+        result.get_next()
+        rows += 1
+    return rows
+
+def latency_percentiles(latencies):
+    latencies_ms = np.array(latencies) * 1000
+    return {
+        "p50 (ms)": float(np.percentile(latencies_ms, 50)),
+        "p95 (ms)": float(np.percentile(latencies_ms, 95)),
+        "p99 (ms)": float(np.percentile(latencies_ms, 99)),
+        "Mean (ms)": float(latencies_ms.mean()),
+    }
+
+# Runs one query with warmup and timed iterations, cycling through its parameter values
+def benchmark_query(conn, name, query, parameter_values, warmup=QUERY_WARMUP_ITERATIONS, iterations=QUERY_ITERATIONS):
+    parameter_sets = [{"value": value} for value in parameter_values] if parameter_values is not None else [{}]
+    result = {"Query": name, "Cypher": query, "Warmup": warmup, "Iterations": iterations}
+    try:
+        for i in range(warmup):
+            execute_query(conn, query, parameter_sets[i % len(parameter_sets)])
+
+        latencies = []
+        rows = 0
+        for i in range(iterations):
+            start_time = time.perf_counter()
+            rows += execute_query(conn, query, parameter_sets[i % len(parameter_sets)])
+            latencies.append(time.perf_counter() - start_time)
+    except Exception as e:
+        logging.error(f"Query benchmark {name} failed. Error details: {e}")
+        return {**result, "Status": "fail", "Error": str(e)}
+
+    result.update(latency_percentiles(latencies))
+    result.update({
+        "Throughput (Queries/sec)": iterations / sum(latencies) if sum(latencies) > 0 else None,
+        "Mean Rows": rows / iterations,
+        "Status": "pass",
+        "Error": None,
+    })
+    logging.info(f"Query {name}: p50 {result['p50 (ms)']:.2f} ms, p95 {result['p95 (ms)']:.2f} ms, "
+                 f"p99 {result['p99 (ms)']:.2f} ms, {result['Throughput (Queries/sec)'] or 0:,.0f} queries/sec.")
+    return result
+
+# Resolves the configured workload to {name: parameter values (None for parameterless queries)},
+# skipping unknown queries and queries whose parameter column is missing from the dataset
+def workload_parameters(paths, workload=QUERY_WORKLOAD):
+    parameters = {}
+    for name in workload:
+        if name not in QUERIES:
+            logging.error(f"Unknown query {name} in QUERY_WORKLOAD, expected one of: {', '.join(QUERIES)}")
+            continue
+        spec = QUERIES[name]
+        parameter_values = None
+        if spec["parameter"]:
+            table_name, column = spec["parameter"]
+            if column not in read_parquet_footer(paths[table_name])['columns']:
+                logging.info(f"Skipping query {name}: the {table_name} data has no {column} column.")
+                continue
+            parameter_values = sample_parameter_values(paths[table_name], column)
+            if not parameter_values:
+                logging.info(f"Skipping query {name}: no {table_name}.{column} values to query for.")
+                continue
+        parameters[name] = parameter_values
+    return parameters
+
+# Runs the configured workload against a loaded database
+def run_query_benchmark(conn, paths, workload=QUERY_WORKLOAD):
+    return [benchmark_query(conn, name, QUERIES[name]["query"], parameter_values)
+            for name, parameter_values in workload_parameters(paths, workload).items()]
+
+def main(data_dir=None):
+    if not QUERY_BENCHMARK or LOAD_MODE != 'standard':
+        logging.info("Query benchmark disabled, skipping.")
+        return
+
+    database_dir = os.path.join(os.getenv('TEST_DATA_PATH'), DATABASE_NAME)
+    paths = dataset_paths(data_dir or DATASET_DIR)
+    try:
+        db = kuzu.Database(database_dir)
+        conn = kuzu.Connection(db)
+    except Exception as e:
+        logging.error(f"Failed to open {database_dir} for the query benchmark: {e}")
+        return
+
+    logging.info(f"Running query benchmark: {QUERY_WARMUP_ITERATIONS} warmup and {QUERY_ITERATIONS} timed iterations per query.")
+    results = run_query_benchmark(conn, paths)
+    update_dashboard_data({"query_benchmark": results})
+    logging.info("Query benchmark results saved to dashboard data.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import os
+import time
+import logging
+import threading
+from contextlib import contextmanager
+import psutil
+
+
+def directory_size(directory):
+    """Total size in bytes of all files below a directory (0 if it does not exist)."""
+    total = 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                # Files can disappear while KuzuDB rewrites them
+                pass
+    return total
+
+
+class ResourceSampler:
+    """Sample memory, CPU, disk I/O and database size on a background thread while a stage runs.
+
+    RSS includes child processes, so process-pool generation is covered. Disk I/O is taken from
+    the process counters where the platform has them and from the system counters otherwise.
+    """
+
+    def __init__(self, directory=None, interval=0.5):
+        self.directory = directory
+        self.interval = interval
+        self.samples = []
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _io_counters(self):
+        try:
+            counters = self._process.io_counters() if hasattr(self._process, 'io_counters') else psutil.disk_io_counters()
+        except (psutil.Error, OSError):
+            counters = None
+        return (counters.read_bytes, counters.write_bytes) if counters else (0, 0)
+
+    def _rss(self):
+        rss = self._process.memory_info().rss
+        for child in self._process.children(recursive=True):
+            try:
+                rss += child.memory_info().rss
+            except psutil.Error:
+                pass
+        return rss
+
+    def _sample(self):
+        read_bytes, write_bytes = self._io_counters()
+        self.samples.append({
+            "Time (Seconds)": round(time.time() - self._start_time, 3),
+            "RSS (Bytes)": self._rss(),
+            "CPU Percent Per Core": psutil.cpu_percent(percpu=True),
+            "Read (Bytes)": read_bytes - self._start_io[0],
+            "Write (Bytes)": write_bytes - self._start_io[1],
+            "Directory Size (Bytes)": directory_size(self.directory) if self.directory else None,
+        })
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self._sample()
+            except Exception as e:
+                logging.debug(f"Resource sample failed: {e}")
+
+    def __enter__(self):
+        self._start_time = time.time()
+        self._start_io = self._io_counters()
+        self._start_rss = self._rss()
+        # The first cpu_percent call only sets the baseline for the next one
+        psutil.cpu_percent(percpu=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+        return False
+
+    def summary(self):
+        """Peak and mean values over all samples."""
+        rss = [sample["RSS (Bytes)"] for sample in self.samples]
+        cpu = [sum(sample["CPU Percent Per Core"]) / max(len(sample["CPU Percent Per Core"]), 1) for sample in self.samples]
+        directory_sizes = [sample["Directory Size (Bytes)"] or 0 for sample in self.samples]
+        last = self.samples[-1] if self.samples else {}
+        return {
+            "Duration (Seconds)": last.get("Time (Seconds)", 0),
+            "Start RSS (Bytes)": self._start_rss,
+            "Peak RSS (Bytes)": max(rss, default=0),
+            "Mean RSS (Bytes)": sum(rss) / len(rss) if rss else 0,
+            "Peak CPU Percent": max(cpu, default=0),
+            "Mean CPU Percent": sum(cpu) / len(cpu) if cpu else 0,
+            "Read (Bytes)": last.get("Read (Bytes)", 0),
+            "Write (Bytes)": last.get("Write (Bytes)", 0),
+            "Peak Directory Size (Bytes)": max(directory_sizes, default=0),
+        }
+
+    def to_dict(self):
+        return {"summary": self.summary(), "samples": self.samples}
+
+
+@contextmanager
+def sample_stage(stage, results, directory=None, enabled=True, interval=0.5):
+    """Run the enclosed block under a ResourceSampler and store its summary and samples in results[stage]."""
+    if not enabled:
+        yield None
+        return
+    sampler = ResourceSampler(directory, interval)
+    try:
+        with sampler:
+            yield sampler
+    finally:
+        results[stage] = sampler.to_dict()
+        summary = results[stage]["summary"]
+        logging.info(f"{stage}: peak RSS {summary['Peak RSS (Bytes)'] / 1024 ** 2:,.0f} MB, "
+                     f"mean CPU {summary['Mean CPU Percent']:.0f}%, read {summary['Read (Bytes)'] / 1024 ** 2:,.0f} MB, "
+                     f"written {summary['Write (Bytes)'] / 1024 ** 2:,.0f} MB.")
@@ -0,0 +1,181 @@
+import os
+import sys
+import time
+import shutil
+import logging
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import numpy as np
+from dotenv import load_dotenv
+import dataset_cache
+from parquet_schema import dataset_row_count
+from test_create_test_data import DATASET_CACHE, NUM_COMPANIES, NUM_PERSONS, NUM_RELATIONSHIPS, TEST_DATA_PATH, generation_config
+from test_ingress_load_kuzudb import DATABASE_NAME, dataset_paths, list_parquet_parts, sampled_load, update_dashboard_data
+
+
+
+load_dotenv()
+
+SCALING_CURVE = os.getenv('SCALING_CURVE', 'false').lower() == 'true'
+SCALING_MIN_RELATIONSHIPS = int(os.getenv('SCALING_MIN_RELATIONSHIPS', 1000000))
+SCALING_MAX_RELATIONSHIPS = int(os.getenv('SCALING_MAX_RELATIONSHIPS', 45000000))
+SCALING_STEPS = int(os.getenv('SCALING_STEPS', 6))
+# An exponent more than this above 1 is reported as superlinear (and as sublinear below 1 minus it)
+SCALING_LINEAR_TOLERANCE = float(os.getenv('SCALING_LINEAR_TOLERANCE', 0.1))
+
+GENERATOR_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_create_test_data.py')
+TABLES = ["Person", "Company", "WorksAt"]
+
+
+def scaling_sizes():
+    """Geometric series of relationship counts from SCALING_MIN_RELATIONSHIPS to SCALING_MAX_RELATIONSHIPS."""
+    sizes = np.geomspace(SCALING_MIN_RELATIONSHIPS, SCALING_MAX_RELATIONSHIPS, max(SCALING_STEPS, 1))
+    return sorted({int(round(size)) for size in sizes})
+
+
+def scaled_counts(num_relationships):
+    """Node counts scaled with the relationships, keeping the configured nodes-per-relationship ratios."""
+    scale = num_relationships / NUM_RELATIONSHIPS
+    return {
+        'num_companies': max(1, round(NUM_COMPANIES * scale)),
+        'num_persons': max(1, round(NUM_PERSONS * scale)),
+        'num_relationships': num_relationships,
+    }
+
+
+def generate_dataset(counts):
+    """Generate (or reuse from the dataset cache) one size of the series in a child process.
+
+    The generator reads its settings at import time, so the sizes are passed as environment
+    overrides, which take precedence over the .env file. Returns (data_dir, cached, seconds).
+    """
+    config = {**generation_config(), **counts}
+    data_dir = dataset_cache.dataset_dir(TEST_DATA_PATH, config) if DATASET_CACHE else TEST_DATA_PATH
+    cached = DATASET_CACHE and dataset_cache.is_valid_dataset(data_dir, config)
+    env = {**os.environ, **{name.upper(): str(value) for name, value in counts.items()}}
+    start_time = time.time()
+    subprocess.run([sys.executable, GENERATOR_SCRIPT], env=env, check=True)
+    return data_dir, cached, time.time() - start_time
+
+
+def generate_and_load(counts, database_dir, label):
+    """Generate (or reuse) the dataset of `counts` and load it into a fresh database in a child process.
+
+    Returns the measurements the scaling curve and the wide table sweep share: the dataset, its rows per table,
+    load times, validation status, RSS and database size. A failed generation or load is recorded in Status and Error.
+    """
+    result = {"Status": "pass", "Error": None}
+    try:
+        data_dir, cached, generation_seconds = generate_dataset(counts)
+        paths = dataset_paths(data_dir)
+        table_rows = {table_name: dataset_row_count(list_parquet_parts(paths[table_name])) for table_name in TABLES}
+    except Exception as e:
+        logging.error(f"{label}: generation failed: {e}")
+        return {**result, "Status": "generation failed", "Error": str(e)}
+    result.update({"Dataset": data_dir, "Cached": cached, "Generation Time (Seconds)": generation_seconds,
+                   "Table Rows": table_rows, "Rows": sum(table_rows.values())})
+
+    logging.info(f"{label}: loading {result['Rows']:,} rows.")
+    try:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            load_times, summary, baseline_rss, database_bytes, validation = executor.submit(sampled_load, paths, database_dir).result()
+    except BrokenProcessPool:
+        return {**result, "Status": "crashed", "Error": "The loading process crashed"}
+    except Exception as e:
+        logging.error(f"{label}: loading failed: {e}")
+        return {**result, "Status": "fail", "Error": str(e)}
+
+    load_seconds = sum(item["Load Time (Seconds)"] for item in load_times)
+    result.update({
+        "Status": "pass" if all(item["Status"] == "match" for item in validation) else "mismatch",
+        "Load Time (Seconds)": load_seconds,
+        "Rows/sec": result["Rows"] / load_seconds if load_seconds > 0 else None,
+        "Table Load Times": load_times,
+        "Peak RSS (MB)": summary["Peak RSS (Bytes)"] / 1024 ** 2,
+        "Baseline RSS (MB)": baseline_rss / 1024 ** 2,
+        "Load Memory (MB)": max(summary["Peak RSS (Bytes)"] - baseline_rss, 0) / 1024 ** 2,
+        "Database Size (MB)": database_bytes / 1024 ** 2,
+    })
+    return result
+
+
+def run_size(num_relationships, scaling_dir):
+    counts = scaled_counts(num_relationships)
+    result = {
+        "Relationships": num_relationships,
+        "Persons": counts['num_persons'],
+        "Companies": counts['num_companies'],
+        **generate_and_load(counts, os.path.join(scaling_dir, str(num_relationships)), f"Scaling curve: {num_relationships:,} relationships"),
+    }
+    if "Load Time (Seconds)" in result:
+        logging.info(f"Scaling curve: {result['Rows']:,} rows in {result['Load Time (Seconds)']:.2f} seconds, "
+                     f"peak RSS {result['Peak RSS (MB)']:,.0f} MB.")
+    return result
+
+
+def fit_power_law(points):
+    """Least-squares fit of log(y) = exponent * log(x) + log(coefficient) over the positive points.
+
+    Returns (exponent, coefficient), or (None, None) with fewer than two distinct x values.
+    """
+    points = [(x, y) for x, y in points if x and y and x > 0 and y > 0]
+    if len({x for x, _ in points}) < 2:
+        return None, None
+    exponent, intercept = np.polyfit(np.log([x for x, _ in points]), np.log([y for _, y in points]), 1)
+    return float(exponent), float(np.exp(intercept))
+
+
+def scaling_class(exponent):
+    if exponent is None:
+        return "insufficient data"
+    if exponent > 1 + SCALING_LINEAR_TOLERANCE:
+        return "superlinear"
+    if exponent < 1 - SCALING_LINEAR_TOLERANCE:
+        return "sublinear"
+    return "linear"
+
+
+def fit_curves(sizes):
+    """Power-law exponents of the load time and memory against the row count, overall and per table."""
+    loaded = [size for size in sizes if size["Status"] == "pass"]
+    metrics = {
+        "Load Time (Seconds)": [(size["Rows"], size["Load Time (Seconds)"]) for size in loaded],
+        "Peak RSS (MB)": [(size["Rows"], size["Peak RSS (MB)"]) for size in loaded],
+        "Load Memory (MB)": [(size["Rows"], size["Load Memory (MB)"]) for size in loaded],
+        "Database Size (MB)": [(size["Rows"], size["Database Size (MB)"]) for size in loaded],
+    }
+    for table_name in TABLES:
+        metrics[f"{table_name} Load Time (Seconds)"] = [
+            (size["Table Rows"][table_name], next(item["Load Time (Seconds)"] for item in size["Table Load Times"] if item["Table Name"] == table_name))
+            for size in loaded]
+
+    fits = []
+    for metric, points in metrics.items():
+        exponent, coefficient = fit_power_law(points)
+        fits.append({"Metric": metric, "Exponent": exponent, "Coefficient": coefficient, "Points": len(points),
+                     "Scaling": scaling_class(exponent)})
+        if exponent is not None:
+            log = logging.warning if exponent > 1 + SCALING_LINEAR_TOLERANCE else logging.info
+            log(f"Scaling curve: {metric} grows with rows^{exponent:.2f} ({scaling_class(exponent)}).")
+    return fits
+
+
+def run_scaling_curve(scaling_dir):
+    sizes = [run_size(num_relationships, scaling_dir) for num_relationships in scaling_sizes()]
+    shutil.rmtree(scaling_dir, ignore_errors=True)
+    return {"Sizes": sizes, "Fits": fit_curves(sizes)}
+
+
+def main():
+    if not SCALING_CURVE:
+        logging.info("Scaling curve disabled, skipping.")
+        return
+
+    logging.info(f"Running scaling curve over {scaling_sizes()} relationships.")
+    results = run_scaling_curve(os.path.join(TEST_DATA_PATH, f'{DATABASE_NAME}_scaling'))
+    update_dashboard_data({"scaling_curve": results})
+    logging.info("Scaling curve results saved to dashboard data.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+import json
+import datetime
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+# KuzuDB column type of a spec column -> Arrow type written to Parquet (read back as the same KuzuDB type)
+ARROW_TYPES = {
+    'INT64': pa.int64(),
+    'DOUBLE': pa.float64(),
+    'DATE': pa.date32(),
+    'TIMESTAMP': pa.timestamp('us'),
+    'BOOLEAN': pa.bool_(),
+    'STRING': pa.string(),
+}
+TYPE_ALIASES = {'BOOL': 'BOOLEAN', 'INT': 'INT64', 'FLOAT': 'DOUBLE'}
+ENTITY_TYPES = ['company', 'person', 'relationship']
+# Key and endpoint columns are written by the generator itself
+RESERVED_COLUMNS = ['company_id', 'person_id', 'id']
+
+ALPHABET = np.frombuffer(b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789', dtype=np.uint8)
+EPOCH = datetime.date(1970, 1, 1)
+
+
+def load_schema_spec(path):
+    """Read and validate a schema spec: {entity type: [{"name", "type", ...column options}]}.
+
+    Column options are "null_ratio" (0-1), "cardinality" (draw from that many distinct values),
+    "min"/"max" (numbers, or ISO dates for DATE and TIMESTAMP), "true_ratio" for BOOLEAN and
+    "length" ({"min", "max"} uniform, or {"mean", "stddev", "min", "max"} clipped normal) for STRING. A uniform
+    length without "max" spans min to min + 8, one without "min" spans 0 to max, and no bounds at all mean 8.
+    """
+    with open(path, 'r') as f:
+        spec = json.load(f)
+    for entity_type, columns in spec.items():
+        if entity_type not in ENTITY_TYPES:
+            raise ValueError(f"Unknown entity {entity_type} in {path}, expected one of: {', '.join(ENTITY_TYPES)}")
+        names = [column.get('name') for column in columns]
+        if len(set(names)) != len(names) or not all(names):
+            raise ValueError(f"Columns of {entity_type} in {path} need unique, non-empty names")
+        for column in columns:
+            column['type'] = TYPE_ALIASES.get(column.get('type', 'STRING').upper(), column.get('type', 'STRING').upper())
+            if column['type'] not in ARROW_TYPES:
+                raise ValueError(f"Unknown type {column['type']} of {entity_type}.{column['name']}, expected one of: {', '.join(ARROW_TYPES)}")
+            if column['name'] in RESERVED_COLUMNS:
+                raise ValueError(f"{entity_type}.{column['name']} is a key column written by the generator")
+            if not 0 <= column.get('null_ratio', 0) <= 1:
+                raise ValueError(f"null_ratio of {entity_type}.{column['name']} must be between 0 and 1")
+    return spec
+
+
+def _days(value):
+    return (datetime.date.fromisoformat(value) - EPOCH).days
+
+
+def random_strings(rng, size, length):
+    """Random alphanumeric strings with lengths drawn from the length spec, built directly as Arrow buffers."""
+    if 'mean' in length:
+        lengths = rng.normal(length['mean'], length.get('stddev', 0), size)
+    else:
+        # A missing bound follows the given one: {"min": 20} draws 20-28 characters, {"max": 3} draws 0-3
+        low = length.get('min', 0 if 'max' in length else 8)
+        high = max(length.get('max', low + 8 if 'min' in length else 8), low)
+        lengths = rng.integers(low, high + 1, size)
+    lengths = np.clip(np.rint(lengths), length.get('min', 0), length.get('max', np.inf)).astype(np.int64)
+    offsets = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    characters = ALPHABET[rng.integers(0, len(ALPHABET), size=int(offsets[-1]))]
+    strings = pa.LargeStringArray.from_buffers(size, pa.py_buffer(offsets), pa.py_buffer(characters))
+    return strings.cast(pa.string())
+
+
+def random_values(column, rng, size):
+    """Draw `size` values of a spec column's type without nulls."""
+    column_type = column['type']
+    if column_type == 'INT64':
+        return pa.array(rng.integers(column.get('min', 0), column.get('max', 10 ** 9) + 1, size, dtype=np.int64))
+    if column_type == 'DOUBLE':
+        return pa.array(rng.uniform(column.get('min', 0.0), column.get('max', 1e6), size))
+    if column_type == 'DATE':
+        days = rng.integers(_days(column.get('min', '1970-01-01')), _days(column.get('max', '2030-12-31')) + 1, size)
+        return pa.array(days.astype(np.int32), type=pa.date32())
+    if column_type == 'TIMESTAMP':
+        seconds = rng.integers(_days(column.get('min', '1970-01-01')) * 86400, (_days(column.get('max', '2030-12-31')) + 1) * 86400, size)
+        return pa.array(seconds * 10 ** 6, type=pa.timestamp('us'))
+    if column_type == 'BOOLEAN':
+        return pa.array(rng.random(size) < column.get('true_ratio', 0.5))
+    return random_strings(rng, size, column.get('length', {}))
+
+
+def column_generator(column, rng, pool_rng):
+    """Return a function n -> Arrow array for one spec column.
+
+    With a cardinality, a pool of that many values is drawn once from pool_rng (seeded per entity, not
+    per shard, so every shard and batch shares it) and rows are index draws into the pool.
+    """
+    cardinality = column.get('cardinality')
+    pool = random_values(column, pool_rng, cardinality) if cardinality else None
+    null_ratio = column.get('null_ratio', 0)
+
+    def generate(size):
+        values = pool.take(pa.array(rng.integers(0, cardinality, size))) if cardinality else random_values(column, rng, size)
+        if null_ratio:
+            values = pc.if_else(pa.array(rng.random(size) < null_ratio), pa.scalar(None, type=values.type), values)
+        return values
+
+    return generate
+
+
+def column_generators(columns, rng, pool_seed):
+    """Ordered column generators of one entity's spec columns, in the shape of generate_dynamic_properties."""
+    return {column['name']: column_generator(column, rng, np.random.default_rng([*pool_seed, index]))
+            for index, column in enumerate(columns)}
@@ -1,12 +1,19 @@
 import os
+import glob
+import json
+import time
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from faker import Faker
-import pandas as pd
 import numpy as np
 import pyarrow as pa
 import pyarrow.parquet as pq
 from tqdm import tqdm
 from dotenv import load_dotenv
+from key_encoding import make_id_generator
+import schema_spec
+import dataset_cache
+from resource_sampler import sample_stage
 
 
 # Load environment variables from .env file
@@ -23,10 +30,79 @@ NUM_DYNAMIC_COMPANY_COLUMNS = int(os.getenv('NUM_DYNAMIC_COMPANY_COLUMNS', 5))
 NUM_DYNAMIC_PERSON_COLUMNS = int(os.getenv('NUM_DYNAMIC_PERSON_COLUMNS', 5))
 NUM_DYNAMIC_RELATIONSHIP_COLUMNS = int(os.getenv('NUM_DYNAMIC_RELATIONSHIP_COLUMNS', 5))
 
-# Define paths for output Parquet files using the base path
-COMPANY_PARQUET_PATH = os.path.join(TEST_DATA_PATH, 'companies')
-PERSON_PARQUET_PATH = os.path.join(TEST_DATA_PATH, 'persons')
-RELATIONSHIP_PARQUET_PATH = os.path.join(TEST_DATA_PATH, 'relationships')
+# Generation engine settings: 'vectorized' draws whole columns from a Faker vocabulary, 'faker' calls Faker per cell
+GENERATION_MODE = os.getenv('GENERATION_MODE', 'vectorized')
+GENERATION_SEED = int(os.getenv('GENERATION_SEED', 42))
+VOCABULARY_SIZE = int(os.getenv('VOCABULARY_SIZE', 1000))
+ENTITY_TYPES = ['company', 'person', 'relationship']
+
+# Streaming settings: write fixed-size Arrow record batches through a ParquetWriter instead of whole tables
+GENERATION_STREAMING = os.getenv('GENERATION_STREAMING', 'false').lower() == 'true'
+GENERATION_BATCH_SIZE = int(os.getenv('GENERATION_BATCH_SIZE', 1000000))
+PARQUET_ROW_GROUP_SIZE = int(os.getenv('PARQUET_ROW_GROUP_SIZE', 1000000))
+
+# Sharded generation: relationships are split into NUM_RELATIONSHIP_FILES deterministic shards generated by a process pool
+GENERATION_WORKERS = int(os.getenv('GENERATION_WORKERS', 1))
+NUM_RELATIONSHIP_FILES = int(os.getenv('NUM_RELATIONSHIP_FILES', 1))
+NUM_NODE_FILES = int(os.getenv('NUM_NODE_FILES', 1))
+
+# Primary key format: '#' is a digit, '?' an ASCII letter, anything else is literal; 'int64' writes INT64 keys
+ID_FORMAT = os.getenv('ID_FORMAT', '###???')
+
+# Degree distributions of the relationship endpoints: uniform, zipf (power-law hubs) or fixed (equal degree per node)
+PERSON_DEGREE_DISTRIBUTION = os.getenv('PERSON_DEGREE_DISTRIBUTION', 'uniform')
+COMPANY_DEGREE_DISTRIBUTION = os.getenv('COMPANY_DEGREE_DISTRIBUTION', 'uniform')
+ZIPF_EXPONENT = float(os.getenv('ZIPF_EXPONENT', 1.1))
+ENDPOINT_DISTRIBUTIONS = {'person_id': PERSON_DEGREE_DISTRIBUTION, 'company_id': COMPANY_DEGREE_DISTRIBUTION}
+
+# Dataset cache: datasets live in TEST_DATA_PATH/datasets/<config hash>/ and are reused while their manifest is valid
+DATASET_CACHE = os.getenv('DATASET_CACHE', 'true').lower() == 'true'
+DATASET_CACHE_MAX_GB = float(os.getenv('DATASET_CACHE_MAX_GB', 100))
+
+# Resource sampling: memory, CPU, disk I/O and directory size of each generation and COPY stage
+RESOURCE_SAMPLING = os.getenv('RESOURCE_SAMPLING', 'true').lower() == 'true'
+RESOURCE_SAMPLE_INTERVAL = float(os.getenv('RESOURCE_SAMPLE_INTERVAL', 0.5))
+GENERATION_STATS_NAME = 'generation_stats.json'
+
+# Optional JSON schema spec of typed property columns per entity; entities it lists replace their NUM_DYNAMIC_* string columns
+SCHEMA_SPEC_PATH = os.getenv('SCHEMA_SPEC', '')
+SCHEMA_SPEC = schema_spec.load_schema_spec(SCHEMA_SPEC_PATH) if SCHEMA_SPEC_PATH else None
+
+def generation_config():
+    """Collect every setting that changes the generated files; the worker count does not, so it is left out."""
+    return {
+        'num_companies': NUM_COMPANIES,
+        'num_persons': NUM_PERSONS,
+        'num_relationships': NUM_RELATIONSHIPS,
+        'num_dynamic_company_columns': NUM_DYNAMIC_COMPANY_COLUMNS,
+        'num_dynamic_person_columns': NUM_DYNAMIC_PERSON_COLUMNS,
+        'num_dynamic_relationship_columns': NUM_DYNAMIC_RELATIONSHIP_COLUMNS,
+        'generation_mode': GENERATION_MODE,
+        'generation_seed': GENERATION_SEED,
+        'vocabulary_size': VOCABULARY_SIZE,
+        'generation_streaming': GENERATION_STREAMING,
+        'generation_batch_size': GENERATION_BATCH_SIZE,
+        'parquet_row_group_size': PARQUET_ROW_GROUP_SIZE,
+        'sharded': GENERATION_WORKERS > 1 or NUM_NODE_FILES > 1 or NUM_RELATIONSHIP_FILES > 1,
+        'num_node_files': NUM_NODE_FILES,
+        'num_relationship_files': NUM_RELATIONSHIP_FILES,
+        'id_format': ID_FORMAT,
+        'person_degree_distribution': PERSON_DEGREE_DISTRIBUTION,
+        'company_degree_distribution': COMPANY_DEGREE_DISTRIBUTION,
+        'zipf_exponent': ZIPF_EXPONENT,
+        # Only part of the config when set, so datasets cached without a spec keep their keys
+        **({'schema_spec': SCHEMA_SPEC} if SCHEMA_SPEC else {}),
+    }
+
+DATASET_DIR = dataset_cache.dataset_dir(TEST_DATA_PATH, generation_config()) if DATASET_CACHE else TEST_DATA_PATH
+
+# Define paths for output Parquet files using the dataset directory
+COMPANY_PARQUET_PATH = os.path.join(DATASET_DIR, 'companies')
+PERSON_PARQUET_PATH = os.path.join(DATASET_DIR, 'persons')
+RELATIONSHIP_PARQUET_PATH = os.path.join(DATASET_DIR, 'relationships')
+
+# Resource samples of every generation stage of this run, keyed by stage name
+GENERATION_RESOURCE_USAGE = {}
 
 def setup_logging():
     """Set up basic logging for the script."""
@@ -39,79 +115,331 @@ def ensure_directories_exist():
     os.makedirs(os.path.dirname(PERSON_PARQUET_PATH), exist_ok=True)
     os.makedirs(os.path.dirname(RELATIONSHIP_PARQUET_PATH), exist_ok=True)
 
-def generate_dynamic_properties(num_columns):
-    """Generate a dictionary of dynamic properties with Faker generator functions."""
-    fake = Faker()
-    return {f'property_{i}': (lambda f=fake.word: f()) for i in range(1, num_columns + 1)}
+def build_vocabulary(fake, vocabulary_size):
+    """Draw a word vocabulary from Faker once so that columns can be sampled from it."""
+    return np.unique(np.array(fake.words(nb=vocabulary_size), dtype=object))
+
+def generate_dynamic_properties(num_columns, mode=GENERATION_MODE, fake=None, rng=None):
+    """Generate a dictionary of dynamic property column generators.
+
+    Each generator takes the number of records and returns a whole column. In 'faker' mode every
+    cell is a separate fake.word() call; in 'vectorized' mode a vocabulary is drawn from Faker
+    once and each column is a single vectorized index draw into that vocabulary.
+    """
+    fake = fake or Faker()
+    if mode == 'faker':
+        return {f'property_{i}': (lambda n, f=fake.word: [f() for _ in range(n)]) for i in range(1, num_columns + 1)}
+    if mode != 'vectorized':
+        raise ValueError(f"Unknown generation mode: {mode}")
+
+    rng = rng or np.random.default_rng()
+    # Converted to Arrow once, so each column is an index take rather than an object array conversion
+    vocabulary = pa.array(build_vocabulary(fake, VOCABULARY_SIZE), type=pa.string())
+    return {f'property_{i}': (lambda n: vocabulary.take(rng.integers(0, len(vocabulary), size=n))) for i in range(1, num_columns + 1)}
+
+def build_column_generators(num_dynamic_columns, entity_type, mode=GENERATION_MODE, seed=GENERATION_SEED, shard=0,
+                            total_records=None, row_offset=0, id_format=ID_FORMAT):
+    """Build the ordered column generators (ID column first) for an entity type and shard.
 
-def generate_test_data(num_records, num_dynamic_columns, entity_type):
-    """Generate test data for a specified number of dynamic properties."""
+    Keys are counter-encoded from the global row number (row_offset onwards) out of total_records,
+    so every shard of an entity produces its own disjoint slice of the key space.
+    """
     fake = Faker()
+    fake.seed_instance(seed)
+    # Each entity and shard gets its own stream so columns do not repeat each other across files
+    rng = np.random.default_rng([seed, ENTITY_TYPES.index(entity_type), shard])
+
     id_column_name = 'company_id' if entity_type == 'company' else 'person_id' if entity_type == 'person' else None
-    base_attributes = {id_column_name: lambda: fake.unique.bothify(text='###???')} if id_column_name else {}
-    dynamic_properties = generate_dynamic_properties(num_dynamic_columns)
+    base_attributes = {id_column_name: make_id_generator(id_format, total_records, [seed, ENTITY_TYPES.index(entity_type)],
+                                                         row_offset=row_offset)} if id_column_name else {}
+    if SCHEMA_SPEC and entity_type in SCHEMA_SPEC:
+        dynamic_properties = schema_spec.column_generators(SCHEMA_SPEC[entity_type], rng, [seed, ENTITY_TYPES.index(entity_type)])
+    else:
+        dynamic_properties = generate_dynamic_properties(num_dynamic_columns, mode=mode, fake=fake, rng=rng)
+
+    # The vocabulary is drawn from the global seed above, per-cell Faker calls continue from a per-shard seed
+    fake.seed_instance(f"{seed}:{entity_type}:{shard}")
+    return {**base_attributes, **dynamic_properties}
 
-    all_attributes = {**base_attributes, **dynamic_properties}
-    data = {}
+def generate_test_data(num_records, num_dynamic_columns, entity_type, mode=GENERATION_MODE, seed=GENERATION_SEED):
+    """Generate test data for a specified number of dynamic properties as an Arrow table, one column at a time."""
+    all_attributes = build_column_generators(num_dynamic_columns, entity_type, mode=mode, seed=seed, total_records=num_records)
+    columns = {}
 
+    start_time = time.time()
     for attr, generator in tqdm(all_attributes.items(), desc=f"Generating {entity_type} data"):
-        data[attr] = [generator() for _ in range(num_records)]
+        column = generator(num_records)
+        # Each column is converted as soon as it is drawn, so only one intermediate NumPy/list column is alive
+        columns[attr] = column if isinstance(column, pa.Array) else pa.array(column, type=pa.string())
+    duration_seconds = time.time() - start_time
+    logging.info(f"Generated {num_records:,} {entity_type} rows in {mode} mode in {duration_seconds:.2f} seconds "
+                 f"({num_records / max(duration_seconds, 1e-9):,.0f} rows/sec).")
+
+    return pa.table(columns)
+
+def build_endpoint_sampler(distribution, num_nodes, seed=GENERATION_SEED, endpoint_index=0, zipf_exponent=ZIPF_EXPONENT):
+    """Return a function (row_offset, size, rng) -> node row indices following a degree distribution.
+
+    'uniform' draws every endpoint independently, 'zipf' draws node ranks from a bounded power law
+    (the rank-to-node mapping is a seeded permutation shared by all shards, so hubs are the same nodes
+    everywhere), and 'fixed' assigns global relationship rows round-robin so every node gets the same degree.
+    """
+    if distribution == 'uniform':
+        return lambda row_offset, size, rng: rng.integers(0, num_nodes, size=size)
+    if distribution == 'fixed':
+        return lambda row_offset, size, rng: np.arange(row_offset, row_offset + size, dtype=np.int64) % num_nodes
+    if distribution != 'zipf':
+        raise ValueError(f"Unknown degree distribution: {distribution}")
+
+    weights = 1.0 / np.power(np.arange(1, num_nodes + 1, dtype=np.float64), zipf_exponent)
+    cdf = np.cumsum(weights)
+    cdf /= cdf[-1]
+    rank_to_node = np.random.default_rng([seed, ENTITY_TYPES.index('relationship'), endpoint_index]).permutation(num_nodes)
+    return lambda row_offset, size, rng: rank_to_node[np.minimum(np.searchsorted(cdf, rng.random(size)), num_nodes - 1)]
+
+def sample_endpoint_keys(endpoint_keys, row_offset=0, seed=GENERATION_SEED, shard=0):
+    """Return a function (start, size) -> [(column, Arrow key array)] for a range of relationship rows.
+
+    Endpoints are drawn as integer row indices into the node key arrays and resolved with an Arrow
+    take(), so no intermediate Python string objects are created.
+    """
+    samplers = {column: build_endpoint_sampler(ENDPOINT_DISTRIBUTIONS.get(column, 'uniform'), len(keys), seed=seed,
+                                               endpoint_index=index)
+                for index, (column, keys) in enumerate(endpoint_keys.items())}
+    rng = np.random.default_rng([seed, ENTITY_TYPES.index('relationship'), shard, 1])
+
+    def sample(start, size):
+        return [(column, keys.take(pa.array(samplers[column](row_offset + start, size, rng))))
+                for column, keys in endpoint_keys.items()]
+
+    return sample
+
+def generate_record_batches(num_records, num_dynamic_columns, entity_type, batch_size=GENERATION_BATCH_SIZE,
+                            endpoint_keys=None, mode=GENERATION_MODE, seed=GENERATION_SEED, shard=0,
+                            total_records=None, row_offset=0):
+    """Yield fixed-size Arrow record batches for an entity so only one batch is held in memory at a time.
+
+    For relationships, endpoint_keys maps each endpoint column (e.g. 'person_id') to the Arrow array of
+    node keys it references; endpoints are sampled as row indices and resolved to keys with take().
+    """
+    all_attributes = build_column_generators(num_dynamic_columns, entity_type, mode=mode, seed=seed, shard=shard,
+                                             total_records=total_records or num_records, row_offset=row_offset)
+    sample_endpoints = sample_endpoint_keys(endpoint_keys or {}, row_offset=row_offset, seed=seed, shard=shard)
+
+    for start in tqdm(range(0, num_records, batch_size), desc=f"Streaming {entity_type} data (shard {shard})"):
+        size = min(batch_size, num_records - start)
+        arrays, names = [], []
+        for column, keys in sample_endpoints(start, size):
+            arrays.append(keys)
+            names.append(column)
+        for attr, generator in all_attributes.items():
+            column = generator(size)
+            arrays.append(column if isinstance(column, pa.Array) else pa.array(column, type=pa.string()))
+            names.append(attr)
+        yield pa.RecordBatch.from_arrays(arrays, names=names)
+
+def write_batches_to_parquet(batches, path, row_group_size=PARQUET_ROW_GROUP_SIZE):
+    """Append record batches to a Parquet file through a ParquetWriter, one or more row groups per batch."""
+    writer = None
+    num_rows = 0
+    try:
+        for batch in batches:
+            if writer is None:
+                writer = pq.ParquetWriter(path, batch.schema, compression='snappy')
+            writer.write_table(pa.Table.from_batches([batch]), row_group_size=row_group_size)
+            num_rows += batch.num_rows
+        logging.info(f"Streamed {num_rows:,} rows to {path}.")
+    finally:
+        if writer is not None:
+            writer.close()
+    return num_rows
 
-    df = pd.DataFrame(data)
-    return pa.Table.from_pandas(df), df
+def read_key_column(paths, column):
+    """Read a single key column from one or more Parquet part files as a contiguous Arrow array."""
+    paths = [paths] if isinstance(paths, str) else paths
+    return pa.concat_tables(pq.read_table(path, columns=[column]) for path in paths).column(column).combine_chunks()
+
+def generation_stage(stage):
+    """Sample the resource usage of one generation stage into GENERATION_RESOURCE_USAGE."""
+    return sample_stage(stage, GENERATION_RESOURCE_USAGE, DATASET_DIR, RESOURCE_SAMPLING, RESOURCE_SAMPLE_INTERVAL)
+
+def record_data_size(stage, table):
+    """Store the in-memory size of a stage's Arrow table with its samples, so peak RSS can be read against the data held."""
+    if stage in GENERATION_RESOURCE_USAGE:
+        GENERATION_RESOURCE_USAGE[stage]["summary"]["Data Size (Bytes)"] = table.nbytes
+
+def save_generation_stats(directory):
+    """Store the generation resource usage next to the dataset so the loader can add it to the dashboard."""
+    with open(os.path.join(directory, GENERATION_STATS_NAME), 'w') as f:
+        json.dump({'resource_usage': GENERATION_RESOURCE_USAGE}, f, indent=4)
+
+def stream_test_data():
+    """Generate all entities in streaming mode, writing <prefix>_0.parquet files with bounded memory."""
+    company_path = f"{COMPANY_PARQUET_PATH}_0.parquet"
+    person_path = f"{PERSON_PARQUET_PATH}_0.parquet"
+
+    with generation_stage('Generate Company'):
+        write_batches_to_parquet(generate_record_batches(NUM_COMPANIES, NUM_DYNAMIC_COMPANY_COLUMNS, 'company'), company_path)
+    with generation_stage('Generate Person'):
+        write_batches_to_parquet(generate_record_batches(NUM_PERSONS, NUM_DYNAMIC_PERSON_COLUMNS, 'person'), person_path)
+
+    # Only the node key columns are held in memory while the relationships are streamed out
+    with generation_stage('Generate WorksAt'):
+        endpoint_keys = {'person_id': read_key_column(person_path, 'person_id'),
+                         'company_id': read_key_column(company_path, 'company_id')}
+        write_batches_to_parquet(generate_record_batches(NUM_RELATIONSHIPS, NUM_DYNAMIC_RELATIONSHIP_COLUMNS, 'relationship',
+                                                         endpoint_keys=endpoint_keys),
+                                 f"{RELATIONSHIP_PARQUET_PATH}_0.parquet")
+
+def generate_node_shard(shard, row_offset, num_records, total_records, num_dynamic_columns, entity_type, output_path_prefix):
+    """Process-pool task: stream one node shard, with keys encoded from its global row range, to <prefix>_<shard>.parquet."""
+    setup_logging()
+    path = f"{output_path_prefix}_{shard}.parquet"
+    write_batches_to_parquet(generate_record_batches(num_records, num_dynamic_columns, entity_type, shard=shard,
+                                                     total_records=total_records, row_offset=row_offset), path)
+    return path
+
+def generate_relationship_shard(shard, row_offset, num_records, num_dynamic_columns, person_paths, company_paths, output_path_prefix):
+    """Process-pool task: generate one relationship shard from its own seed and write it to <prefix>_<shard>.parquet."""
+    setup_logging()
+    endpoint_keys = {'person_id': read_key_column(person_paths, 'person_id'),
+                     'company_id': read_key_column(company_paths, 'company_id')}
+    path = f"{output_path_prefix}_{shard}.parquet"
+    write_batches_to_parquet(generate_record_batches(num_records, num_dynamic_columns, 'relationship',
+                                                     endpoint_keys=endpoint_keys, shard=shard, row_offset=row_offset), path)
+    return path
+
+def remove_stale_parts(output_path_prefix):
+    """Remove part files left over from a previous run that used more shards."""
+    for path in glob.glob(f"{output_path_prefix}_*.parquet"):
+        os.remove(path)
+
+def generate_sharded_test_data(num_workers=GENERATION_WORKERS, num_node_files=NUM_NODE_FILES,
+                               num_relationship_files=NUM_RELATIONSHIP_FILES):
+    """Generate all entities on a process pool, writing one part file per shard.
+
+    Shards are defined by the number of files, not by the number of workers, and each shard is
+    seeded from GENERATION_SEED plus its index, so a given seed produces the same files for any worker count.
+    """
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        # Node tables are independent of each other and their shards are generated concurrently
+        node_futures = {}
+        for num_records, num_dynamic_columns, entity_type, prefix in [
+                (NUM_COMPANIES, NUM_DYNAMIC_COMPANY_COLUMNS, 'company', COMPANY_PARQUET_PATH),
+                (NUM_PERSONS, NUM_DYNAMIC_PERSON_COLUMNS, 'person', PERSON_PARQUET_PATH)]:
+            node_futures[entity_type] = [executor.submit(generate_node_shard, shard, start, end - start, num_records,
+                                                         num_dynamic_columns, entity_type, prefix)
+                                         for shard, (start, end) in enumerate(shard_bounds(num_records, num_node_files))]
+        company_paths = [future.result() for future in node_futures['company']]
+        person_paths = [future.result() for future in node_futures['person']]
+
+        shard_futures = [executor.submit(generate_relationship_shard, shard, start, end - start, NUM_DYNAMIC_RELATIONSHIP_COLUMNS,
+                                         person_paths, company_paths, RELATIONSHIP_PARQUET_PATH)
+                         for shard, (start, end) in enumerate(shard_bounds(NUM_RELATIONSHIPS, num_relationship_files))]
+        relationship_paths = [future.result() for future in shard_futures]
+
+    logging.info(f"Generated {len(company_paths) + len(person_paths)} node shards and {len(relationship_paths)} "
+                 f"relationship shards with {num_workers} workers.")
+    return relationship_paths
 
 def save_data_to_parquet(table, path):
     """Save the generated PyArrow Table to a Parquet file with error handling."""
     try:
-        pq.write_table(table, path, compression='snappy')
+        pq.write_table(table, path, compression='snappy', row_group_size=PARQUET_ROW_GROUP_SIZE)
         # pq.write_table(table, path)
 
         logging.info(f"Data successfully saved to {path}.")
     except Exception as e:
         logging.error(f"Failed to save data to {path}. Error: {e}")
+        raise
 
-def split_parquet_files(df, output_path_prefix, num_files):
-    """Split the DataFrame into multiple Parquet files."""
-    num_rows_per_file = len(df) // num_files
-    remainder = len(df) % num_files
+def shard_bounds(num_rows, num_files):
+    """Return the (start, end) row range of each part file, giving the first files one extra row for the remainder."""
+    num_rows_per_file = num_rows // num_files
+    remainder = num_rows % num_files
+    bounds = []
     start = 0
     for i in range(num_files):
         end = start + num_rows_per_file
         if i < remainder:
             end += 1
-        # Ensure the first file includes the header
-        if i == 0:
-            pq.write_table(pa.Table.from_pandas(df[start:end]), f"{output_path_prefix}_{i}.parquet", write_statistics=True)
-        else:
-            pq.write_table(pa.Table.from_pandas(df[start:end]), f"{output_path_prefix}_{i}.parquet", write_statistics=False)
+        bounds.append((start, end))
         start = end
+    return bounds
 
-def main():
-    setup_logging()
-    ensure_directories_exist()
+def split_parquet_files(table, output_path_prefix, num_files):
+    """Split an Arrow table into multiple Parquet files with zero-copy slices, all written with the same codec, row groups and statistics."""
+    for i, (start, end) in enumerate(shard_bounds(table.num_rows, num_files)):
+        save_data_to_parquet(table.slice(start, end - start), f"{output_path_prefix}_{i}.parquet")
 
+def generate_in_memory_test_data():
+    """Generate all entities in memory and write one file per entity (the original generation path)."""
     # Generate and save Company data with dynamic properties
-    company_table, company_df = generate_test_data(NUM_COMPANIES, NUM_DYNAMIC_COMPANY_COLUMNS, 'company')
-    split_parquet_files(company_df, COMPANY_PARQUET_PATH, 1)
+    # Only the key columns of the node tables are kept for the relationship endpoints
+    with generation_stage('Generate Company'):
+        company_table = generate_test_data(NUM_COMPANIES, NUM_DYNAMIC_COMPANY_COLUMNS, 'company')
+        split_parquet_files(company_table, COMPANY_PARQUET_PATH, 1)
+        company_keys = company_table.column('company_id').combine_chunks()
+    record_data_size('Generate Company', company_table)
+    del company_table
 
     # Generate and save Person data with dynamic properties
-    person_table, person_df = generate_test_data(NUM_PERSONS, NUM_DYNAMIC_PERSON_COLUMNS, 'person')
-    split_parquet_files(person_df, PERSON_PARQUET_PATH, 1)
+    with generation_stage('Generate Person'):
+        person_table = generate_test_data(NUM_PERSONS, NUM_DYNAMIC_PERSON_COLUMNS, 'person')
+        split_parquet_files(person_table, PERSON_PARQUET_PATH, 1)
+        person_keys = person_table.column('person_id').combine_chunks()
+    record_data_size('Generate Person', person_table)
+    del person_table
 
     # Generate Relationship data
+    with generation_stage('Generate WorksAt'):
+        relationship_table = generate_test_data(NUM_RELATIONSHIPS, NUM_DYNAMIC_RELATIONSHIP_COLUMNS, 'relationship')
+        endpoint_keys = {'person_id': person_keys, 'company_id': company_keys}
+
+        # Put 'person_id' and 'company_id' first, resolved from sampled row indices with an Arrow take
+        for position, (column, keys) in enumerate(sample_endpoint_keys(endpoint_keys)(0, NUM_RELATIONSHIPS)):
+            relationship_table = relationship_table.add_column(position, column, keys)
+        save_data_to_parquet(relationship_table.replace_schema_metadata(None), f"{RELATIONSHIP_PARQUET_PATH}_0.parquet")
+    record_data_size('Generate WorksAt', relationship_table)
+
+def main():
+    """Generate the dataset (or reuse a cached one) and return the directory holding its Parquet files."""
+    setup_logging()
+    config = generation_config()
+
+    if DATASET_CACHE and dataset_cache.is_valid_dataset(DATASET_DIR, config):
+        dataset_cache.touch_dataset(DATASET_DIR)
+        logging.info(f"Reusing cached dataset {DATASET_DIR}, skipping generation.")
+        return DATASET_DIR
+
+    ensure_directories_exist()
+    for prefix in [COMPANY_PARQUET_PATH, PERSON_PARQUET_PATH, RELATIONSHIP_PARQUET_PATH]:
+        remove_stale_parts(prefix)
+
     try:
-        _, relationship_df = generate_test_data(NUM_RELATIONSHIPS, NUM_DYNAMIC_RELATIONSHIP_COLUMNS, 'relationship')
-        relationship_df['person_id'] = np.random.choice(person_df['person_id'], size=NUM_RELATIONSHIPS)
-        relationship_df['company_id'] = np.random.choice(company_df['company_id'], size=NUM_RELATIONSHIPS)
-
-        # Reorder columns to have 'person_id' and 'company_id' first
-        cols = ['person_id', 'company_id'] + [col for col in relationship_df.columns if col not in ['person_id', 'company_id']]
-        relationship_df = relationship_df[cols]
-        split_parquet_files(relationship_df, RELATIONSHIP_PARQUET_PATH, 1)
+        if config['sharded']:
+            # Worker processes are children of this one, so their memory is included in the samples
+            with generation_stage(f'Generate All ({GENERATION_WORKERS} workers)'):
+                generate_sharded_test_data()
+        elif GENERATION_STREAMING:
+            stream_test_data()
+        else:
+            generate_in_memory_test_data()
     except Exception as e:
-        logging.error(f"Failed to generate or save relationship data. Error: {e}")
+        logging.error(f"Failed to generate or save test data. Error: {e}")
+        # The old parts are already removed, so nothing may be loaded from DATASET_DIR
+        raise
+
+    if RESOURCE_SAMPLING:
+        save_generation_stats(DATASET_DIR)
+
+    if DATASET_CACHE:
+        manifest = dataset_cache.write_manifest(DATASET_DIR, config)
+        logging.info(f"Cached dataset {DATASET_DIR} ({manifest['total_bytes'] / 1e9:.2f} GB).")
+        dataset_cache.evict_datasets(TEST_DATA_PATH, DATASET_CACHE_MAX_GB * 1e9, keep=DATASET_DIR)
 
     logging.info("Data generation and saving completed.")
+    return DATASET_DIR
 
 if __name__ == "__main__":
     main()
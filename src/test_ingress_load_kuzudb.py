@@ -1,20 +1,79 @@
 import os
 import sys
+import glob
+import shutil
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import time
 import logging
 import json
 import kuzu
 
-import pyarrow.parquet as pq
 import pandas as pd
 from prettytable import PrettyTable
 from importlib.metadata import version  # Check Python version compatibility
 from io import StringIO
+from dotenv import load_dotenv
+from test_create_test_data import DATASET_DIR, GENERATION_STATS_NAME, RESOURCE_SAMPLING, RESOURCE_SAMPLE_INTERVAL
+from resource_sampler import directory_size, sample_stage
+from parquet_schema import read_parquet_footer, kuzu_column_type, dataset_row_count, quote_identifier
+from load_scheduler import run_load_plan, copy_statement
+import chunked_loader
+from integrity_checks import run_integrity_checks
+import ingestion_backends
+import memory_limits
+import failure_bisection
+import parquet_layouts
+import psutil
 
 
 
+load_dotenv()
+
 kuzu_version = version("kuzu")
 DATABASE_NAME = f'test_kuzu_db_v{kuzu_version.replace(".", "_")}'
+# Run independent COPY statements (Person, Company) concurrently where the installed version allows it
+PARALLEL_COPY = os.getenv('PARALLEL_COPY', 'true').lower() == 'true'
+# Load WorksAt one relationships_{i}.parquet chunk at a time, checkpointing progress so a failed run can resume
+CHUNKED_REL_LOAD = os.getenv('CHUNKED_REL_LOAD', 'false').lower() == 'true'
+# 'standard' loads the dataset once, 'sweep' loads it over a grid of buffer pool sizes and thread counts,
+# 'backends' loads it once with every ingestion backend, 'memory' searches the smallest memory cap each table loads under
+LOAD_MODE = os.getenv('LOAD_MODE', 'standard')
+SWEEP_BUFFER_POOL_SIZES_MB = [int(size) for size in os.getenv('SWEEP_BUFFER_POOL_SIZES_MB', '1024,4096,16384').split(',')]
+SWEEP_MAX_THREADS = [int(threads) for threads in os.getenv('SWEEP_MAX_THREADS', '1,4,16').split(',')]
+SWEEP_MAX_BUFFER_POOL_MB = int(os.getenv('SWEEP_MAX_BUFFER_POOL_MB', 65536))
+INGESTION_BACKENDS = [name.strip() for name in os.getenv('INGESTION_BACKENDS', ','.join(ingestion_backends.BACKENDS)).split(',') if name.strip()]
+INGESTION_BATCH_SIZE = int(os.getenv('INGESTION_BATCH_SIZE', 10000))
+INGESTION_CSV_PARALLEL = os.getenv('INGESTION_CSV_PARALLEL', 'true').lower() == 'true'
+MEMORY_LIMIT_METHOD = os.getenv('MEMORY_LIMIT_METHOD', 'auto')
+MEMORY_SEARCH_MIN_MB = int(os.getenv('MEMORY_SEARCH_MIN_MB', 64))
+MEMORY_SEARCH_MAX_MB = int(os.getenv('MEMORY_SEARCH_MAX_MB', 0)) or psutil.virtual_memory().total // 1024 ** 2
+MEMORY_SEARCH_TOLERANCE_MB = int(os.getenv('MEMORY_SEARCH_TOLERANCE_MB', 16))
+MEMORY_BUFFER_POOL_FRACTION = float(os.getenv('MEMORY_BUFFER_POOL_FRACTION', 0.5))
+# Regex the WorksAt COPY error must match to count as reproduced, empty for any error
+BISECT_ERROR_PATTERN = os.getenv('BISECT_ERROR_PATTERN', '')
+BISECT_MIN_RELATIONSHIPS = int(os.getenv('BISECT_MIN_RELATIONSHIPS', 1))
+BISECT_TOLERANCE = int(os.getenv('BISECT_TOLERANCE', 1000))
+BISECT_COLUMNS = os.getenv('BISECT_COLUMNS', 'false').lower() == 'true'
+LAYOUT_CODECS = [codec.strip() for codec in os.getenv('LAYOUT_CODECS', 'none,snappy,zstd,lz4').split(',')]
+LAYOUT_ROW_GROUP_SIZES = [int(size) for size in os.getenv('LAYOUT_ROW_GROUP_SIZES', '100000,1000000').split(',')]
+LAYOUT_DICTIONARY = [value.strip().lower() == 'true' for value in os.getenv('LAYOUT_DICTIONARY', 'true,false').split(',')]
+LAYOUT_STATISTICS = [value.strip().lower() == 'true' for value in os.getenv('LAYOUT_STATISTICS', 'true,false').split(',')]
+# Check primary key uniqueness and WorksAt endpoints with Arrow before any COPY, optionally skipping the load on failure
+INTEGRITY_CHECKS = os.getenv('INTEGRITY_CHECKS', 'true').lower() == 'true'
+INTEGRITY_CHECKS_ABORT = os.getenv('INTEGRITY_CHECKS_ABORT', 'true').lower() == 'true'
+INTEGRITY_CHECK_BATCH_SIZE = int(os.getenv('INTEGRITY_CHECK_BATCH_SIZE', 1000000))
+# Sections written by separate benchmark runs, kept when a standard run rewrites the dashboard data
+BENCHMARK_SECTIONS = ["load_sweep", "query_benchmark", "ingestion_backends", "upsert_benchmark", "concurrent_reads", "memory_limits", "scaling_curve", "failure_bisection", "parquet_layouts", "column_sweep", "topology_benchmark"]
+# The graph model the DDL, COPY plan and validation are derived from: node tables with their primary key column, and
+# rel tables with their FROM/TO node tables and the Parquet columns holding the endpoint keys
+GRAPH_TOPOLOGY = {
+    "nodes": [{"label": "Person", "key": "person_id"}, {"label": "Company", "key": "company_id"}],
+    "rels": [{"type": "WorksAt", "from": "Person", "to": "Company", "endpoints": ["person_id", "company_id"]}],
+}
+# Resource samples of every COPY stage of this run, keyed by stage name
+RESOURCE_USAGE = {}
 # Update setup_logging to capture log messages for the HTML report
 def setup_logging():
     log_stream = StringIO()
@@ -30,7 +89,7 @@ def format_duration(seconds):
     minutes, seconds = divmod(seconds, 60)
     return f"{int(minutes)}m {int(seconds)}s"
 
-def save_data_for_dashboard(load_times, database_summary, log_stream):
+def save_data_for_dashboard(load_times, database_summary, log_stream, extra_sections=None):
     # Convert log stream to string
     logs_str = log_stream.getvalue()
 
@@ -46,21 +105,52 @@ def save_data_for_dashboard(load_times, database_summary, log_stream):
         "kuzu": kuzu_version,
         "load_times": load_times,
         "database_summary": database_summary,
-        "logs": logs_str
+        "logs": logs_str,
+        **(extra_sections or {})
     }
 
+    # Keep results of earlier benchmark runs for this version
+    existing = read_dashboard_data()
+    for section in BENCHMARK_SECTIONS:
+        if section in existing and section not in data:
+            data[section] = existing[section]
+
     with open(f'dashboard_data_{kuzu_version}.json', 'w') as f:
         json.dump(data, f, ensure_ascii=False, indent=4)
 
+def read_dashboard_data():
+    try:
+        with open(f'dashboard_data_{kuzu_version}.json', 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+# Adds or replaces sections of this version's dashboard data, leaving the rest of the file untouched
+def update_dashboard_data(sections):
+    data = read_dashboard_data()
+    data.setdefault("kuzu", kuzu_version)
+    data.update(sections)
+    with open(f'dashboard_data_{kuzu_version}.json', 'w') as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
 
-# Creates a CREATE NODE TABLE statement from a Parquet file
+
+# Returns all part files of a dataset entity, ordered by part index
+def list_parquet_parts(first_part_path):
+    path_prefix = first_part_path.rsplit('_', 1)[0]
+    return sorted(glob.glob(f"{path_prefix}_*.parquet"), key=lambda path: int(path.rsplit('_', 1)[1].split('.')[0]))
+
+# Returns the COPY source for a set of part files: the single file, or a glob pattern over all parts
+def parquet_copy_source(first_part_path):
+    path_prefix = first_part_path.rsplit('_', 1)[0]
+    return f"{path_prefix}_*.parquet" if len(list_parquet_parts(first_part_path)) > 1 else first_part_path
+
+# Creates a CREATE NODE TABLE statement from a Parquet file's footer schema
 def create_node_table_statement_from_parquet(parquet_path, table_name, primary_key):
     try:
-        table = pq.read_table(parquet_path)
-        schema = table.schema
+        schema = read_parquet_footer(parquet_path)['schema']
 
-        columns = [f"{field.name} STRING" for field in schema]
-        primaryKeyStatement = f", PRIMARY KEY ({primary_key})" if primary_key else ""
+        columns = [f"{quote_identifier(field.name)} {kuzu_column_type(field.type)}" for field in schema]
+        primaryKeyStatement = f", PRIMARY KEY ({quote_identifier(primary_key)})" if primary_key else ""
         create_statement = f"CREATE NODE TABLE {table_name} ({', '.join(columns)}{primaryKeyStatement});"
 
         logging.debug(f'CREATE statement for {table_name}: {create_statement}')
@@ -69,14 +159,14 @@ def create_node_table_statement_from_parquet(parquet_path, table_name, primary_k
         logging.error(f"Failed to generate CREATE statement for {table_name}: {e}")
         return None
 
-# Creates a CREATE REL TABLE statement from a Parquet file
-def create_rel_table_statement_from_parquet(parquet_path, table_name):
+# Creates a CREATE REL TABLE statement from a Parquet file's footer schema; the endpoint key columns are not properties
+def create_rel_table_statement_from_parquet(parquet_path, table_name, from_table="Person", to_table="Company",
+                                            endpoint_columns=("person_id", "company_id")):
     try:
-        table = pq.read_table(parquet_path)
-        schema = table.schema
+        schema = read_parquet_footer(parquet_path)['schema']
 
-        dynamic_columns = [f"{field.name} STRING" for field in schema if field.name not in ['person_id', 'company_id', 'id']]
-        create_statement = f"CREATE REL TABLE {table_name} (FROM Person TO Company, {', '.join(dynamic_columns)});"
+        dynamic_columns = [f"{quote_identifier(field.name)} {kuzu_column_type(field.type)}" for field in schema if field.name not in [*endpoint_columns, 'id']]
+        create_statement = f"CREATE REL TABLE {table_name} (FROM {from_table} TO {to_table}{''.join(', ' + column for column in dynamic_columns)});"
 
         logging.debug(f'CREATE statement for {table_name}: {create_statement}')
         return create_statement
@@ -101,34 +191,527 @@ def execute_query_and_display(conn, query):
 
 
 
-def import_table_data(conn, copy_statement, table_name):
+# Reads the statistics the generator stored next to the dataset, if any
+def read_generation_stats(data_dir):
+    try:
+        with open(os.path.join(data_dir, GENERATION_STATS_NAME), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+# Returns the first part file of each table in a dataset directory
+def dataset_paths(data_dir):
+    return {
+        "Company": os.path.join(data_dir, 'companies_0.parquet'),
+        "Person": os.path.join(data_dir, 'persons_0.parquet'),
+        "WorksAt": os.path.join(data_dir, 'relationships_0.parquet'),
+    }
+
+# Table names of a topology, node tables first
+def topology_tables(topology):
+    return [node["label"] for node in topology["nodes"]] + [rel["type"] for rel in topology["rels"]]
+
+# Builds the dependency-ordered COPY plan: node tables are independent, each rel COPY needs its FROM and TO node tables
+def build_load_plan(paths, skipped_tables=(), topology=GRAPH_TOPOLOGY):
+    dependencies = {**{node["label"]: [] for node in topology["nodes"]},
+                    **{rel["type"]: list(dict.fromkeys([rel["from"], rel["to"]])) for rel in topology["rels"]}}
+    return [{"table": table_name, "statement": copy_statement(table_name, parquet_copy_source(paths[table_name])),
+             "depends_on": dependencies[table_name]} for table_name in topology_tables(topology) if table_name not in skipped_tables]
+
+# Rel tables reference node tables, so they are dropped first
+def drop_tables(conn, topology=GRAPH_TOPOLOGY):
+    for table_name in reversed(topology_tables(topology)):
+        try:
+            conn.execute(f"DROP TABLE {table_name}")
+            logging.info(f"Table {table_name} dropped.")
+        except Exception as e:
+            if 'does not exist' in str(e).lower():
+                logging.debug(f"Table {table_name} does not exist. No need to drop.")
+            else:
+                logging.error(f"Error dropping table {table_name}: {e}")
+
+def create_tables(conn, paths, topology=GRAPH_TOPOLOGY):
+    statements = [create_node_table_statement_from_parquet(paths[node["label"]], node["label"], node["key"]) for node in topology["nodes"]]
+    statements += [create_rel_table_statement_from_parquet(paths[rel["type"]], rel["type"], rel["from"], rel["to"], rel["endpoints"])
+                   for rel in topology["rels"]]
+
+    for statement in statements:
+        try:
+            conn.execute(statement)
+            logging.info(f'Successfully created kuzu table: {statement.split()[3]}')
+        except Exception as e:
+            logging.error(f'Failed to execute statement. Error details: {e}')
+
+# Opens a database, with an explicit buffer pool size in bytes when one is given
+def open_database(database_dir, buffer_pool_size=0):
+    db = kuzu.Database(database_dir, buffer_pool_size=buffer_pool_size) if buffer_pool_size else kuzu.Database(database_dir)
+    return db, kuzu.Connection(db)
+
+# Releases a database before its directory is removed; older versions have no close() and rely on garbage collection
+def close_database(db, conn):
+    for handle in (conn, db):
+        close = getattr(handle, 'close', None)
+        if close:
+            close()
+
+def is_buffer_manager_error(error):
+    message = str(error).lower()
+    return 'buffer manager' in message or 'claim a frame' in message
+
+# Loads the dataset into a fresh database with the given settings, returning (load_times, error)
+def sweep_load_once(paths, database_dir, buffer_pool_mb, max_threads):
+    shutil.rmtree(database_dir, ignore_errors=True)
+    os.makedirs(database_dir, exist_ok=True)
+    db, conn = open_database(database_dir, buffer_pool_mb * 1024 ** 2)
+    load_times = []
+    try:
+        conn.set_max_threads_for_exec(max_threads)
+        create_tables(conn, paths)
+        for step in build_load_plan(paths):
+            start_time = time.time()
+            conn.execute(step["statement"])
+            load_times.append({"Table Name": step["table"], "Load Time (Seconds)": time.time() - start_time})
+        return load_times, None
+    except Exception as e:
+        return load_times, e
+    finally:
+        close_database(db, conn)
+        del conn, db
+        shutil.rmtree(database_dir, ignore_errors=True)
+
+# Loads the same dataset over a grid of buffer pool sizes and thread counts, doubling the buffer pool on buffer manager errors
+def run_load_sweep(paths, sweep_dir):
+    results = []
+    for buffer_pool_mb in SWEEP_BUFFER_POOL_SIZES_MB:
+        for max_threads in SWEEP_MAX_THREADS:
+            effective_buffer_pool_mb = buffer_pool_mb
+            retries = 0
+            while True:
+                logging.info(f"Sweep: loading with {effective_buffer_pool_mb} MB buffer pool and {max_threads} threads.")
+                load_times, error = sweep_load_once(paths, os.path.join(sweep_dir, f'bp{effective_buffer_pool_mb}_t{max_threads}'),
+                                                    effective_buffer_pool_mb, max_threads)
+                if error is None or not is_buffer_manager_error(error) or effective_buffer_pool_mb * 2 > SWEEP_MAX_BUFFER_POOL_MB:
+                    break
+                logging.warning(f"Sweep: buffer manager error with {effective_buffer_pool_mb} MB, retrying with {effective_buffer_pool_mb * 2} MB.")
+                effective_buffer_pool_mb *= 2
+                retries += 1
+
+            if error is not None:
+                logging.error(f"Sweep: load failed with {effective_buffer_pool_mb} MB buffer pool and {max_threads} threads: {error}")
+            results.append({
+                "Buffer Pool (MB)": buffer_pool_mb,
+                "Effective Buffer Pool (MB)": effective_buffer_pool_mb,
+                "Max Threads": max_threads,
+                "Retries": retries,
+                "Status": "pass" if error is None else "fail",
+                "Load Time (Seconds)": sum(item["Load Time (Seconds)"] for item in load_times) if error is None else None,
+                "Table Load Times": load_times,
+                "Error": str(error) if error is not None else None,
+            })
+    shutil.rmtree(sweep_dir, ignore_errors=True)
+    return results
+
+# Loads the dataset into a fresh database, sampling the whole load for its peak RSS; run in a child process so the
+# footprint of earlier loads does not carry over. Returns (load_times, resource summary, baseline RSS, database bytes, validation)
+def sampled_load(paths, database_dir):
+    shutil.rmtree(database_dir, ignore_errors=True)
+    os.makedirs(database_dir, exist_ok=True)
+    # Forked from the benchmark process, so its footprint is reported separately from what the load adds
+    baseline_rss = memory_limits.process_rss(os.getpid())
+    db, conn = open_database(database_dir)
+    usage = {}
+    load_times = []
+    try:
+        create_tables(conn, paths)
+        with sample_stage("Load", usage, database_dir, True, RESOURCE_SAMPLE_INTERVAL):
+            for step in build_load_plan(paths):
+                start_time = time.time()
+                conn.execute(step["statement"])
+                load_times.append({"Table Name": step["table"], "Load Time (Seconds)": time.time() - start_time})
+        database_bytes = directory_size(database_dir)
+        validation = validate_load(conn, paths)
+    finally:
+        close_database(db, conn)
+        del conn, db
+        shutil.rmtree(database_dir, ignore_errors=True)
+    return load_times, usage["Load"]["summary"], baseline_rss, database_bytes, validation
+
+# Rewrites the dataset once per Parquet layout (codec, row group size, dictionary, statistics) and loads every variant
+# into a fresh database, reporting file sizes, COPY times and peak memory per variant
+def run_layout_matrix(paths, layout_dir):
+    source_parts = {table_name: list_parquet_parts(paths[table_name]) for table_name in ["Person", "Company", "WorksAt"]}
+    variants = parquet_layouts.layout_variants(LAYOUT_CODECS, LAYOUT_ROW_GROUP_SIZES, LAYOUT_DICTIONARY, LAYOUT_STATISTICS)
+    results = []
+    for variant in variants:
+        name = parquet_layouts.variant_name(variant)
+        variant_dir = os.path.join(layout_dir, name)
+        result = {"Variant": name, **variant, "Status": "pass", "Error": None}
+        try:
+            start_time = time.time()
+            file_bytes = parquet_layouts.rewrite_dataset(source_parts, variant_dir, variant)
+            result.update({"Rewrite Time (Seconds)": time.time() - start_time, "File Size (MB)": sum(file_bytes.values()) / 1024 ** 2,
+                           "Table File Size (MB)": {table_name: size / 1024 ** 2 for table_name, size in file_bytes.items()}})
+            logging.info(f"Layout {name}: {result['File Size (MB)']:,.1f} MB, loading.")
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                load_times, summary, baseline_rss, database_bytes, validation = executor.submit(
+                    sampled_load, dataset_paths(variant_dir), os.path.join(layout_dir, f'{name}_db')).result()
+            load_seconds = sum(item["Load Time (Seconds)"] for item in load_times)
+            result.update({
+                "Status": "pass" if all(item["Status"] == "match" for item in validation) else "mismatch",
+                "Load Time (Seconds)": load_seconds,
+                "Table Load Times": load_times,
+                "Peak RSS (MB)": summary["Peak RSS (Bytes)"] / 1024 ** 2,
+                "Load Memory (MB)": max(summary["Peak RSS (Bytes)"] - baseline_rss, 0) / 1024 ** 2,
+                "Database Size (MB)": database_bytes / 1024 ** 2,
+            })
+            logging.info(f"Layout {name}: loaded in {load_seconds:.2f} seconds, peak RSS {result['Peak RSS (MB)']:,.0f} MB.")
+        except BrokenProcessPool:
+            result.update({"Status": "crashed", "Error": "The loading process crashed"})
+        except Exception as e:
+            result.update({"Status": "fail", "Error": str(e)})
+        if result["Error"]:
+            logging.error(f"Layout {name} failed: {result['Error']}")
+        shutil.rmtree(variant_dir, ignore_errors=True)
+        results.append(result)
+    shutil.rmtree(layout_dir, ignore_errors=True)
+    return results
+
+# Loads the dataset into a fresh database with one ingestion backend, returning its result entry
+def ingest_with_backend(backend_name, paths, database_dir, work_dir):
+    shutil.rmtree(database_dir, ignore_errors=True)
+    os.makedirs(work_dir, exist_ok=True)
+    db, conn = open_database(database_dir)
+    options = {"batch_size": INGESTION_BATCH_SIZE, "csv_parallel": INGESTION_CSV_PARALLEL}
+    tables = []
+    error = None
+    try:
+        create_tables(conn, paths)
+        for table_name in ["Person", "Company", "WorksAt"]:
+            rows, prepare_seconds, load_seconds = ingestion_backends.BACKENDS[backend_name](
+                conn, table_name, list_parquet_parts(paths[table_name]), work_dir, options)
+            tables.append({"Table Name": table_name, "Rows": rows, "Prepare Time (Seconds)": prepare_seconds,
+                           "Load Time (Seconds)": load_seconds, "Rows/sec": rows / load_seconds if load_seconds > 0 else None})
+        validation = validate_load(conn, paths)
+    except Exception as e:
+        error = e
+        validation = []
+    finally:
+        close_database(db, conn)
+        del conn, db
+        shutil.rmtree(database_dir, ignore_errors=True)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    rows = sum(table["Rows"] for table in tables)
+    load_seconds = sum(table["Load Time (Seconds)"] for table in tables)
+    return {
+        "Backend": backend_name,
+        "Status": "fail" if error else "pass" if all(item["Status"] == "match" for item in validation) else "mismatch",
+        "Rows": rows,
+        "Load Time (Seconds)": load_seconds,
+        "Rows/sec": rows / load_seconds if load_seconds > 0 and not error else None,
+        "Tables": tables,
+        "Validation": validation,
+        "Error": str(error) if error else None,
+    }
+
+# Runs every configured ingestion backend against the same dataset, each in its own process since
+# unsupported in-memory scans can crash older versions
+def run_ingestion_benchmark(paths, benchmark_dir):
+    results = []
+    for backend_name in INGESTION_BACKENDS:
+        if backend_name in ingestion_backends.UNSUPPORTED_BACKENDS:
+            logging.warning(f"Skipping ingestion backend {backend_name}: {ingestion_backends.UNSUPPORTED_BACKENDS[backend_name]}.")
+            continue
+        if backend_name not in ingestion_backends.BACKENDS:
+            logging.error(f"Unknown ingestion backend {backend_name}, expected one of: {', '.join(ingestion_backends.BACKENDS)}")
+            continue
+        logging.info(f"Ingestion benchmark: loading with the {backend_name} backend.")
+        database_dir = os.path.join(benchmark_dir, backend_name)
+        try:
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                result = executor.submit(ingest_with_backend, backend_name, paths, database_dir,
+                                         os.path.join(benchmark_dir, f'{backend_name}_files')).result()
+        except BrokenProcessPool:
+            result = {"Backend": backend_name, "Status": "crashed", "Rows": 0, "Load Time (Seconds)": 0, "Rows/sec": None,
+                      "Tables": [], "Validation": [], "Error": "The loading process crashed"}
+
+        if result["Error"]:
+            logging.error(f"Ingestion backend {backend_name} failed: {result['Error']}")
+        else:
+            logging.info(f"Ingestion backend {backend_name}: {result['Rows']:,} rows at {result['Rows/sec'] or 0:,.0f} rows/sec ({result['Status']}).")
+        results.append(result)
+    shutil.rmtree(benchmark_dir, ignore_errors=True)
+    return results
+
+# Loads a table and the tables it depends on into a fresh database, returning the table's COPY time
+def memory_probe_load(paths, database_dir, table_name, buffer_pool_size):
+    shutil.rmtree(database_dir, ignore_errors=True)
+    os.makedirs(database_dir, exist_ok=True)
+    db, conn = open_database(database_dir, buffer_pool_size)
+    try:
+        create_tables(conn, paths)
+        plan = {step["table"]: step for step in build_load_plan(paths)}
+        for dependency in plan[table_name]["depends_on"]:
+            conn.execute(plan[dependency]["statement"])
+        start_time = time.time()
+        conn.execute(plan[table_name]["statement"])
+        return time.time() - start_time
+    finally:
+        close_database(db, conn)
+        del conn, db
+        shutil.rmtree(database_dir, ignore_errors=True)
+
+# Binary-searches the smallest memory cap under which each table (with its dependencies) still loads
+def run_memory_search(paths, search_dir):
+    method = memory_limits.resolve_method(MEMORY_LIMIT_METHOD)
+    logging.info(f"Memory search: capping loads with {method} between {MEMORY_SEARCH_MIN_MB} and {MEMORY_SEARCH_MAX_MB} MB.")
+    # Forked probes start from this process's footprint (interpreter, pandas, pyarrow), which counts against the cap
+    baseline_mb = round(memory_limits.process_rss(os.getpid()) / 1024 ** 2)
+    results = []
+    for table_name in ["Person", "Company", "WorksAt"]:
+        def probe(cap_mb):
+            buffer_pool_size = int(cap_mb * MEMORY_BUFFER_POOL_FRACTION * 1024 ** 2)
+            return memory_limits.run_capped(memory_probe_load, (paths, os.path.join(search_dir, table_name), table_name, buffer_pool_size),
+                                            cap_mb * 1024 ** 2, method)
+
+        minimum_mb, status, probes = memory_limits.search_minimum(probe, MEMORY_SEARCH_MIN_MB, MEMORY_SEARCH_MAX_MB, MEMORY_SEARCH_TOLERANCE_MB)
+        if minimum_mb is None:
+            logging.error(f"Memory search: {table_name} does not load even with {MEMORY_SEARCH_MAX_MB} MB: {probes[-1]['Error']}")
+        else:
+            logging.info(f"Memory search: {table_name} loads with {minimum_mb} MB ({status}).")
+        results.append({
+            "Table Name": table_name,
+            "Method": method,
+            "Minimum Memory (MB)": minimum_mb,
+            "Status": status,
+            "Process Baseline (MB)": baseline_mb,
+            "Buffer Pool Fraction": MEMORY_BUFFER_POOL_FRACTION,
+            "Probes": probes,
+        })
+    shutil.rmtree(search_dir, ignore_errors=True)
+    return results
+
+# Loads the node tables and then WorksAt into a fresh database, returning the WorksAt COPY error (None if it loads)
+def bisect_probe_load(paths, database_dir):
+    shutil.rmtree(database_dir, ignore_errors=True)
+    os.makedirs(database_dir, exist_ok=True)
+    db, conn = open_database(database_dir)
+    try:
+        create_tables(conn, paths)
+        plan = {step["table"]: step for step in build_load_plan(paths)}
+        for dependency in plan["WorksAt"]["depends_on"]:
+            conn.execute(plan[dependency]["statement"])
+        try:
+            conn.execute(plan["WorksAt"]["statement"])
+        except Exception as e:
+            return str(e)
+        return None
+    finally:
+        close_database(db, conn)
+        del conn, db
+        shutil.rmtree(database_dir, ignore_errors=True)
+
+# Searches the smallest prefix of the WorksAt rows (then, optionally, of its property columns) that still reproduces
+# the COPY error, loading subsets of the existing Parquet files instead of regenerating the dataset
+def run_failure_bisection(paths, bisect_dir):
+    rel_parts = list_parquet_parts(paths["WorksAt"])
+    total_rows = dataset_row_count(rel_parts)
+    all_columns = read_parquet_footer(rel_parts[0])['schema'].names
+    endpoint_columns = [column for column in all_columns if column in ('person_id', 'company_id')]
+    property_columns = [column for column in all_columns if column not in endpoint_columns]
+    subset_path = os.path.join(bisect_dir, 'subset', 'relationships_0.parquet')
+
+    def reproduces(num_rows, num_columns):
+        shutil.rmtree(os.path.dirname(subset_path), ignore_errors=True)
+        os.makedirs(os.path.dirname(subset_path))
+        failure_bisection.write_subset(rel_parts, subset_path, num_rows, endpoint_columns + property_columns[:num_columns])
+        try:
+            # A separate process, since the failure being searched for may be a crash
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                error = executor.submit(bisect_probe_load, {**paths, "WorksAt": subset_path}, os.path.join(bisect_dir, 'database')).result()
+        except BrokenProcessPool:
+            error = "The loading process crashed"
+        except Exception as e:
+            # The node tables failed, which no WorksAt subset can reproduce or avoid
+            error = f"Node table load failed: {e}"
+            return False, error
+        return failure_bisection.error_matches(error, BISECT_ERROR_PATTERN), error
+
+    logging.info(f"Bisection: searching {BISECT_MIN_RELATIONSHIPS:,} to {total_rows:,} WorksAt rows for "
+                 f"{BISECT_ERROR_PATTERN or 'any error'} to within {BISECT_TOLERANCE:,} rows.")
+    min_rows, row_status, row_probes = failure_bisection.search_smallest(
+        lambda num_rows: reproduces(num_rows, len(property_columns)), min(BISECT_MIN_RELATIONSHIPS, total_rows), total_rows, BISECT_TOLERANCE)
+    result = {
+        "Error Pattern": BISECT_ERROR_PATTERN,
+        "Total Relationships": total_rows,
+        "Property Columns": len(property_columns),
+        "Minimum Relationships": min_rows,
+        "Relationship Status": row_status,
+        "Relationship Probes": row_probes,
+        "Minimum Property Columns": None,
+        "Column Status": None,
+        "Column Probes": [],
+        "Error": next((probe["Error"] for probe in reversed(row_probes) if probe["Status"] == "fail"), row_probes[0]["Error"]),
+        "Reproducer": None,
+    }
+    if min_rows is None:
+        logging.info(f"Bisection: the full dataset does not reproduce the error ({row_probes[0]['Error'] or 'it loads'}).")
+        shutil.rmtree(bisect_dir, ignore_errors=True)
+        return result
+    logging.info(f"Bisection: {min_rows:,} of {total_rows:,} WorksAt rows reproduce the error ({row_status}).")
+
+    num_columns = len(property_columns)
+    if BISECT_COLUMNS:
+        num_columns, column_status, column_probes = failure_bisection.search_smallest(
+            lambda num_columns: reproduces(min_rows, num_columns), 0, len(property_columns), 1)
+        result.update({"Minimum Property Columns": num_columns, "Column Status": column_status, "Column Probes": column_probes})
+        logging.info(f"Bisection: {num_columns} of {len(property_columns)} property columns reproduce the error ({column_status}).")
+        num_columns = num_columns if num_columns is not None else len(property_columns)
+
+    # Smallest failing subset kept for bug reports; the node files are the unchanged originals
+    result["Reproducer"] = failure_bisection.write_reproducer(
+        os.path.join(bisect_dir, 'reproducer'), rel_parts, min_rows, endpoint_columns + property_columns[:num_columns],
+        {"kuzu": kuzu_version, "Relationships": min_rows, "Property Columns": num_columns, "Error": result["Error"],
+         "Company File": paths["Company"], "Person File": paths["Person"]})
+    logging.info(f"Bisection: reproducer written to {result['Reproducer']}.")
+    shutil.rmtree(os.path.join(bisect_dir, 'subset'), ignore_errors=True)
+    shutil.rmtree(os.path.join(bisect_dir, 'database'), ignore_errors=True)
+    return result
+
+# Runs the pre-COPY integrity checks over all part files of the dataset
+def check_dataset_integrity(paths):
+    node_tables = {
+        "Company": (list_parquet_parts(paths["Company"]), "company_id"),
+        "Person": (list_parquet_parts(paths["Person"]), "person_id"),
+    }
+    rel_tables = {"WorksAt": (list_parquet_parts(paths["WorksAt"]), {"person_id": "Person", "company_id": "Company"})}
+    return run_integrity_checks(node_tables, rel_tables, INTEGRITY_CHECK_BATCH_SIZE)
+
+# Directed count query per table, validated against the row counts in the Parquet footers
+def validation_queries(topology):
+    queries = {node["label"]: f'MATCH (n:{node["label"]}) RETURN COUNT(n) AS {node["label"]}NodeCount;' for node in topology["nodes"]}
+    queries.update({rel["type"]: f'MATCH (:{rel["from"]})-[r:{rel["type"]}]->(:{rel["to"]}) RETURN COUNT(r) AS RelationshipCount;'
+                    for rel in topology["rels"]})
+    return queries
+
+# Row count of a table in the database, None if the table does not exist
+def count_table_rows(conn, table_name, topology=GRAPH_TOPOLOGY):
+    try:
+        return conn.execute(validation_queries(topology)[table_name]).get_next()[0]
+    except Exception:
+        return None
+
+# Compares each table's count in the database with the rows in its Parquet parts, timing every count query
+def validate_load(conn, paths, topology=GRAPH_TOPOLOGY):
+    database_summary = []
+    for entity, query in validation_queries(topology).items():
+        expected_count = dataset_row_count(list_parquet_parts(paths[entity]))
+        start_time = time.time()
+        error = None
+        try:
+            table_count = conn.execute(query).get_next()[0]
+            status = "match" if table_count == expected_count else "mismatch"
+        except Exception as e:
+            table_count, status, error = 0, "error", e
+        query_seconds = time.time() - start_time
+
+        if status == "error":
+            # The count is unknown, not zero, so this is not reported as a row count mismatch
+            logging.error(f"Validation query for {entity} failed, its row count is unknown. Error details: {error}")
+        elif status == "mismatch":
+            logging.error(f"Validation failed for {entity}: the database has {table_count:,} rows, "
+                          f"the Parquet footers have {expected_count:,}.")
+        else:
+            logging.info(f"Validated {entity}: {table_count:,} of {expected_count:,} rows in {query_seconds:.2f} seconds.")
+        database_summary.append({
+            "Entity": entity,
+            "Table Count": format(table_count, ','),
+            "Expected Count": format(expected_count, ','),
+            "Status": status,
+            "Query Time (Seconds)": query_seconds,
+        })
+    return database_summary
+
+# Returns the COPY duration, or None if it failed (re-raising the error instead when raise_errors is set)
+def import_table_data(conn, copy_statement, table_name, directory=None, raise_errors=False):
     start_time = time.time()
     try:
-        conn.execute(copy_statement)
+        with sample_stage(table_name, RESOURCE_USAGE, directory, RESOURCE_SAMPLING, RESOURCE_SAMPLE_INTERVAL):
+            conn.execute(copy_statement)
         end_time = time.time()
         duration_seconds = end_time - start_time
         logging.info(f'Imported data into "{table_name}" Node Table in {duration_seconds:.2f} seconds.')
         return duration_seconds
     except Exception as e:  # Use a more specific exception if possible
         logging.error(f"Failed to import data into {table_name} Node Table. Error details: {e}")
+        if raise_errors:
+            raise
         return None
 
 
-def main():
+def main(data_dir=None):
     log_stream = setup_logging()
     logging.info("This is a test log message.")
    
 
 
     TEST_DATA_PATH = os.getenv('TEST_DATA_PATH')
+    # Parquet files come from the (possibly cached) dataset directory, the database stays in TEST_DATA_PATH
+    data_dir = data_dir or DATASET_DIR
 
     DATABASE_DIR = os.path.join(TEST_DATA_PATH, DATABASE_NAME)
 
     DROP_TABLES = True
 
-    COMPANY_PARQUET_PATH = os.path.join(TEST_DATA_PATH, 'companies_0.parquet')
-    PERSON_PARQUET_PATH = os.path.join(TEST_DATA_PATH, 'persons_0.parquet')
-    RELATIONSHIP_PARQUET_PATH = os.path.join(TEST_DATA_PATH, 'relationships_0.parquet')
+    paths = dataset_paths(data_dir)
+
+    # A bad key fails the COPY only after minutes of loading, so check the Parquet files first
+    extra_sections = {}
+    if INTEGRITY_CHECKS:
+        start_time = time.time()
+        integrity_checks = check_dataset_integrity(paths)
+        failed_checks = [check for check in integrity_checks if check["Status"] == "fail"]
+        logging.info(f"Integrity checks completed in {time.time() - start_time:.2f} seconds, {len(failed_checks)} failed.")
+        extra_sections["integrity_checks"] = integrity_checks
+        if failed_checks and INTEGRITY_CHECKS_ABORT:
+            logging.error("Skipping the load because the dataset failed its integrity checks.")
+            save_data_for_dashboard([], [], log_stream, extra_sections)
+            return
+
+    if LOAD_MODE == 'sweep':
+        logging.info("Starting KuzuDB buffer pool and thread count sweep...")
+        results = run_load_sweep(paths, os.path.join(TEST_DATA_PATH, f'{DATABASE_NAME}_sweep'))
+        update_dashboard_data({"load_sweep": results})
+        logging.info("Sweep results saved to dashboard data.")
+        return
+
+    if LOAD_MODE == 'backends':
+        logging.info("Starting KuzuDB ingestion backend benchmark...")
+        results = run_ingestion_benchmark(paths, os.path.join(TEST_DATA_PATH, f'{DATABASE_NAME}_backends'))
+        update_dashboard_data({"ingestion_backends": results})
+        logging.info("Ingestion backend results saved to dashboard data.")
+        return
+
+    if LOAD_MODE == 'memory':
+        logging.info("Starting KuzuDB minimum memory search...")
+        results = run_memory_search(paths, os.path.join(TEST_DATA_PATH, f'{DATABASE_NAME}_memory'))
+        update_dashboard_data({"memory_limits": results})
+        logging.info("Memory search results saved to dashboard data.")
+        return
+
+    if LOAD_MODE == 'bisect':
+        logging.info("Starting KuzuDB failure-threshold bisection...")
+        results = run_failure_bisection(paths, os.path.join(TEST_DATA_PATH, f'{DATABASE_NAME}_bisect'))
+        update_dashboard_data({"failure_bisection": results})
+        logging.info("Bisection results saved to dashboard data.")
+        return
+
+    if LOAD_MODE == 'layout':
+        logging.info("Starting KuzuDB Parquet layout matrix...")
+        results = run_layout_matrix(paths, os.path.join(TEST_DATA_PATH, f'{DATABASE_NAME}_layouts'))
+        update_dashboard_data({"parquet_layouts": results})
+        logging.info("Parquet layout results saved to dashboard data.")
+        return
 
     ensure_directories_exist([DATABASE_DIR])
     logging.info("Starting KuzuDB processing...")
@@ -141,68 +724,62 @@ def main():
         logging.error(f"Failed to initialize KuzuDB connection: {e}")
         sys.exit(1)
 
-    if DROP_TABLES:
-        for table_name in ["WorksAt", "Company", "Person"]:
-            try:
-                conn.execute(f"DROP TABLE {table_name}")
-                logging.info(f"Table {table_name} dropped.")
-            except Exception as e:
-                if 'does not exist' in str(e).lower():
-                    logging.debug(f"Table {table_name} does not exist. No need to drop.")
-                else:
-                    logging.error(f"Error dropping table {table_name}: {e}")
-
-    create_statement_company = create_node_table_statement_from_parquet(COMPANY_PARQUET_PATH, "Company", "company_id")
-    create_statement_person = create_node_table_statement_from_parquet(PERSON_PARQUET_PATH, "Person", "person_id")
-    create_statement_relationship = create_rel_table_statement_from_parquet(RELATIONSHIP_PARQUET_PATH, "WorksAt")
-
-    for statement in [create_statement_company, create_statement_person, create_statement_relationship]:
-        try:
-            conn.execute(statement)
-            logging.info(f'Successfully created kuzu table: {statement.split()[3]}')
-        except Exception as e:
-            logging.error(f'Failed to execute statement. Error details: {e}')
+    # In chunked mode a previous run may have committed part of the load; resume it instead of dropping the tables
+    load_state_path = os.path.join(TEST_DATA_PATH, f'{DATABASE_NAME}_load_state.json')
+    chunk_paths = list_parquet_parts(paths["WorksAt"])
+    node_rows = {node["label"]: dataset_row_count(list_parquet_parts(paths[node["label"]])) for node in GRAPH_TOPOLOGY["nodes"]}
+    load_state = chunked_loader.load_state(load_state_path, DATABASE_DIR, chunk_paths, functools.partial(count_table_rows, conn),
+                                           node_rows, "WorksAt") if CHUNKED_REL_LOAD else None
+    resuming = load_state is not None and chunked_loader.is_resuming(load_state)
+    if resuming:
+        logging.info(f"Resuming load from {load_state_path}: tables {load_state['completed_tables']}, "
+                     f"{len(load_state['completed_chunks'])} of {len(chunk_paths)} WorksAt chunks already loaded.")
 
+    if DROP_TABLES and not resuming:
+        drop_tables(conn)
 
-    table_names = ["Person", "Company", "WorksAt"]
-    parquet_paths = {
-        "Person": PERSON_PARQUET_PATH,
-        "Company": COMPANY_PARQUET_PATH,
-        "WorksAt": RELATIONSHIP_PARQUET_PATH
-    }
+    if not resuming:
+        create_tables(conn, paths)
+
+    # In chunked mode WorksAt is loaded chunk by chunk below, and tables finished by an earlier run are skipped
+    skipped_tables = ["WorksAt"] + load_state['completed_tables'] if CHUNKED_REL_LOAD else []
+    load_plan = build_load_plan(paths, skipped_tables)
 
-    load_times = []
     database_summary = []
-    for table_name in table_names:
-        duration = import_table_data(conn, f'COPY {table_name} FROM "{parquet_paths[table_name]}" (HEADER = true)', table_name)
-        if duration is not None:
-            # Each entry in load_times is now a dictionary with clear keys
-            load_times.append({"Table Name": table_name, "Load Time (Seconds)": duration})
+    load_start_time = time.time()
+    # Each entry in load_times is a dictionary with clear keys, plus one entry for the whole load phase
+    # Every COPY stage is sampled, including the database directory growing on disk
+    import_with_sampling = functools.partial(import_table_data, directory=DATABASE_DIR)
+    sample_parallel_stage = functools.partial(sample_stage, results=RESOURCE_USAGE, directory=DATABASE_DIR,
+                                              enabled=RESOURCE_SAMPLING, interval=RESOURCE_SAMPLE_INTERVAL)
+    load_times, _, load_mode = run_load_plan(db, conn, load_plan, import_with_sampling, parallel=PARALLEL_COPY,
+                                             sample_stage=sample_parallel_stage)
+
+    if CHUNKED_REL_LOAD:
+        for entry in load_times:
+            chunked_loader.mark_table_completed(load_state_path, load_state, entry["Table Name"])
+        rel_load_chunks = chunked_loader.load_rel_chunks(conn, "WorksAt", chunk_paths, load_state_path, load_state, import_with_sampling)
+        extra_sections["rel_load_chunks"] = rel_load_chunks
+        if "WorksAt" in load_state['completed_tables']:
+            load_times.append({"Table Name": "WorksAt", "Load Time (Seconds)": sum(chunk["Load Time (Seconds)"] for chunk in rel_load_chunks)})
+            # The load is complete, the next run starts from scratch
+            os.remove(load_state_path)
+
+    load_times.append({"Table Name": "Load Phase (Wall Clock)", "Load Time (Seconds)": time.time() - load_start_time, "Mode": load_mode})
 
     try:
-
-        company_node_count = conn.execute(
-            'MATCH (n:Company) RETURN COUNT(n) AS CompanyNodeCount;').get_next()[0]
-        person_node_count = conn.execute(
-            'MATCH (n:Person) RETURN COUNT(n) AS PersonNodeCount;').get_next()[0]
-        WorksAt_rel_count = conn.execute(
-            'MATCH ()-[r:WorksAt]-() RETURN COUNT(r) AS RelationshipCount;').get_next()[0]
-    # Assuming this structure is needed for the dashboard
-
-        database_summary = [
-            {"Entity": "Company", "Table Count": format(company_node_count, ',')},
-            {"Entity": "Person", "Table Count": format(person_node_count, ',')},
-            {"Entity": "WorksAt", "Table Count": format(WorksAt_rel_count, ',')}
-        ]
-        
-        
+        # Directed counts checked against the Parquet footers, so a partially failed COPY shows up as a mismatch
+        database_summary = validate_load(conn, paths)
     except Exception as e:
         logging.error(f"Error compiling database summary: {e}")
-        
-        # Assuming this structure is needed for the dashboard
+
+    extra_sections["resource_usage"] = RESOURCE_USAGE
+    generation_stats = read_generation_stats(data_dir)
+    if generation_stats:
+        extra_sections["generation_resource_usage"] = generation_stats.get("resource_usage", {})
 
     # Save formatted data for the dashboard
-    save_data_for_dashboard(load_times, database_summary, log_stream)
+    save_data_for_dashboard(load_times, database_summary, log_stream, extra_sections)
 
     # dashboard_creator = DashboardCreator()
     # dashboard_creator.generate_dashboard()
@@ -0,0 +1,170 @@
+import os
+import time
+import shutil
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import numpy as np
+from dotenv import load_dotenv
+import dataset_cache
+import graph_topology
+from load_scheduler import dependency_waves
+from resource_sampler import directory_size, sample_stage
+from test_create_test_data import (DATASET_CACHE, GENERATION_BATCH_SIZE, GENERATION_MODE, GENERATION_SEED, ID_FORMAT,
+                                   PARQUET_ROW_GROUP_SIZE, RESOURCE_SAMPLE_INTERVAL, TEST_DATA_PATH, VOCABULARY_SIZE)
+from test_ingress_load_kuzudb import (DATABASE_NAME, build_load_plan, close_database, create_tables, open_database,
+                                      update_dashboard_data, validate_load)
+
+
+
+load_dotenv()
+
+TOPOLOGY_BENCHMARK = os.getenv('TOPOLOGY_BENCHMARK', 'false').lower() == 'true'
+# Synthetic topologies as <node labels>:<rel types>, each loaded into its own database
+TOPOLOGY_SIZES = [tuple(int(part) for part in size.split(':')) for size in os.getenv('TOPOLOGY_SIZES', '1:1,4:8,16:32').split(',') if size.strip()]
+TOPOLOGY_NODES_PER_LABEL = int(os.getenv('TOPOLOGY_NODES_PER_LABEL', 100000))
+TOPOLOGY_RELS_PER_TYPE = int(os.getenv('TOPOLOGY_RELS_PER_TYPE', 500000))
+TOPOLOGY_PROPERTIES = int(os.getenv('TOPOLOGY_PROPERTIES', 5))
+# Optional declarative topology (see graph_topology.normalize_topology), benchmarked after the synthetic sizes
+TOPOLOGY_SPEC = os.getenv('TOPOLOGY_SPEC', '')
+TOPOLOGY_MAX_HOPS = int(os.getenv('TOPOLOGY_MAX_HOPS', 3))
+TOPOLOGY_QUERY_ITERATIONS = int(os.getenv('TOPOLOGY_QUERY_ITERATIONS', 5))
+
+
+def benchmark_topologies():
+    """(name, topology) of every synthetic size, plus the TOPOLOGY_SPEC topology when one is set."""
+    topologies = [(f"{labels} labels, {rel_types} rel types",
+                   graph_topology.synthetic_topology(labels, rel_types, TOPOLOGY_NODES_PER_LABEL, TOPOLOGY_RELS_PER_TYPE, TOPOLOGY_PROPERTIES))
+                  for labels, rel_types in TOPOLOGY_SIZES]
+    if TOPOLOGY_SPEC:
+        topologies.append((os.path.basename(TOPOLOGY_SPEC), graph_topology.load_topology(TOPOLOGY_SPEC)))
+    return topologies
+
+
+def generate_topology(topology):
+    """Generate (or reuse from the dataset cache) a topology dataset. Returns (paths, cached, seconds)."""
+    config = {'topology': topology, 'generation_mode': GENERATION_MODE, 'generation_seed': GENERATION_SEED,
+              'vocabulary_size': VOCABULARY_SIZE, 'id_format': ID_FORMAT, 'generation_batch_size': GENERATION_BATCH_SIZE,
+              'parquet_row_group_size': PARQUET_ROW_GROUP_SIZE}
+    data_dir = dataset_cache.dataset_dir(TEST_DATA_PATH, config) if DATASET_CACHE else os.path.join(TEST_DATA_PATH, 'topology')
+    if DATASET_CACHE and dataset_cache.is_valid_dataset(data_dir, config):
+        dataset_cache.touch_dataset(data_dir)
+        return graph_topology.topology_paths(topology, data_dir), True, 0.0
+
+    shutil.rmtree(data_dir, ignore_errors=True)
+    start_time = time.time()
+    paths = graph_topology.generate_topology_dataset(topology, data_dir)
+    seconds = time.time() - start_time
+    if DATASET_CACHE:
+        dataset_cache.write_manifest(data_dir, config)
+    return paths, False, seconds
+
+
+def time_query(conn, query, iterations):
+    """Run a query once untimed, then `iterations` times; returns (result of the first column, median milliseconds)."""
+    result = conn.execute(query).get_next()[0]
+    durations = []
+    for _ in range(iterations):
+        start_time = time.perf_counter()
+        conn.execute(query).get_next()
+        durations.append((time.perf_counter() - start_time) * 1000)
+    return result, float(np.median(durations))
+
+
+def topology_load(topology, paths, database_dir):
+    """Create and load a topology into a fresh database and time its multi-hop path queries; run in a child process.
+
+    Returns (DDL seconds, load_times, number of COPY waves, resource summary, database bytes, validation, queries).
+    """
+    shutil.rmtree(database_dir, ignore_errors=True)
+    os.makedirs(database_dir, exist_ok=True)
+    db, conn = open_database(database_dir)
+    usage = {}
+    load_times = []
+    try:
+        start_time = time.time()
+        create_tables(conn, paths, topology)
+        ddl_seconds = time.time() - start_time
+
+        load_plan = build_load_plan(paths, topology=topology)
+        with sample_stage("Load", usage, database_dir, True, RESOURCE_SAMPLE_INTERVAL):
+            for step in load_plan:
+                start_time = time.time()
+                conn.execute(step["statement"])
+                load_times.append({"Table Name": step["table"], "Load Time (Seconds)": time.time() - start_time})
+        database_bytes = directory_size(database_dir)
+        validation = validate_load(conn, paths, topology)
+
+        queries = []
+        for hops in range(1, TOPOLOGY_MAX_HOPS + 1):
+            path = graph_topology.traversal_path(topology, hops)
+            if len(path) < hops:
+                break
+            paths_found, median_ms = time_query(conn, graph_topology.path_query(path), TOPOLOGY_QUERY_ITERATIONS)
+            queries.append({"Hops": hops, "Path": " -> ".join([path[0]["from"]] + [f'{rel["type"]} -> {rel["to"]}' for rel in path]),
+                            "Paths": paths_found, "Median (ms)": median_ms})
+    finally:
+        close_database(db, conn)
+        del conn, db
+        shutil.rmtree(database_dir, ignore_errors=True)
+    return ddl_seconds, load_times, len(dependency_waves(load_plan)), usage["Load"]["summary"], database_bytes, validation, queries
+
+
+def run_topology(name, topology, topology_dir):
+    tables = len(topology["nodes"]) + len(topology["rels"])
+    result = {"Topology": name, "Labels": len(topology["nodes"]), "Rel Types": len(topology["rels"]), "Tables": tables,
+              "Self Relations": sum(rel["from"] == rel["to"] for rel in topology["rels"]), "Status": "pass", "Error": None}
+    try:
+        paths, cached, generation_seconds = generate_topology(topology)
+    except Exception as e:
+        logging.error(f"Topology benchmark: generating {name} failed: {e}")
+        return {**result, "Status": "generation failed", "Error": str(e)}
+    result.update({"Cached": cached, "Generation Time (Seconds)": generation_seconds,
+                   "Rows": sum(table["count"] for table in topology["nodes"] + topology["rels"])})
+
+    logging.info(f"Topology benchmark: loading {name} ({tables} tables, {result['Rows']:,} rows).")
+    try:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            ddl_seconds, load_times, waves, summary, database_bytes, validation, queries = executor.submit(
+                topology_load, topology, paths, os.path.join(topology_dir, str(tables))).result()
+    except BrokenProcessPool:
+        return {**result, "Status": "crashed", "Error": "The loading process crashed"}
+    except Exception as e:
+        logging.error(f"Topology benchmark: loading {name} failed: {e}")
+        return {**result, "Status": "fail", "Error": str(e)}
+
+    load_seconds = sum(item["Load Time (Seconds)"] for item in load_times)
+    result.update({
+        "Status": "pass" if all(item["Status"] == "match" for item in validation) else "mismatch",
+        "DDL Time (Seconds)": ddl_seconds,
+        "Load Time (Seconds)": load_seconds,
+        "Rows/sec": result["Rows"] / load_seconds if load_seconds > 0 else None,
+        "COPY Waves": waves,
+        "Table Load Times": load_times,
+        "Peak RSS (MB)": summary["Peak RSS (Bytes)"] / 1024 ** 2,
+        "Database Size (MB)": database_bytes / 1024 ** 2,
+        "Queries": queries,
+    })
+    logging.info(f"Topology benchmark: {name} created in {ddl_seconds:.2f} seconds and loaded in {load_seconds:.2f} seconds, "
+                 f"peak RSS {result['Peak RSS (MB)']:,.0f} MB.")
+    return result
+
+
+def run_topology_benchmark(topology_dir):
+    results = [run_topology(name, topology, topology_dir) for name, topology in benchmark_topologies()]
+    shutil.rmtree(topology_dir, ignore_errors=True)
+    return results
+
+
+def main():
+    if not TOPOLOGY_BENCHMARK:
+        logging.info("Topology benchmark disabled, skipping.")
+        return
+
+    logging.info(f"Running topology benchmark over {len(TOPOLOGY_SIZES)} synthetic topologies{' and ' + TOPOLOGY_SPEC if TOPOLOGY_SPEC else ''}.")
+    results = run_topology_benchmark(os.path.join(TEST_DATA_PATH, f'{DATABASE_NAME}_topology'))
+    update_dashboard_data({"topology_benchmark": results})
+    logging.info("Topology benchmark results saved to dashboard data.")
+
+if __name__ == "__main__":
+    main()
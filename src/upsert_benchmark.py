@@ -0,0 +1,207 @@
+import os
+import time
+import logging
+import numpy as np
+import kuzu
+from dotenv import load_dotenv
+from parquet_schema import quote_identifier, read_parquet_footer
+from ingestion_backends import NODE_KEYS, REL_ENDPOINTS, create_statement, execute_parameterized, positional_parameters
+from query_benchmark import sample_parameter_values, latency_percentiles
+from test_create_test_data import DATASET_DIR
+from test_ingress_load_kuzudb import DATABASE_NAME, LOAD_MODE, dataset_paths, update_dashboard_data
+
+
+
+load_dotenv()
+
+UPSERT_BENCHMARK = os.getenv('UPSERT_BENCHMARK', 'false').lower() == 'true'
+UPSERT_BATCH_SIZES = [int(size) for size in os.getenv('UPSERT_BATCH_SIZES', '1,10,100,1000').split(',')]
+UPSERT_OPERATIONS = int(os.getenv('UPSERT_OPERATIONS', 10000))
+UPSERT_OPERATION_MIX = {name.strip(): float(weight) for name, weight in
+                        (item.split(':') for item in os.getenv('UPSERT_OPERATION_MIX', 'create_person:20,create_company:5,create_works_at:35,set_property:30,delete_works_at:5,delete_person:5').split(','))}
+UPSERT_KEY_SAMPLE_SIZE = int(os.getenv('UPSERT_KEY_SAMPLE_SIZE', 1000))
+UPSERT_SEED = int(os.getenv('GENERATION_SEED', 42))
+
+# Keys of nodes created by the change stream, far outside the generated key space
+INT64_KEY_BASE = 4 * 10 ** 18
+
+
+class ChangeStream:
+    """Generates a reproducible mix of writes against the loaded graph.
+
+    New nodes get keys that cannot collide with the dataset, new WorksAt edges connect existing nodes
+    (so new nodes stay edge-free and can be deleted), property SETs hit existing Persons, and deletes
+    remove nodes and edges created earlier in the same stream.
+    """
+
+    def __init__(self, paths, run_id, seed=UPSERT_SEED):
+        self.rng = np.random.default_rng([seed, run_id])
+        self.run_id = run_id
+        self.counter = 0
+        self.columns = {table_name: read_parquet_footer(paths[table_name])['columns'] for table_name in paths}
+        # Existing keys and property values to draw parameters from
+        self.values = {(table_name, column): sample_parameter_values(paths[table_name], column, UPSERT_KEY_SAMPLE_SIZE, seed)
+                       for table_name in paths for column in self.columns[table_name]}
+        self.created_persons = []
+        self.created_edges = []
+        person_properties = [column for column in self.columns["Person"] if column != NODE_KEYS["Person"]]
+        self.set_column = person_properties[0] if person_properties else None
+
+    def new_key(self, table_name):
+        self.counter += 1
+        if self.columns[table_name][NODE_KEYS[table_name]]['kuzu_type'] == 'INT64':
+            return INT64_KEY_BASE + self.run_id * 10 ** 9 + self.counter
+        return f"upsert-{self.run_id}-{self.counter}"
+
+    def draw(self, table_name, column):
+        values = self.values[(table_name, column)]
+        return values[self.rng.integers(len(values))]
+
+    def properties(self, table_name, skipped):
+        return {column: self.draw(table_name, column) for column in self.columns[table_name] if column not in skipped}
+
+    def create_parameters(self, table_name, row):
+        """The positional $p<index> parameters create_statement binds for a {column: value} row."""
+        return positional_parameters(list(self.columns[table_name]), row)
+
+    def create_node(self, table_name):
+        """Return (key, create parameters) of a new node."""
+        key = NODE_KEYS[table_name]
+        row = {key: self.new_key(table_name), **self.properties(table_name, [key])}
+        return row[key], self.create_parameters(table_name, row)
+
+    def operation(self, name):
+        """Return (statement name, parameters) for one operation, falling back to a create if nothing is left to delete."""
+        if name == 'create_person':
+            key, parameters = self.create_node("Person")
+            self.created_persons.append(key)
+            return 'create_person', parameters
+        if name == 'create_company':
+            return 'create_company', self.create_node("Company")[1]
+        if name == 'create_works_at':
+            (from_column, from_table), (to_column, to_table) = REL_ENDPOINTS["WorksAt"]
+            row = {from_column: self.draw(from_table, NODE_KEYS[from_table]), to_column: self.draw(to_table, NODE_KEYS[to_table]),
+                   **self.properties("WorksAt", [from_column, to_column])}
+            self.created_edges.append((row[from_column], row[to_column]))
+            return 'create_works_at', self.create_parameters("WorksAt", row)
+        if name == 'set_property' and self.set_column:
+            return 'set_property', {"node_key": self.draw("Person", NODE_KEYS["Person"]), "property_value": self.draw("Person", self.set_column)}
+        if name == 'delete_works_at' and self.created_edges:
+            from_key, to_key = self.created_edges.pop(self.rng.integers(len(self.created_edges)))
+            return 'delete_works_at', {"from_key": from_key, "to_key": to_key}
+        if name == 'delete_person' and self.created_persons:
+            return 'delete_person', {"node_key": self.created_persons.pop(self.rng.integers(len(self.created_persons)))}
+        return self.operation('create_works_at' if name in ('delete_works_at', 'set_property') else 'create_person')
+
+    def generate(self, num_operations, mix=UPSERT_OPERATION_MIX):
+        names = list(mix)
+        weights = np.array([mix[name] for name in names], dtype=float)
+        for name in self.rng.choice(names, size=num_operations, p=weights / weights.sum()):
+            yield self.operation(str(name))
+
+
+def write_statements(paths):
+    """Parameterized statement of every change stream operation."""
+    columns = {table_name: read_parquet_footer(paths[table_name])['schema'].names for table_name in paths}
+    (from_column, from_table), (to_column, to_table) = REL_ENDPOINTS["WorksAt"]
+    person_key = quote_identifier(NODE_KEYS["Person"])
+    person_properties = [column for column in columns["Person"] if column != NODE_KEYS["Person"]]
+    statements = {
+        'create_person': create_statement("Person", columns["Person"]),
+        'create_company': create_statement("Company", columns["Company"]),
+        'create_works_at': create_statement("WorksAt", columns["WorksAt"]),
+        'delete_works_at': f"MATCH (a:{quote_identifier(from_table)})-[r:`WorksAt`]->(b:{quote_identifier(to_table)}) "
+                           f"WHERE a.{quote_identifier(NODE_KEYS[from_table])} = $from_key "
+                           f"AND b.{quote_identifier(NODE_KEYS[to_table])} = $to_key DELETE r",
+        'delete_person': f"MATCH (n:`Person`) WHERE n.{person_key} = $node_key DELETE n",
+    }
+    if person_properties:
+        statements['set_property'] = (f"MATCH (n:`Person`) WHERE n.{person_key} = $node_key "
+                                      f"SET n.{quote_identifier(person_properties[0])} = $property_value")
+    return statements
+
+
+def apply_batch(conn, statements, batch):
+    """Apply one batch of operations in a transaction, returning (batch_seconds, commit_seconds)."""
+    start_time = time.perf_counter()
+    conn.execute("BEGIN TRANSACTION")
+    try:
+        # Prepared inside the transaction: older versions open an implicit one when preparing outside it
+        prepared_statements = {}
+        for name, parameters in batch:
+            if name not in prepared_statements:
+                prepared_statements[name] = conn.prepare(statements[name])
+            execute_parameterized(conn, prepared_statements[name], parameters)
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    commit_start_time = time.perf_counter()
+    conn.execute("COMMIT")
+    end_time = time.perf_counter()
+    return end_time - start_time, end_time - commit_start_time
+
+
+def run_batch_size(conn, paths, statements, batch_size, run_id, num_operations=UPSERT_OPERATIONS):
+    """Apply a fresh change stream in transactions of `batch_size` operations and summarize the throughput."""
+    operations = list(ChangeStream(paths, run_id).generate(num_operations))
+    batch_latencies, commit_latencies = [], []
+    failed_batches, written, first_error = 0, 0, None
+    operation_counts = {}
+    for name, _ in operations:
+        operation_counts[name] = operation_counts.get(name, 0) + 1
+
+    start_time = time.perf_counter()
+    for offset in range(0, len(operations), batch_size):
+        batch = operations[offset:offset + batch_size]
+        try:
+            batch_seconds, commit_seconds = apply_batch(conn, statements, batch)
+        except Exception as e:
+            failed_batches += 1
+            first_error = first_error or str(e)
+            continue
+        batch_latencies.append(batch_seconds)
+        commit_latencies.append(commit_seconds)
+        written += len(batch)
+    seconds = time.perf_counter() - start_time
+
+    result = {
+        "Batch Size": batch_size,
+        "Operations": written,
+        "Failed Batches": failed_batches,
+        "Seconds": seconds,
+        "Writes/sec": written / seconds if seconds > 0 else None,
+        "Operation Counts": operation_counts,
+        "Error": first_error,
+    }
+    if commit_latencies:
+        result.update({f"Commit {name}": value for name, value in latency_percentiles(commit_latencies).items()})
+        result.update({f"Batch {name}": value for name, value in latency_percentiles(batch_latencies).items()})
+    if first_error:
+        logging.error(f"Upsert benchmark: {failed_batches} batches of {batch_size} failed, first error: {first_error}")
+    logging.info(f"Upsert batch size {batch_size}: {result['Writes/sec'] or 0:,.0f} writes/sec, "
+                 f"commit p99 {result.get('Commit p99 (ms)', 0):.2f} ms.")
+    return result
+
+
+def main(data_dir=None):
+    if not UPSERT_BENCHMARK or LOAD_MODE != 'standard':
+        logging.info("Upsert benchmark disabled, skipping.")
+        return
+
+    database_dir = os.path.join(os.getenv('TEST_DATA_PATH'), DATABASE_NAME)
+    paths = dataset_paths(data_dir or DATASET_DIR)
+    try:
+        db = kuzu.Database(database_dir)
+        conn = kuzu.Connection(db)
+    except Exception as e:
+        logging.error(f"Failed to open {database_dir} for the upsert benchmark: {e}")
+        return
+
+    logging.info(f"Running upsert benchmark: {UPSERT_OPERATIONS:,} operations per batch size {UPSERT_BATCH_SIZES}.")
+    statements = write_statements(paths)
+    results = [run_batch_size(conn, paths, statements, batch_size, run_id) for run_id, batch_size in enumerate(UPSERT_BATCH_SIZES)]
+    update_dashboard_data({"upsert_benchmark": results})
+    logging.info("Upsert benchmark results saved to dashboard data.")
+
+if __name__ == "__main__":
+    main()
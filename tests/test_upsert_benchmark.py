@@ -0,0 +1,63 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from test_ingress_load_kuzudb import build_load_plan, close_database, create_tables, dataset_paths, open_database
+from upsert_benchmark import ChangeStream, apply_batch, write_statements
+
+OPERATIONS = ['create_person', 'create_company', 'create_works_at', 'set_property', 'delete_works_at', 'delete_person']
+
+
+@pytest.fixture
+def loaded_graph(tmp_path):
+    """A small loaded graph whose property names include a Cypher keyword, as a SCHEMA_SPEC may define."""
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    paths = dataset_paths(str(data_dir))
+    tables = {
+        "Company": pa.table({'company_id': [f'c{i}' for i in range(4)], 'property_1': [f'name{i}' for i in range(4)]}),
+        "Person": pa.table({'person_id': pa.array(range(6), pa.int64()), 'current': [i % 2 == 0 for i in range(6)],
+                            'property_4': [f'city{i}' for i in range(6)]}),
+        "WorksAt": pa.table({'person_id': pa.array(range(6), pa.int64()), 'company_id': [f'c{i % 4}' for i in range(6)],
+                             'since': pa.array(range(2000, 2006), pa.int64())}),
+    }
+    for table_name, table in tables.items():
+        pq.write_table(table, paths[table_name])
+
+    db, conn = open_database(str(tmp_path / 'db'))
+    create_tables(conn, paths)
+    for step in build_load_plan(paths):
+        conn.execute(step["statement"])
+    yield conn, paths
+    close_database(db, conn)
+
+
+def count(conn, table_name):
+    pattern = f"(:{table_name})" if table_name != "WorksAt" else "()-[:WorksAt]->()"
+    return conn.execute(f"MATCH {pattern} RETURN COUNT(*)").get_next()[0]
+
+
+def test_every_operation_applies(loaded_graph):
+    conn, paths = loaded_graph
+    statements = write_statements(paths)
+    stream = ChangeStream(paths, run_id=0)
+    counts = {table_name: count(conn, table_name) for table_name in paths}
+
+    for name in OPERATIONS:
+        operation = stream.operation(name)
+        assert operation[0] == name
+        apply_batch(conn, statements, [operation])
+
+        if name == 'create_person':
+            assert count(conn, "Person") == counts["Person"] + 1
+        elif name == 'create_company':
+            assert count(conn, "Company") == counts["Company"] + 1
+        elif name == 'create_works_at':
+            assert count(conn, "WorksAt") == counts["WorksAt"] + 1
+        elif name == 'set_property':
+            parameters = operation[1]
+            result = conn.execute("MATCH (n:Person) WHERE n.person_id = $node_key RETURN n.`current`", {"node_key": parameters["node_key"]})
+            assert result.get_next()[0] == parameters["property_value"]
+        elif name == 'delete_works_at':
+            assert count(conn, "WorksAt") <= counts["WorksAt"]
+        else:
+            assert count(conn, "Person") == counts["Person"]